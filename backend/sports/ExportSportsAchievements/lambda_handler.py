@@ -0,0 +1,244 @@
+import logging
+import uuid
+from os import environ
+
+from validation_schema import schema
+from aws_lambda_powertools.utilities.validation import validate
+
+logger = logging.getLogger("ExportSportsAchievements")
+logger.setLevel(logging.DEBUG)
+
+from common.common import (
+    lambda_middleware,
+    build_response,
+    is_not_modified,
+    ValidationError,
+    _LAMBDA_S3_CLIENT_FOR_SPORTS_EXPORTS,
+    LambdaS3Class
+)
+from common.dataset import (
+    get_dataset,
+    get_dataset_fingerprint,
+    preload_dataset
+)
+from common.inverted_index import get_inverted_index
+from common.medal_order import get_medal_order_permutation
+from common.query_engine import (
+    get_query_engine,
+    preload_query_engine
+)
+from common.result_cache import query_etag
+
+preload_query_engine(get_inverted_index)
+preload_dataset(get_medal_order_permutation, get_dataset_fingerprint)
+
+EXPORT_COLUMNS = ['Name', 'Sex', 'Sport', 'Event', 'Medal', 'Team', 'Year']
+
+EXPORT_CONTENT_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
+# Rows converted at once, the peak memory of an export depends on this and not on the result size
+EXPORT_CHUNK_ROWS = int(environ.get("EXPORT_CHUNK_ROWS", "5000"))
+
+# Exports up to this size are returned in the response, bigger ones are uploaded to S3
+EXPORT_INLINE_MAX_BYTES = int(environ.get("EXPORT_INLINE_MAX_BYTES", str(1024 * 1024)))
+
+# S3 multipart parts have to be at least 5 MB, except the last one
+EXPORT_PART_BYTES = int(environ.get("EXPORT_PART_BYTES", str(8 * 1024 * 1024)))
+
+EXPORT_URL_EXPIRATION_SECONDS = int(environ.get("EXPORT_URL_EXPIRATION_SECONDS", "3600"))
+
+@lambda_middleware
+def lambda_handler(event, context):
+    query_params = event.get("queryStringParameters", {}) or {}
+
+    try:
+        logger.debug(f"Validating query params: {query_params}")
+
+        validate(event=query_params, schema=schema)
+    except Exception as e:
+        logger.error(f"Validation error: {str(e)}")
+
+        raise ValidationError(str(e))
+
+    export_format = query_params.get("format", "ndjson")
+
+    filters = {
+        'medal': query_params.get("medal", None),
+        'sportsman_name': query_params.get("sportsman_name", None),
+        'sex': query_params.get("sex", None),
+        'sport': query_params.get("sport", None),
+        'event': query_params.get("event", None),
+        'country': query_params.get("country", None)
+    }
+
+    # Only inline exports carry the ETag, so a client can only hold one for an export
+    # small enough to be returned inline again and gets a 304 before any filtering
+    etag = query_etag("ExportSportsAchievements", {**filters, 'format': export_format})
+
+    if is_not_modified(event, etag):
+        return build_response(304, None, etag=etag)
+
+    rows = apply_filters_to_dataset(
+        filters['medal'],
+        filters['sportsman_name'],
+        filters['sex'],
+        filters['sport'],
+        filters['event'],
+        filters['country']
+    )
+
+    # Same order as GetAllSportsAchievements, for all rows this is the presorted permutation itself
+    sorted_rows = get_medal_order_permutation().sorted_rows(rows)
+
+    export = export_rows(iter_export_chunks(sorted_rows, export_format), export_format)
+
+    return build_response(
+        200,
+        {
+            'message': "Sports achievements exported successfully",
+            'format': export_format,
+            'row_count': len(sorted_rows),
+            **export
+        },
+        # Every upload is a new S3 object behind a new presigned url, those responses are never the same
+        etag=etag if 'data' in export else None
+    )
+
+def apply_filters_to_dataset(medal, name, sex, sport, event_name, country):
+    filters = {
+        'Medal': medal,
+        'Name': name,
+        'Sex': sex,
+        'Sport': sport,
+        'Event': event_name,
+        'Team': country
+    }
+
+    logger.debug(f"Filtering by: {filters}")
+
+    return get_query_engine().filter_rows(filters)
+
+def iter_export_chunks(rows, export_format, chunk_rows=EXPORT_CHUNK_ROWS):
+    """
+    Yield the encoded export of the rows, chunk_rows rows at a time
+    """
+    dataset = get_dataset()
+
+    if export_format == 'csv':
+        yield (",".join(column.lower() for column in EXPORT_COLUMNS) + "\n").encode("utf-8")
+
+    for start in range(0, len(rows), chunk_rows):
+        chunk_df = dataset.iloc[rows[start:start + chunk_rows]][EXPORT_COLUMNS]
+        chunk_df.columns = chunk_df.columns.str.lower()
+
+        if export_format == 'csv':
+            yield chunk_df.to_csv(index=False, header=False).encode("utf-8")
+        else:
+            lines = chunk_df.to_json(orient='records', lines=True)
+
+            yield (lines if lines.endswith("\n") else lines + "\n").encode("utf-8")
+
+def export_rows(chunks, export_format):
+    """
+    Return the export inline when it fits EXPORT_INLINE_MAX_BYTES, otherwise upload it
+    to S3 while it is still being produced and return a presigned URL
+    """
+    buffer = bytearray()
+
+    for chunk in chunks:
+        buffer += chunk
+
+        if len(buffer) > EXPORT_INLINE_MAX_BYTES:
+            logger.info(f"Export is bigger than {EXPORT_INLINE_MAX_BYTES} bytes, uploading it to S3")
+
+            return upload_export(prepend_chunk(bytes(buffer), chunks), export_format)
+
+    return {
+        'data': buffer.decode("utf-8")
+    }
+
+def prepend_chunk(first_chunk, chunks):
+    yield first_chunk
+    yield from chunks
+
+def upload_export(chunks, export_format):
+    """
+    Stream the chunks into an S3 multipart upload, only one part is kept in memory
+    """
+    s3_class = LambdaS3Class(_LAMBDA_S3_CLIENT_FOR_SPORTS_EXPORTS)
+    s3_client = s3_class.client
+    bucket_name = s3_class.bucket_name
+
+    key = f"exports/{uuid.uuid4()}.{export_format}"
+
+    upload_id = s3_client.create_multipart_upload(
+        Bucket=bucket_name,
+        Key=key,
+        ContentType=EXPORT_CONTENT_TYPES[export_format]
+    )['UploadId']
+
+    try:
+        parts = []
+        part = bytearray()
+
+        for chunk in chunks:
+            part += chunk
+
+            if len(part) >= EXPORT_PART_BYTES:
+                parts.append(upload_part(s3_client, bucket_name, key, upload_id, len(parts) + 1, part))
+                part = bytearray()
+
+        if part or not parts:
+            parts.append(upload_part(s3_client, bucket_name, key, upload_id, len(parts) + 1, part))
+
+        s3_client.complete_multipart_upload(
+            Bucket=bucket_name,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={
+                'Parts': parts
+            }
+        )
+    except Exception as e:
+        logger.error(f"Export upload failed, aborting it: {e}")
+
+        s3_client.abort_multipart_upload(
+            Bucket=bucket_name,
+            Key=key,
+            UploadId=upload_id
+        )
+
+        raise
+
+    logger.info(f"Export uploaded to {bucket_name}/{key} in {len(parts)} parts")
+
+    url = s3_client.generate_presigned_url(
+        'get_object',
+        Params={
+            'Bucket': bucket_name,
+            'Key': key
+        },
+        ExpiresIn=EXPORT_URL_EXPIRATION_SECONDS
+    )
+
+    return {
+        'url': url,
+        'expires_in': EXPORT_URL_EXPIRATION_SECONDS
+    }
+
+def upload_part(s3_client, bucket_name, key, upload_id, part_number, part):
+    response = s3_client.upload_part(
+        Bucket=bucket_name,
+        Key=key,
+        UploadId=upload_id,
+        PartNumber=part_number,
+        Body=bytes(part)
+    )
+
+    return {
+        'ETag': response['ETag'],
+        'PartNumber': part_number
+    }
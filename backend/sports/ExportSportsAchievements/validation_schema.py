@@ -0,0 +1,35 @@
+schema = {
+    "type": "object",
+    "properties": {
+        "format": {
+            "type": "string",
+            "enum": ["ndjson", "csv"]
+        },
+        "medal": {
+            "type": "string",
+            "minLength": 1
+        },
+        "sportsman_name": {
+            "type": "string",
+            "minLength": 1
+        },
+        "sex": {
+            "type": "string",
+            "enum": ["M", "F"]
+        },
+        "sport": {
+            "type": "string",
+            "minLength": 1
+        },
+        "event": {
+            "type": "string",
+            "minLength": 1
+        },
+        "country": {
+            "type": "string",
+            "minLength": 1
+        }
+    },
+    "required": [],
+    "additionalProperties": False
+}
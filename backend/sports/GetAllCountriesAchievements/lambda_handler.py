@@ -1,5 +1,4 @@
 import logging
-import pandas as pd
 
 from validation_schema import schema
 from aws_lambda_powertools.utilities.validation import validate
@@ -10,8 +9,27 @@ logger.setLevel(logging.DEBUG)
 from common.common import (
     lambda_middleware,
     build_response,
+    is_not_modified,
     ValidationError
 )
+from common.medal_cube import (
+    get_medal_cube,
+    get_event_medal_cube
+)
+from common.result_cache import (
+    get_result_cache,
+    canonical_query_key,
+    query_etag
+)
+from common.medal_facts import ATHLETE_COUNTING
+from common.dataset import (
+    get_dataset_aggregates,
+    get_dataset_fingerprint
+)
+from common.query_engine import preload_query_engine
+from common.leaderboards import get_leaderboard_page
+
+preload_query_engine(get_dataset_aggregates, get_medal_cube, get_event_medal_cube, get_dataset_fingerprint)
 
 @lambda_middleware
 def lambda_handler(event, context):
@@ -31,6 +49,9 @@ def lambda_handler(event, context):
     min_year = int(query_params.get("min_year", "1800"))
     max_year = int(query_params.get("max_year", "9999"))
     list_of_sports = query_params.get("list_of_sports", "").split(",")
+    as_of_year = int(query_params["as_of_year"]) if "as_of_year" in query_params else None
+    cursor = query_params.get("cursor")
+    counting = query_params.get("counting", ATHLETE_COUNTING)
 
     if page < 1 or limit < 1:
         logger.error("Page and limit should be greater than 0.")
@@ -52,85 +73,53 @@ def lambda_handler(event, context):
             }
         )
 
-    sorted_list = get_sorted_list_of_countries_with_medals(min_year, max_year, list_of_sports)
-    
-    paginated_list = paginate_list(sorted_list, page, limit)
+    if as_of_year is not None and ("min_year" in query_params or "max_year" in query_params):
+        logger.error("as_of_year can't be combined with min_year or max_year.")
+
+        return build_response(
+            400,
+            {
+                'message': "as_of_year can't be combined with min_year or max_year."
+            }
+        )
+
+    if cursor is not None and "page" in query_params:
+        logger.error("cursor can't be combined with page.")
+
+        return build_response(
+            400,
+            {
+                'message': "cursor can't be combined with page."
+            }
+        )
+
+    params = {
+        'page': page if cursor is None else None,
+        'limit': limit,
+        'min_year': min_year,
+        'max_year': max_year,
+        'as_of_year': as_of_year,
+        'list_of_sports': list_of_sports,
+        'counting': counting,
+        'cursor': cursor
+    }
+
+    # Checked before the result cache, a matching ETag skips the leaderboard entirely
+    etag = query_etag("GetAllCountriesAchievements", params)
+
+    if is_not_modified(event, etag):
+        return build_response(304, None, etag=etag)
+
+    leaderboard_page = get_result_cache().get_or_compute(
+        canonical_query_key("GetAllCountriesAchievements", params),
+        lambda: get_leaderboard_page(min_year, max_year, as_of_year, list_of_sports, page, limit, cursor, counting)
+    )
 
     return build_response(
         200,
         {
             'message': "List of countries with medals returned successfully",
-            'page': page,
-            'total_records_found': len(sorted_list),
-            'item_count': len(paginated_list),
-            'items': paginated_list
-        }
+            **leaderboard_page
+        },
+        etag=etag
     )
-
-def get_sorted_list_of_countries_with_medals(min_year, max_year, list_of_sports):
-    logger.info("Getting sorted list of countries with medals...")
-
-    dataset = pd.read_csv("common/dataset.csv")
-    
-    logger.debug(f"Dataset length: {len(dataset)}")
-
-    dataset = dataset[dataset['Medal'] != 'No medal']
-
-    logger.debug(f"Dataset length: {len(dataset)}")
-    
-    filtered_dataset = apply_filters_to_dataset(dataset, min_year, max_year, list_of_sports)
-
-    logger.debug(f"Dataset length: {len(filtered_dataset)}")
-
-    # Group by "Team" and count the medals
-    team_medals = filtered_dataset.groupby('Team')['Medal'].value_counts().unstack(fill_value=0)
-
-    # Reset index to include the team in the result
-    team_medals = team_medals.reset_index()
-
-    logger.debug(f"Dataset length: {len(team_medals)}")
-
-    # Convert the result into a list of objects (dictionaries)
-    result = []
-    for _, row in team_medals.iterrows():
-        team_info = {
-            'country': row.get('Team', 'N/A'),
-            'gold': row.get('Gold', 0),
-            'silver': row.get('Silver', 0),
-            'bronze': row.get('Bronze', 0)
-        }
-        result.append(team_info)
-
-    logger.debug(f"Dataset length: {len(result)}")
-
-    return sorted(result, key=lambda x: (-x['gold'], -x['silver'], -x['bronze']))
-
-def apply_filters_to_dataset(dataset, min_year, max_year, list_of_sports):
-    logger.debug(f"min year and max year: {min_year} {max_year}")
-    
-    if min_year > 1800:
-        dataset = dataset[dataset['Year'] >= min_year]
-
-    if max_year < 9999:
-        dataset = dataset[dataset['Year'] <= max_year]
-
-    logger.debug(f"list of sports count and shape: {len(list_of_sports)} {list_of_sports} for min_year: {min_year} and max_year: {max_year}")
-
-    if list_of_sports and len(list_of_sports) > 0 and list_of_sports[0] != '':
-        dataset = dataset[dataset['Sport'].isin(list_of_sports)]
-
-    return dataset
-
-def paginate_list(data, page_number, limit_per_page):
-    # It's page_number - 1 because the minimum page is 1 not 0
-    start_index = (page_number - 1) * limit_per_page
-    end_index = page_number * limit_per_page
-
-    logger.debug(f"start index: {start_index} end index: {end_index}")
-
-    if len(data) < start_index or len(data) < end_index:
-        return data[-limit_per_page:]
-
-    # Slice the list to get the items for the current page
-    page_data = data[start_index:end_index]
-    return page_data
@@ -19,8 +19,28 @@ schema = {
         },
         "list_of_sports": {
             "type": "string"
+        },
+        "as_of_year": {
+            "type": "string",
+            "pattern": "^[0-9]+$"
+        },
+        "cursor": {
+            "type": "string",
+            "pattern": "^[A-Za-z0-9_-]+$"
+        },
+        "counting": {
+            "type": "string",
+            "enum": ["athletes", "events"]
         }
     },
-    "required": ["page", "limit"],
+    "required": ["limit"],
+    "if": {
+        "not": {
+            "required": ["cursor"]
+        }
+    },
+    "then": {
+        "required": ["page"]
+    },
     "additionalProperties": False
 }
\ No newline at end of file
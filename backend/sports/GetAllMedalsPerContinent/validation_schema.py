@@ -11,6 +11,10 @@ schema = {
         },
         "list_of_sports": {
             "type": "string"
+        },
+        "counting": {
+            "type": "string",
+            "enum": ["athletes", "events"]
         }
     },
     "required": [],
@@ -1,5 +1,4 @@
 import logging
-import pandas as pd
 
 from validation_schema import schema
 from aws_lambda_powertools.utilities.validation import validate
@@ -10,8 +9,25 @@ logger.setLevel(logging.DEBUG)
 from common.common import (
     lambda_middleware,
     build_response,
+    is_not_modified,
     ValidationError
 )
+from common.athlete_rankings import (
+    get_athlete_medal_counts,
+    get_athlete_appearances
+)
+from common.athlete_careers import get_athlete_careers
+from common.medal_facts import get_medal_facts
+from common.dataset import get_dataset_fingerprint
+from common.query_engine import preload_query_engine
+from common.leaderboards import get_medals_per_sportsmen
+from common.result_cache import (
+    get_result_cache,
+    canonical_query_key,
+    query_etag
+)
+
+preload_query_engine(get_athlete_careers, get_athlete_medal_counts, get_athlete_appearances, get_medal_facts, get_dataset_fingerprint)
 
 @lambda_middleware
 def lambda_handler(event, context):
@@ -29,6 +45,17 @@ def lambda_handler(event, context):
     min_year = int(query_params.get("min_year", "2000"))
     max_year = int(query_params.get("max_year", "2024"))
     list_of_sports = query_params.get("list_of_sports", "").split(",")
+    limit = int(query_params.get("limit", "5"))
+
+    if limit < 1 or limit > 100:
+        logger.error("limit should be between 1 and 100.")
+
+        return build_response(
+            400,
+            {
+                'message': "limit should be between 1 and 100."
+            }
+        )
 
     if min_year > max_year:
         logger.error("min_year should be less than max_year.")
@@ -40,64 +67,28 @@ def lambda_handler(event, context):
             }
         )
 
-    data = get_medals_per_sportsmen(min_year, max_year, list_of_sports)
+    params = {
+        'min_year': min_year,
+        'max_year': max_year,
+        'list_of_sports': list_of_sports,
+        'limit': limit
+    }
+
+    etag = query_etag("GetAllMedalsPerSportsman", params)
+
+    if is_not_modified(event, etag):
+        return build_response(304, None, etag=etag)
+
+    data = get_result_cache().get_or_compute(
+        canonical_query_key("GetAllMedalsPerSportsman", params),
+        lambda: get_medals_per_sportsmen(min_year, max_year, list_of_sports, limit)
+    )
     
     return build_response(
         200,
         {
             'message': "List of medals per sportsmen returned successfully",
             'data': data
-        }
+        },
+        etag=etag
     )
-
-def get_medals_per_sportsmen(min_year, max_year, list_of_sports):
-    dataset = pd.read_csv("common/dataset.csv")
-
-    filtered_dataset = apply_filters_to_dataset(dataset, min_year, max_year, list_of_sports)
-
-    medal_counts = filtered_dataset.pivot_table(index='Name', columns='Medal', aggfunc='size', fill_value=0)
-
-    # Ensure all medal types are present (even if some are missing in dataset)
-    medal_types = ['No medal', 'Gold', 'Bronze', 'Silver']
-    for medal in medal_types:
-        if medal not in medal_counts.columns:
-            medal_counts[medal] = 0  # Add missing medal type with count 0
-
-    # Calculate total appearances (sum of all medals)
-    medal_counts['appearances'] = medal_counts.sum(axis=1)
-
-    # Sort by total medals (gold first, then silver, then bronze)
-    medal_counts = medal_counts.sort_values(by=['Gold', 'Silver', 'Bronze', 'appearances'], ascending=False)
-
-    # Get top 5 sportsmen
-    top_5 = medal_counts.head(5)
-
-    top_5 = top_5.reset_index()
-
-    # Rename columns for consistency
-    top_5 = top_5.rename(columns={
-        'Gold': 'gold',
-        'Silver': 'silver',
-        'Bronze': 'bronze',
-        'No medal': 'no_medal',
-        'Name': 'name'
-    })
-
-    # Convert the sorted DataFrame into a list of dictionaries
-    return top_5.to_dict(orient='records')
-
-def apply_filters_to_dataset(dataset, min_year, max_year, list_of_sports):
-    logger.debug(f"min year and max year: {min_year} {max_year}")
-    
-    if min_year > 1800:
-        dataset = dataset[dataset['Year'] >= min_year]
-
-    if max_year < 9999:
-        dataset = dataset[dataset['Year'] <= max_year]
-
-    logger.debug(f"list of sports count and shape: {len(list_of_sports)} {list_of_sports} for min_year: {min_year} and max_year: {max_year}")
-
-    if list_of_sports and len(list_of_sports) > 0 and list_of_sports[0] != '':
-        dataset = dataset[dataset['Sport'].isin(list_of_sports)]
-
-    return dataset
\ No newline at end of file
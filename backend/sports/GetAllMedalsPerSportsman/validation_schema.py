@@ -11,6 +11,10 @@ schema = {
         },
         "list_of_sports": {
             "type": "string"
+        },
+        "limit": {
+            "type": "string",
+            "pattern": "^[0-9]+$"
         }
     },
     "required": [],
@@ -1,5 +1,7 @@
 import logging
-import pandas as pd
+
+from validation_schema import schema
+from aws_lambda_powertools.utilities.validation import validate
 
 logger = logging.getLogger("GetAllMedalsPerYear")
 logger.setLevel(logging.DEBUG)
@@ -7,35 +9,59 @@ logger.setLevel(logging.DEBUG)
 from common.common import (
     lambda_middleware,
     build_response,
+    is_not_modified,
+    ValidationError
+)
+from common.dataset import (
+    get_dataset_aggregates,
+    get_dataset_fingerprint
+)
+from common.medal_facts import (
+    ATHLETE_COUNTING,
+    get_event_medals
 )
+from common.query_engine import preload_query_engine
+from common.leaderboards import get_medals_per_year
+from common.result_cache import (
+    get_result_cache,
+    canonical_query_key,
+    query_etag
+)
+
+preload_query_engine(get_dataset_aggregates, get_event_medals, get_dataset_fingerprint)
 
 @lambda_middleware
 def lambda_handler(event, context):
-    data = get_medals_per_year()
+    query_params = event.get("queryStringParameters") or {}
+
+    try:
+        logger.debug(f"Validating query params: {query_params}")
+
+        validate(event=query_params, schema=schema)
+    except Exception as e:
+        logger.error(f"Validation error: {str(e)}")
+
+        raise ValidationError(str(e))
+
+    counting = query_params.get("counting", ATHLETE_COUNTING)
+    params = {'counting': counting}
+
+    # Responses only change with the dataset, a client holding the current one gets a 304 without any counting
+    etag = query_etag("GetAllMedalsPerYear", params)
+
+    if is_not_modified(event, etag):
+        return build_response(304, None, etag=etag)
+
+    data = get_result_cache().get_or_compute(
+        canonical_query_key("GetAllMedalsPerYear", params),
+        lambda: get_medals_per_year(counting)
+    )
     
     return build_response(
         200,
         {
             'message': "List of medals per year returned successfully",
             'data': data
-        }
+        },
+        etag=etag
     )
-
-def get_medals_per_year():
-    dataset = pd.read_csv("common/dataset.csv")
-
-    medal_counts_per_year = dataset.pivot_table(index='Year', columns='Medal', aggfunc='size', fill_value=0)
-
-    # Calculate total medals per year
-    medal_counts_per_year['total'] = medal_counts_per_year[['Gold', 'Silver', 'Bronze']].sum(axis=1)
-
-    medal_counts_per_year = medal_counts_per_year[['total']]
-    medal_counts_per_year = medal_counts_per_year.reset_index()
-
-    # Rename columns for consistency
-    medal_counts_per_year = medal_counts_per_year.rename(columns={
-        'Year': 'year'
-    })
-
-    # Convert the sorted DataFrame into a list of dictionaries
-    return medal_counts_per_year.to_dict(orient='records')
@@ -0,0 +1,11 @@
+schema = {
+    "type": "object",
+    "properties": {
+        "counting": {
+            "type": "string",
+            "enum": ["athletes", "events"]
+        }
+    },
+    "required": [],
+    "additionalProperties": False
+}
\ No newline at end of file
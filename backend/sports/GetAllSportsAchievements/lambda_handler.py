@@ -1,5 +1,4 @@
 import logging
-import pandas as pd
 
 from validation_schema import schema
 from aws_lambda_powertools.utilities.validation import validate
@@ -10,8 +9,43 @@ logger.setLevel(logging.DEBUG)
 from common.common import (
     lambda_middleware,
     build_response,
+    build_binary_response,
+    is_not_modified,
     ValidationError
 )
+from common.dataset import (
+    get_dataset_fingerprint,
+    preload_dataset
+)
+from common.inverted_index import get_inverted_index
+from common.medal_order import get_medal_order_permutation
+from common.query_engine import (
+    get_query_engine,
+    preload_query_engine
+)
+from common.pagination import (
+    encode_cursor,
+    decode_cursor
+)
+from common.result_cache import query_etag
+from common.leaderboards import paginate_list
+from common.response_formats import (
+    JSON_FORMAT,
+    MSGPACK_FORMAT,
+    MSGPACK_CONTENT_TYPE,
+    columns_to_records,
+    encode_msgpack,
+    get_columnar_rows
+)
+
+# Columns of the returned rows, the keys of the items are their lower case names
+SPORTSMEN_COLUMNS = ['Name', 'Sex', 'Sport', 'Event', 'Medal', 'Team', 'Year']
+
+def get_sportsmen_columns():
+    return get_columnar_rows(SPORTSMEN_COLUMNS)
+
+preload_query_engine(get_inverted_index)
+preload_dataset(get_medal_order_permutation, get_dataset_fingerprint, get_sportsmen_columns)
 
 @lambda_middleware
 def lambda_handler(event, context):
@@ -32,6 +66,8 @@ def lambda_handler(event, context):
     sport = query_params.get("sport", None)
     event_name = query_params.get("event", None)
     country = query_params.get("country", None)
+    cursor = query_params.get("cursor", None)
+    response_format = query_params.get("format", JSON_FORMAT)
 
     if page < 1 or limit < 1:
         logger.error("Page and limit should be greater than 0.")
@@ -43,90 +79,105 @@ def lambda_handler(event, context):
             }
         )
 
-    sorted_list = get_sorted_list_of_sportsmen(
-        medal,
-        name,
-        sex,
-        sport,
-        event_name,
-        country
-    )
-    
-    paginated_list = paginate_list(sorted_list, page, limit)
+    if cursor is not None and "page" in query_params:
+        logger.error("cursor can't be combined with page.")
 
-    return build_response(
-        200,
-        {
-            'message': "List of sportsmen returned successfully",
-            'page': page,
-            'total_records_found': len(sorted_list),
-            'item_count': len(paginated_list),
-            'items': paginated_list
-        }
-    )
+        return build_response(
+            400,
+            {
+                'message': "cursor can't be combined with page."
+            }
+        )
 
-def get_sorted_list_of_sportsmen(medal, name, sex, sport, event_name, country):
-    logger.info("Sorting list of sportsmen")
+    medal_order = get_medal_order_permutation()
 
-    dataset = pd.read_csv("common/dataset.csv")
+    filters = {
+        'medal': medal,
+        'sportsman_name': name,
+        'sex': sex,
+        'sport': sport,
+        'event': event_name,
+        'country': country
+    }
 
-    logger.info("Applying filters to dataset columns")
+    params = {
+        **filters,
+        'page': page if cursor is None else None,
+        'limit': limit,
+        'cursor': cursor,
+        'format': response_format
+    }
 
-    dataset = dataset[['Name', 'Sex', 'Sport', 'Event', 'Medal', 'Team', 'Year']]
-    medal_order = {'Gold': 1, 'Silver': 2, 'Bronze': 3}
+    # A client holding the current page gets a 304 before any filtering
+    etag = query_etag("GetAllSportsAchievements", params)
 
-    dataset.columns = dataset.columns.str.lower()
+    if is_not_modified(event, etag):
+        return build_response(304, None, etag=etag)
 
-    filtered_df = apply_filters_to_dataset(dataset, medal, name, sex, sport, event_name, country)
+    rows = apply_filters_to_dataset(medal, name, sex, sport, event_name, country)
+    total_records_found = len(rows) if rows is not None else len(medal_order.permutation)
 
-    # Add a temporary column for sorting
-    filtered_df['Medal_Order'] = filtered_df['medal'].map(medal_order)
+    if cursor is not None:
+        after_position, previous_page = decode_sportsmen_cursor(cursor, filters)
+        page = previous_page + 1
 
-    # Sort by the 'Medal_Order' column and then drop the temporary column
-    sorted_df = filtered_df.sort_values(by='Medal_Order').drop(columns=['Medal_Order'])
+        # Resume right after the position of the last returned row in medal order
+        page_rows = medal_order.rows_after(after_position, limit, rows)
+    else:
+        # Rows are presorted by medal once per container, filtered rows only need their positions sorted
+        page_rows = paginate_list(medal_order.sorted_rows(rows), page, limit)
 
-    # Convert the sorted DataFrame into a list of dictionaries
-    return sorted_df.to_dict(orient='records')
+    # Only the rows of the requested page are read, one list per column straight from the column arrays
+    columns = get_sportsmen_columns().columns(page_rows)
 
-def apply_filters_to_dataset(dataset, medal, name, sex, sport, event_name, country):
-    if medal:
-        logger.debug(f"Filtering by medal: {medal}")
-        dataset = dataset[dataset['medal'].str.lower() == medal.lower()]
-    
-    if name:
-        logger.debug(f"Filtering by name: {name}")
-        dataset = dataset[dataset['name'].str.lower() == name.lower()]
+    next_cursor = None
+    if len(page_rows) > 0:
+        last_returned_position = int(medal_order.positions[page_rows[-1]])
+
+        if last_returned_position < medal_order.last_position(rows):
+            # Positions in the medal order only hold for this dataset, the cursor carries its fingerprint
+            next_cursor = encode_cursor(filters, last_returned_position, page, get_dataset_fingerprint())
+
+    body = {
+        'message': "List of sportsmen returned successfully",
+        'page': page,
+        'total_records_found': total_records_found,
+        'item_count': len(page_rows),
+        # Columnar formats send every key once instead of once per row
+        'items': columns if response_format != JSON_FORMAT else columns_to_records(columns),
+        'next_cursor': next_cursor
+    }
+
+    if response_format == MSGPACK_FORMAT:
+        return build_binary_response(200, encode_msgpack(body), MSGPACK_CONTENT_TYPE, etag)
 
-    if sex:
-        logger.debug(f"Filtering by sex: {sex}")
-        dataset = dataset[dataset['sex'] == sex]
+    return build_response(200, body, etag=etag)
 
-    if sport:
-        logger.debug(f"Filtering by sport: {sport}")
-        dataset = dataset[dataset['sport'].str.lower() == sport.lower()]
+def decode_sportsmen_cursor(cursor, filters):
+    after_position, page = decode_cursor(cursor, filters, get_dataset_fingerprint())
 
-    if event_name:
-        logger.debug(f"Filtering by event: {event_name}")
-        dataset = dataset[dataset['event'].str.lower() == event_name.lower()]
+    if not isinstance(after_position, int) or after_position < 0:
+        logger.error(f"Unexpected sportsmen sort key: {after_position}")
 
-    if country:
-        logger.debug(f"Filtering by country: {country}")
-        dataset = dataset[dataset['team'].str.lower() == country.lower()]
+        raise ValidationError("Invalid cursor.")
 
-    logger.info(f"Dataset length: {len(dataset)}")
+    return after_position, page
 
-    return dataset
+def apply_filters_to_dataset(medal, name, sex, sport, event_name, country):
+    filters = {
+        'Medal': medal,
+        'Name': name,
+        'Sex': sex,
+        'Sport': sport,
+        'Event': event_name,
+        'Team': country
+    }
 
-def paginate_list(data, page_number, limit_per_page):
-    # It's page_number - 1 because the minimum page is 1 not 0
-    start_index = (page_number - 1) * limit_per_page
-    end_index = page_number * limit_per_page
+    logger.debug(f"Filtering by: {filters}")
 
-    logger.debug(f"start index: {start_index} end index: {end_index}")
+    # The numpy engine intersects posting lists of the prebuilt index instead of comparing whole columns
+    rows = get_query_engine().filter_rows(filters)
 
-    if len(data) < start_index or len(data) < end_index:
-        return data[-limit_per_page:]
+    logger.info(f"Dataset length: {len(rows) if rows is not None else 'all rows'}")
 
-    # Slice the list to get the items for the current page
-    page_data = data[start_index:end_index]
-    return page_data
+    return rows
@@ -32,8 +32,24 @@ schema = {
         "country": {
             "type": "string",
             "minLength": 1
+        },
+        "cursor": {
+            "type": "string",
+            "pattern": "^[A-Za-z0-9_-]+$"
+        },
+        "format": {
+            "type": "string",
+            "enum": ["json", "columnar", "msgpack"]
         }
     },
-    "required": ["page", "limit"],
+    "required": ["limit"],
+    "if": {
+        "not": {
+            "required": ["cursor"]
+        }
+    },
+    "then": {
+        "required": ["page"]
+    },
     "additionalProperties": False
 }
\ No newline at end of file
@@ -0,0 +1,70 @@
+import logging
+
+from validation_schema import schema
+from aws_lambda_powertools.utilities.validation import validate
+
+logger = logging.getLogger("GetCatalog")
+logger.setLevel(logging.DEBUG)
+
+from common.common import (
+    lambda_middleware,
+    build_response,
+    is_not_modified,
+    ValidationError
+)
+from common.dataset import preload_dataset
+from common.catalogs import (
+    get_catalogs,
+    catalog_etag
+)
+
+preload_dataset(get_catalogs)
+
+@lambda_middleware
+def lambda_handler(event, context):
+    query_params = event.get("queryStringParameters", {})
+
+    try:
+        logger.debug(f"Validating query params: {query_params}")
+
+        validate(event=query_params, schema=schema)
+    except Exception as e:
+        logger.error(f"Validation error: {str(e)}")
+
+        raise ValidationError(str(e))
+
+    name = query_params["catalog"]
+    prefix = query_params.get("prefix", "")
+    limit = int(query_params.get("limit", "1000"))
+
+    if limit < 1 or limit > 1000:
+        logger.error("limit should be between 1 and 1000.")
+
+        return build_response(
+            400,
+            {
+                'message': "limit should be between 1 and 1000."
+            }
+        )
+
+    catalog = get_catalogs()[name]
+    etag = catalog_etag(catalog, prefix, limit)
+
+    if is_not_modified(event, etag):
+        logger.info(f"Catalog {name} not modified, ETag: {etag}")
+
+        return build_response(304, None, etag=etag)
+
+    items = catalog.search(prefix)
+
+    return build_response(
+        200,
+        {
+            'message': "Catalog returned successfully",
+            'catalog': name,
+            'total_records_found': len(items),
+            'item_count': min(len(items), limit),
+            'items': items[:limit]
+        },
+        etag=etag
+    )
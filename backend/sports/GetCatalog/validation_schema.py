@@ -0,0 +1,18 @@
+schema = {
+    "type": "object",
+    "properties": {
+        "catalog": {
+            "type": "string",
+            "enum": ["sports", "events", "teams", "cities"]
+        },
+        "prefix": {
+            "type": "string"
+        },
+        "limit": {
+            "type": "string",
+            "pattern": "^[0-9]+$"
+        }
+    },
+    "required": ["catalog"],
+    "additionalProperties": False
+}
@@ -0,0 +1,68 @@
+import logging
+
+from validation_schema import schema
+from aws_lambda_powertools.utilities.validation import validate
+
+logger = logging.getLogger("GetEventPodium")
+logger.setLevel(logging.DEBUG)
+
+from common.common import (
+    lambda_middleware,
+    build_response,
+    is_not_modified,
+    ValidationError
+)
+from common.dataset import (
+    get_dataset_fingerprint,
+    preload_dataset
+)
+from common.podium_index import get_podium_index
+from common.result_cache import query_etag
+
+preload_dataset(get_podium_index, get_dataset_fingerprint)
+
+@lambda_middleware
+def lambda_handler(event, context):
+    query_params = event.get("queryStringParameters", {})
+
+    try:
+        logger.debug(f"Validating query params: {query_params}")
+
+        validate(event=query_params, schema=schema)
+    except Exception as e:
+        logger.error(f"Validation error: {str(e)}")
+
+        raise ValidationError(str(e))
+
+    event_name = query_params["event"]
+    year = int(query_params["year"])
+    season = query_params["season"]
+
+    etag = query_etag("GetEventPodium", {'event': event_name, 'year': year, 'season': season})
+
+    if is_not_modified(event, etag):
+        return build_response(304, None, etag=etag)
+
+    logger.debug(f"Getting podium of {event_name} {season} {year}")
+
+    # Single hash lookup, no scan of the dataset
+    data = get_podium_index().podium(event_name, year, season)
+
+    if data is None:
+        logger.error(f"Podium of {event_name} {season} {year} not found.")
+
+        return build_response(
+            404,
+            {
+                'message': "Podium not found."
+            }
+        )
+
+    return build_response(
+        200,
+        {
+            'message': "Podium returned successfully",
+            'data': data
+        },
+        etag=etag
+    )
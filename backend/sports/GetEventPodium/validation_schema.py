@@ -0,0 +1,19 @@
+schema = {
+    "type": "object",
+    "properties": {
+        "event": {
+            "type": "string",
+            "minLength": 1
+        },
+        "year": {
+            "type": "string",
+            "pattern": "^[0-9]+$"
+        },
+        "season": {
+            "type": "string",
+            "minLength": 1
+        }
+    },
+    "required": ["event", "year", "season"],
+    "additionalProperties": False
+}
@@ -0,0 +1,52 @@
+import logging
+import json
+
+from validation_schema import schema
+from aws_lambda_powertools.utilities.validation import validate
+
+logger = logging.getLogger("GetEventPodiumsBatch")
+logger.setLevel(logging.DEBUG)
+
+from common.common import (
+    lambda_middleware,
+    build_response,
+    ValidationError
+)
+from common.dataset import preload_dataset
+from common.podium_index import get_podium_index
+
+preload_dataset(get_podium_index)
+
+@lambda_middleware
+def lambda_handler(event, context):
+    try:
+        request_body = json.loads(event.get('body')) if 'body' in event else event
+
+        logger.debug(f"Validating request body: {request_body}")
+
+        validate(event=request_body, schema=schema)
+    except Exception as e:
+        logger.error(f"Validation error: {str(e)}")
+
+        raise ValidationError(str(e))
+
+    data = get_podiums(request_body["events"])
+
+    return build_response(
+        200,
+        {
+            'message': "Podiums returned successfully",
+            'data': data
+        }
+    )
+
+def get_podiums(events):
+    logger.debug(f"Getting podiums of {len(events)} events")
+
+    podium_index = get_podium_index()
+
+    # One hash lookup per event, events that weren't held are null so the items follow the request order
+    return [
+        podium_index.podium(item["event"], item["year"], item["season"])
+        for item in events
+    ]
@@ -0,0 +1,31 @@
+schema = {
+    "type": "object",
+    "properties": {
+        "events": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "event": {
+                        "type": "string",
+                        "minLength": 1
+                    },
+                    "year": {
+                        "type": "integer",
+                        "minimum": 0
+                    },
+                    "season": {
+                        "type": "string",
+                        "minLength": 1
+                    }
+                },
+                "required": ["event", "year", "season"],
+                "additionalProperties": False
+            },
+            "minItems": 1,
+            "maxItems": 100
+        }
+    },
+    "required": ["events"],
+    "additionalProperties": False
+}
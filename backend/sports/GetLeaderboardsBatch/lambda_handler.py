@@ -0,0 +1,189 @@
+import logging
+import json
+import time
+
+from validation_schema import schema
+from aws_lambda_powertools.utilities.validation import validate
+
+logger = logging.getLogger("GetLeaderboardsBatch")
+logger.setLevel(logging.DEBUG)
+
+from common.common import (
+    lambda_middleware,
+    build_response,
+    ValidationError
+)
+from common.dataset import get_dataset_aggregates
+from common.medal_cube import (
+    get_medal_cube,
+    get_event_medal_cube
+)
+from common.medal_facts import (
+    ATHLETE_COUNTING,
+    get_medal_facts,
+    get_event_medals
+)
+from common.continents import (
+    get_continent_codes,
+    get_event_continent_counts
+)
+from common.athlete_rankings import (
+    get_athlete_medal_counts,
+    get_athlete_appearances
+)
+from common.athlete_careers import get_athlete_careers
+from common.query_engine import preload_query_engine
+from common.result_cache import (
+    get_result_cache,
+    canonical_query_key
+)
+from common.leaderboards import (
+    LeaderboardQueries,
+    get_medals_per_year,
+    get_medals_per_continent_data,
+    get_medals_per_sportsmen,
+    get_leaderboard_page
+)
+
+preload_query_engine(
+    get_dataset_aggregates,
+    get_event_medals,
+    get_continent_codes,
+    get_event_continent_counts,
+    get_athlete_careers,
+    get_athlete_medal_counts,
+    get_athlete_appearances,
+    get_medal_facts,
+    get_medal_cube,
+    get_event_medal_cube
+)
+
+@lambda_middleware
+def lambda_handler(event, context):
+    try:
+        request_body = json.loads(event.get('body')) if 'body' in event else event
+
+        logger.debug(f"Validating request body: {request_body}")
+
+        validate(event=request_body, schema=schema)
+    except Exception as e:
+        logger.error(f"Validation error: {str(e)}")
+
+        raise ValidationError(str(e))
+
+    # Every sub-query is checked before any of them runs, a batch is answered whole or not at all
+    sub_queries = [
+        parse_sub_query(position, sub_query)
+        for position, sub_query in enumerate(request_body["queries"])
+    ]
+
+    start = time.perf_counter()
+    results, stats = run_sub_queries(sub_queries)
+
+    return build_response(
+        200,
+        {
+            'message': "Leaderboards returned successfully",
+            'results': results,
+            'shared_computations': stats["hits"],
+            'total_time_ms': round((time.perf_counter() - start) * 1000, 3)
+        }
+    )
+
+def parse_sub_query(position, sub_query):
+    """
+    Return (query, endpoint, params, compute) of a validated sub-query, params are filled in with the
+    defaults of the endpoint so a sub-query shares its result cache entry with the same standalone request
+    """
+    query = sub_query["query"]
+    counting = sub_query.get("counting", ATHLETE_COUNTING)
+    list_of_sports = sub_query.get("list_of_sports") or ['']
+
+    if query == "medals_per_year":
+        params = {'counting': counting}
+
+        return query, "GetAllMedalsPerYear", params, lambda queries: get_medals_per_year(counting, queries)
+
+    if query == "medals_per_continent":
+        min_year = sub_query.get("min_year", 2000)
+        max_year = sub_query.get("max_year", 2024)
+
+        check_year_range(position, min_year, max_year)
+
+        params = {'min_year': min_year, 'max_year': max_year, 'counting': counting}
+
+        return query, "GetAllMedalsPerContinent", params, lambda queries: get_medals_per_continent_data(min_year, max_year, counting, queries)
+
+    if query == "medals_per_sportsman":
+        min_year = sub_query.get("min_year", 2000)
+        max_year = sub_query.get("max_year", 2024)
+        limit = sub_query.get("limit", 5)
+
+        check_year_range(position, min_year, max_year)
+
+        params = {'min_year': min_year, 'max_year': max_year, 'list_of_sports': list_of_sports, 'limit': limit}
+
+        return query, "GetAllMedalsPerSportsman", params, lambda queries: get_medals_per_sportsmen(min_year, max_year, list_of_sports, limit, queries)
+
+    page = sub_query["page"]
+    limit = sub_query["limit"]
+    min_year = sub_query.get("min_year", 1800)
+    max_year = sub_query.get("max_year", 9999)
+    as_of_year = sub_query.get("as_of_year")
+
+    check_year_range(position, min_year, max_year)
+
+    if as_of_year is not None and ("min_year" in sub_query or "max_year" in sub_query):
+        raise ValidationError(f"queries[{position}]: as_of_year can't be combined with min_year or max_year.")
+
+    params = {
+        'page': page,
+        'limit': limit,
+        'min_year': min_year,
+        'max_year': max_year,
+        'as_of_year': as_of_year,
+        'list_of_sports': list_of_sports,
+        'counting': counting,
+        'cursor': None
+    }
+
+    return query, "GetAllCountriesAchievements", params, lambda queries: get_leaderboard_page(min_year, max_year, as_of_year, list_of_sports, page, limit, None, counting, queries)
+
+def check_year_range(position, min_year, max_year):
+    if min_year > max_year:
+        raise ValidationError(f"queries[{position}]: min_year should be less than max_year.")
+
+def run_sub_queries(sub_queries):
+    """
+    Return the results of the sub-queries in request order and the stats of the shared computations.
+    Sub-queries share one LeaderboardQueries, the medals counted and sorted for a set of filters
+    are reused by every later sub-query with the same filters.
+    """
+    queries = LeaderboardQueries()
+    result_cache = get_result_cache()
+    results = []
+
+    for query, endpoint, params, compute in sub_queries:
+        start = time.perf_counter()
+
+        key = canonical_query_key(endpoint, params)
+        cached, data = result_cache.get(key)
+
+        if not cached:
+            data = compute(queries)
+            result_cache.put(key, data)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        logger.debug(f"Sub-query {query} {params} answered in {elapsed_ms:.3f} ms, cached: {cached}")
+
+        results.append({
+            'query': query,
+            'cached': cached,
+            'time_ms': round(elapsed_ms, 3),
+            'data': data
+        })
+
+    logger.info(f"Batch of {len(sub_queries)} sub-queries, shared computations: {queries.stats}")
+
+    return results, queries.stats
@@ -0,0 +1,100 @@
+year = {
+    "type": "integer",
+    "minimum": 0
+}
+
+list_of_sports = {
+    "type": "array",
+    "items": {
+        "type": "string"
+    }
+}
+
+counting = {
+    "type": "string",
+    "enum": ["athletes", "events"]
+}
+
+sub_query_schemas = [
+    {
+        "type": "object",
+        "properties": {
+            "query": {
+                "const": "medals_per_year"
+            },
+            "counting": counting
+        },
+        "required": ["query"],
+        "additionalProperties": False
+    },
+    {
+        "type": "object",
+        "properties": {
+            "query": {
+                "const": "medals_per_continent"
+            },
+            "min_year": year,
+            "max_year": year,
+            "counting": counting
+        },
+        "required": ["query"],
+        "additionalProperties": False
+    },
+    {
+        "type": "object",
+        "properties": {
+            "query": {
+                "const": "medals_per_sportsman"
+            },
+            "min_year": year,
+            "max_year": year,
+            "list_of_sports": list_of_sports,
+            "limit": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": 100
+            }
+        },
+        "required": ["query"],
+        "additionalProperties": False
+    },
+    {
+        "type": "object",
+        "properties": {
+            "query": {
+                "const": "countries_achievements"
+            },
+            "page": {
+                "type": "integer",
+                "minimum": 1
+            },
+            "limit": {
+                "type": "integer",
+                "minimum": 1
+            },
+            "min_year": year,
+            "max_year": year,
+            "as_of_year": year,
+            "list_of_sports": list_of_sports,
+            "counting": counting
+        },
+        "required": ["query", "page", "limit"],
+        "additionalProperties": False
+    }
+]
+
+schema = {
+    "type": "object",
+    "properties": {
+        "queries": {
+            "type": "array",
+            "items": {
+                "oneOf": sub_query_schemas
+            },
+            "minItems": 1,
+            "maxItems": 20
+        }
+    },
+    "required": ["queries"],
+    "additionalProperties": False
+}
@@ -0,0 +1,75 @@
+import logging
+
+from validation_schema import schema
+from aws_lambda_powertools.utilities.validation import validate
+
+logger = logging.getLogger("GetSportsmanProfile")
+logger.setLevel(logging.DEBUG)
+
+from common.common import (
+    lambda_middleware,
+    build_response,
+    is_not_modified,
+    ValidationError
+)
+from common.dataset import (
+    get_dataset_fingerprint,
+    preload_dataset
+)
+from common.athlete_careers import get_athlete_careers
+from common.result_cache import query_etag
+
+preload_dataset(get_athlete_careers, get_dataset_fingerprint)
+
+@lambda_middleware
+def lambda_handler(event, context):
+    query_params = event.get("queryStringParameters", {})
+
+    try:
+        logger.debug(f"Validating query params: {query_params}")
+
+        validate(event=query_params, schema=schema)
+    except Exception as e:
+        logger.error(f"Validation error: {str(e)}")
+
+        raise ValidationError(str(e))
+
+    player_id = int(query_params["player_id"])
+
+    etag = query_etag("GetSportsmanProfile", {'player_id': player_id})
+
+    if is_not_modified(event, etag):
+        return build_response(304, None, etag=etag)
+
+    data = get_sportsman_profile(player_id)
+
+    if data is None:
+        logger.error(f"Sportsman with player_id {player_id} not found.")
+
+        return build_response(
+            404,
+            {
+                'message': "Sportsman not found."
+            }
+        )
+
+    return build_response(
+        200,
+        {
+            'message': "Sportsman profile returned successfully",
+            'data': data
+        },
+        etag=etag
+    )
+
+def get_sportsman_profile(player_id):
+    logger.debug(f"Getting career of player_id: {player_id}")
+
+    athlete_careers = get_athlete_careers()
+    code = athlete_careers.player_code(player_id)
+
+    if code is None:
+        return None
+
+    # Only the rows of the career are read
+    return athlete_careers.timeline(code)
@@ -0,0 +1,11 @@
+schema = {
+    "type": "object",
+    "properties": {
+        "player_id": {
+            "type": "string",
+            "pattern": "^[0-9]+$"
+        }
+    },
+    "required": ["player_id"],
+    "additionalProperties": False
+}
@@ -0,0 +1,79 @@
+import logging
+
+from validation_schema import schema
+from aws_lambda_powertools.utilities.validation import validate
+
+logger = logging.getLogger("SearchSportsmen")
+logger.setLevel(logging.DEBUG)
+
+from common.common import (
+    lambda_middleware,
+    build_response,
+    is_not_modified,
+    ValidationError
+)
+from common.dataset import (
+    get_dataset_fingerprint,
+    preload_dataset
+)
+from common.name_search import get_name_search_index
+from common.result_cache import query_etag
+
+preload_dataset(get_name_search_index, get_dataset_fingerprint)
+
+@lambda_middleware
+def lambda_handler(event, context):
+    query_params = event.get("queryStringParameters", {})
+
+    try:
+        logger.debug(f"Validating query params: {query_params}")
+
+        validate(event=query_params, schema=schema)
+    except Exception as e:
+        logger.error(f"Validation error: {str(e)}")
+
+        raise ValidationError(str(e))
+
+    query = query_params.get("query")
+    limit = int(query_params.get("limit", "10"))
+
+    if limit < 1 or limit > 50:
+        logger.error("limit should be between 1 and 50.")
+
+        return build_response(
+            400,
+            {
+                'message': "limit should be between 1 and 50."
+            }
+        )
+
+    etag = query_etag("SearchSportsmen", {'query': query, 'limit': limit})
+
+    if is_not_modified(event, etag):
+        return build_response(304, None, etag=etag)
+
+    data = search_sportsmen(query, limit)
+
+    return build_response(
+        200,
+        {
+            'message': "List of matching sportsmen returned successfully",
+            'data': data
+        },
+        etag=etag
+    )
+
+def search_sportsmen(query, limit):
+    logger.debug(f"Searching sportsmen by: {query}, limit: {limit}")
+
+    name_search_index = get_name_search_index()
+
+    # Prefix matches come first, then names ranked by trigram similarity
+    return [
+        {
+            'name': name_search_index.names[code],
+            'player_ids': name_search_index.get_player_ids(code),
+            'score': round(score, 4)
+        }
+        for code, score in name_search_index.search(query, limit)
+    ]
@@ -0,0 +1,16 @@
+schema = {
+    "type": "object",
+    "properties": {
+        "query": {
+            "type": "string",
+            "minLength": 1,
+            "maxLength": 100
+        },
+        "limit": {
+            "type": "string",
+            "pattern": "^[0-9]+$"
+        }
+    },
+    "required": ["query"],
+    "additionalProperties": False
+}
@@ -0,0 +1,116 @@
+import argparse
+import os
+import time
+
+import numpy as np
+
+from common.aggregates import MEDAL_COLUMNS
+from common.partitioned import (
+    PartitionedCounter,
+    count_rows
+)
+
+GAMES_YEARS = np.arange(1896, 2028, 2)
+
+# Counts of the handlers with typical filters: (key column, min year, max year, sport codes)
+BENCHMARK_QUERIES = {
+    'team_medals': ('team', None, None, None),
+    'team_medals_sports': ('team', 1950, 2000, np.array([3, 7, 11])),
+    'athletes_range': ('name', 1980, 2024, None),
+    'athletes_sports': ('name', None, None, np.array([1, 2, 3, 4, 5]))
+}
+
+def synthetic_columns(rows, seed=42):
+    """
+    Return (years, columns) of a dataset with the shape of the Olympic one, later Games have more rows
+    """
+    random = np.random.default_rng(seed)
+    year_weights = np.linspace(1, 10, len(GAMES_YEARS))
+
+    years = random.choice(GAMES_YEARS, size=rows, p=year_weights / year_weights.sum()).astype(np.int16)
+    columns = {
+        'name': random.integers(0, max(rows // 10, 1), size=rows, dtype=np.int32),
+        'team': random.integers(0, 230, size=rows, dtype=np.int32),
+        'sport': random.integers(0, 66, size=rows, dtype=np.int16),
+        'medal': random.choice(len(MEDAL_COLUMNS), size=rows, p=[0.05, 0.05, 0.05, 0.85]).astype(np.int8)
+    }
+
+    return years, columns
+
+def key_sizes(columns):
+    return {column: int(values.max()) + 1 for column, values in columns.items()}
+
+def measure(count, repeat):
+    """
+    Return the best time in seconds of every query, count(key_column, key_size, min_year, max_year, sport_codes)
+    """
+    timings = {}
+
+    for query_name, (key_column, min_year, max_year, sport_codes) in BENCHMARK_QUERIES.items():
+        best = None
+
+        for _ in range(repeat):
+            start = time.perf_counter()
+            count(key_column, min_year, max_year, sport_codes)
+            elapsed = time.perf_counter() - start
+
+            best = elapsed if best is None else min(best, elapsed)
+
+        timings[query_name] = best
+
+    return timings
+
+def single_process_timings(years, columns, repeat):
+    sizes = key_sizes(columns)
+    year_values, year_index = np.unique(years, return_inverse=True)
+    all_columns = {'year_index': year_index, **columns}
+
+    def count(key_column, min_year, max_year, sport_codes):
+        start_year = 0 if min_year is None else np.searchsorted(year_values, min_year, side='left')
+        end_year = len(year_values) if max_year is None else np.searchsorted(year_values, max_year, side='right')
+
+        return count_rows(all_columns, 0, len(years), key_column, sizes[key_column], (start_year, end_year), sport_codes)
+
+    return measure(count, repeat)
+
+def partitioned_timings(years, columns, workers, repeat):
+    sizes = key_sizes(columns)
+    counter = PartitionedCounter(years, columns, workers=workers)
+
+    try:
+        def count(key_column, min_year, max_year, sport_codes):
+            return counter.count(key_column, sizes[key_column], min_year, max_year, sport_codes)
+
+        # Workers are started by the first tasks, the start up is not measured
+        count('team', None, None, None)
+
+        return measure(count, repeat)
+    finally:
+        counter.close()
+
+def print_timings(label, rows, timings, baseline=None):
+    for query_name, seconds in timings.items():
+        speedup = f"{baseline[query_name] / seconds:>10.2f}x" if baseline else f"{'':>11}"
+
+        print(f"{label:<16}{query_name:<22}{seconds * 1000:>12.1f}{rows / seconds / 1e6:>18.1f}{speedup}")
+
+def run_benchmark(rows, worker_counts, repeat):
+    years, columns = synthetic_columns(rows)
+
+    print(f"Synthetic rows: {rows}, CPUs: {os.cpu_count()}")
+    print(f"{'mode':<16}{'query':<22}{'best (ms)':>12}{'rows/s (millions)':>18}{'speedup':>11}")
+
+    baseline = single_process_timings(years, columns, repeat)
+    print_timings("single process", rows, baseline)
+
+    for workers in worker_counts:
+        print_timings(f"{workers} workers", rows, partitioned_timings(years, columns, workers, repeat), baseline)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report throughput of the partitioned counts for different numbers of workers")
+    parser.add_argument("--rows", type=int, default=20_000_000, help="Rows of the synthetic dataset")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="Pool sizes to benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs of every query, the best one is reported")
+    args = parser.parse_args()
+
+    run_benchmark(args.rows, args.workers, args.repeat)
@@ -0,0 +1,84 @@
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from common.dataset import get_dataset
+from common.medal_facts import EVENT_COUNTING
+from common.query_engine import (
+    QUERY_ENGINES,
+    SqliteQueryEngine,
+    get_query_engine
+)
+
+# Queries of the handlers with typical filters
+BENCHMARK_QUERIES = {
+    'medals_per_year': lambda engine: engine.medals_per_year(),
+    'continent_totals': lambda engine: engine.continent_totals(1950, 2000),
+    'team_medals': lambda engine: engine.team_medals(1800, 9999),
+    'team_medals_sports': lambda engine: engine.team_medals(1950, 2000, ['Swimming', 'Athletics']),
+    'team_medals_as_of': lambda engine: engine.team_medals_as_of(1960),
+    'team_medals_events': lambda engine: engine.team_medals(1800, 9999, counting=EVENT_COUNTING),
+    'continent_totals_events': lambda engine: engine.continent_totals(1950, 2000, counting=EVENT_COUNTING),
+    'top_athletes': lambda engine: engine.top_athletes(1800, 9999, None, 5),
+    'top_athletes_sports': lambda engine: engine.top_athletes(2000, 2024, ['Judo', 'Boxing'], 5),
+    'filter_rows_selective': lambda engine: engine.filter_rows({'Team': 'Norway', 'Sex': 'F'}),
+    'filter_rows_broad': lambda engine: engine.filter_rows({'Sex': 'M'})
+}
+
+def warm_up(name):
+    """
+    Build the engine and everything its queries read, return (build time in ms, bytes held after the build)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    engine = get_query_engine(name)
+    for query in BENCHMARK_QUERIES.values():
+        query(engine)
+
+    build_time_ms = (time.perf_counter() - start) * 1000
+    held_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # SQLite allocates its pages outside of the Python allocator
+    if isinstance(engine, SqliteQueryEngine):
+        held_bytes += engine.database_bytes()
+
+    return engine, build_time_ms, held_bytes
+
+def measure_latencies(engine, repeat):
+    latencies = {}
+
+    for query_name, query in BENCHMARK_QUERIES.items():
+        timings = []
+
+        for _ in range(repeat):
+            start = time.perf_counter()
+            query(engine)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        latencies[query_name] = (np.percentile(timings, 50), np.percentile(timings, 95))
+
+    return latencies
+
+def run_benchmark(engine_names, repeat):
+    print(f"Dataset rows: {len(get_dataset())}")
+
+    for name in engine_names:
+        engine, build_time_ms, held_bytes = warm_up(name)
+
+        print(f"\nEngine: {name}, build and first queries: {build_time_ms:.1f} ms, memory held: {held_bytes / 1024 / 1024:.1f} MB")
+        print(f"{'query':<24}{'p50 (ms)':>12}{'p95 (ms)':>12}")
+
+        for query_name, (p50, p95) in measure_latencies(engine, repeat).items():
+            print(f"{query_name:<24}{p50:>12.3f}{p95:>12.3f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report latency and memory of the sports query engines")
+    parser.add_argument("--engines", nargs="+", default=list(QUERY_ENGINES), choices=list(QUERY_ENGINES), help="Engines to benchmark")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs of every query")
+    args = parser.parse_args()
+
+    run_benchmark(args.engines, args.repeat)
@@ -0,0 +1,92 @@
+import argparse
+import base64
+import json
+import time
+
+import numpy as np
+
+from common.dataset import get_dataset
+from common.medal_order import get_medal_order_permutation
+from common.response_formats import (
+    JSON_FORMAT,
+    COLUMNAR_FORMAT,
+    MSGPACK_FORMAT,
+    columns_to_records,
+    encode_msgpack,
+    get_columnar_rows
+)
+
+# Columns returned by GetAllSportsAchievements
+SPORTSMEN_COLUMNS = ['Name', 'Sex', 'Sport', 'Event', 'Medal', 'Team', 'Year']
+
+def dataframe_records_body(rows):
+    """
+    Body built the way the handler used to, a DataFrame of the page converted into a dict per row
+    """
+    page_df = get_dataset().iloc[rows][SPORTSMEN_COLUMNS]
+    page_df.columns = page_df.columns.str.lower()
+
+    return json.dumps({'items': page_df.to_dict(orient='records')}).encode("utf-8")
+
+def format_body(rows, response_format):
+    """
+    Body of the format as sent to API Gateway, msgpack is base64 encoded like in the handler
+    """
+    columns = get_columnar_rows(SPORTSMEN_COLUMNS).columns(rows)
+
+    if response_format == MSGPACK_FORMAT:
+        return base64.b64encode(encode_msgpack({'items': columns}))
+
+    items = columns if response_format == COLUMNAR_FORMAT else columns_to_records(columns)
+
+    return json.dumps({'items': items}).encode("utf-8")
+
+# Ways to build the body of a page of rows, the first one is the previous JSON response
+BENCHMARK_ENCODERS = {
+    'dataframe_records': dataframe_records_body,
+    JSON_FORMAT: lambda rows: format_body(rows, JSON_FORMAT),
+    COLUMNAR_FORMAT: lambda rows: format_body(rows, COLUMNAR_FORMAT),
+    MSGPACK_FORMAT: lambda rows: format_body(rows, MSGPACK_FORMAT)
+}
+
+def measure_encoders(rows, repeat):
+    results = {}
+
+    for name, encoder in BENCHMARK_ENCODERS.items():
+        # First call builds the column arrays, it is not part of a request
+        body = encoder(rows)
+        timings = []
+
+        for _ in range(repeat):
+            start = time.perf_counter()
+            encoder(rows)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        results[name] = (len(body), np.percentile(timings, 50), np.percentile(timings, 95))
+
+    return results
+
+def run_benchmark(page_sizes, repeat):
+    # Pages follow the medal order of the handler
+    sorted_rows = get_medal_order_permutation().sorted_rows(None)
+
+    print(f"Dataset rows: {len(sorted_rows)}")
+
+    for page_size in page_sizes:
+        rows = sorted_rows[:page_size]
+        results = measure_encoders(rows, repeat)
+        baseline_bytes = results['dataframe_records'][0]
+
+        print(f"\nPage of {len(rows)} rows")
+        print(f"{'format':<20}{'bytes':>12}{'vs records':>12}{'p50 (ms)':>12}{'p95 (ms)':>12}")
+
+        for name, (size, p50, p95) in results.items():
+            print(f"{name:<20}{size:>12}{size / baseline_bytes:>12.2f}{p50:>12.3f}{p95:>12.3f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report payload size and serialization time of the sportsmen response formats")
+    parser.add_argument("--page-sizes", nargs="+", type=int, default=[50, 1000, 10000], help="Rows of the benchmarked pages")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs of every encoder")
+    args = parser.parse_args()
+
+    run_benchmark(args.page_sizes, args.repeat)
@@ -0,0 +1,51 @@
+import argparse
+import os
+import pandas as pd
+
+from common.dataset import (
+    DATASET_PATH,
+    DATASET_ARTIFACT_PATH,
+    load_csv_dataset,
+    file_sha256,
+    get_memory_report,
+    write_columnar_dataset
+)
+
+def get_directory_size(path):
+    total_size = 0
+
+    for root, _, files in os.walk(path):
+        for file in files:
+            total_size += os.path.getsize(os.path.join(root, file))
+
+    return total_size
+
+def print_memory_report(raw_dataset, encoded_dataset):
+    report = get_memory_report(raw_dataset, encoded_dataset)
+
+    print(f"{'column':<12}{'before (bytes)':>18}{'after (bytes)':>18}")
+    for column, usage in report.items():
+        print(f"{column:<12}{usage['before']:>18}{usage['after']:>18}")
+
+def build_columnar_dataset(source, output):
+    print(f"Reading dataset from {source}")
+    dataset = load_csv_dataset(source)
+
+    print(f"Writing columnar dataset to {output}")
+    manifest = write_columnar_dataset(dataset, output, file_sha256(source))
+
+    print_memory_report(pd.read_csv(source), dataset)
+
+    csv_size = os.path.getsize(source)
+    artifact_size = get_directory_size(output)
+
+    print(f"Rows: {manifest['rows']}")
+    print(f"CSV size: {csv_size / 1024 / 1024:.2f} MB, columnar size: {artifact_size / 1024 / 1024:.2f} MB")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert the sports dataset CSV into the columnar artifact used by the lambdas")
+    parser.add_argument("--source", default=DATASET_PATH, help="Path to the dataset CSV")
+    parser.add_argument("--output", default=DATASET_ARTIFACT_PATH, help="Directory where the columnar artifact is written")
+    args = parser.parse_args()
+
+    build_columnar_dataset(args.source, args.output)
@@ -0,0 +1,122 @@
+import os
+
+import numpy as np
+
+# Columns of the medal counts, anything that is not a medal is counted as "No medal"
+MEDAL_COLUMNS = ['Gold', 'Silver', 'Bronze', 'No medal']
+
+AGGREGATE_ARRAYS = ['years', 'year_counts', 'team_counts', 'athlete_counts']
+
+def medal_index_per_code(medal_dictionary):
+    """
+    Return the position in MEDAL_COLUMNS of every code of the Medal dictionary
+    """
+    index_per_code = np.full(len(medal_dictionary), MEDAL_COLUMNS.index('No medal'), dtype=np.int8)
+
+    for code, medal in enumerate(medal_dictionary):
+        if medal in MEDAL_COLUMNS:
+            index_per_code[code] = MEDAL_COLUMNS.index(medal)
+
+    return index_per_code
+
+def count_medals(codes, medal_index, size):
+    """
+    Return (size, MEDAL_COLUMNS) counts of the given rows with a single bincount
+    """
+    flat_index = codes.astype(np.int64) * len(MEDAL_COLUMNS) + medal_index
+
+    return np.bincount(flat_index, minlength=size * len(MEDAL_COLUMNS)).reshape(size, len(MEDAL_COLUMNS))
+
+def add_padded(counts, other_counts):
+    """
+    Return the sum of two count arrays indexed by dictionary code, the shorter one is padded with zeros
+    """
+    if len(counts) < len(other_counts):
+        counts, other_counts = other_counts, counts
+
+    total = counts.copy()
+    total[:len(other_counts)] += other_counts
+
+    return total
+
+class DatasetAggregates:
+    """
+    Medal counts per year, per team and per athlete (the team axis follows the Team dictionary and the
+    athlete axis is indexed by player_id). They are stored with the columnar artifact, so appending rows
+    only counts the new rows. Medals per year, the leaderboard of all sports and years and the
+    athlete rankings are read from them instead of counting the rows again.
+    """
+    def __init__(self, years, year_counts, team_counts, athlete_counts):
+        """
+        Initialize aggregates
+
+        years: sorted Games years, first axis of year_counts
+        year_counts, team_counts, athlete_counts: arrays of shape (..., MEDAL_COLUMNS)
+        """
+        self.years = years
+        self.year_counts = year_counts
+        self.team_counts = team_counts
+        self.athlete_counts = athlete_counts
+
+    @classmethod
+    def count(cls, year_values, team_codes, player_ids, medal_index, team_count):
+        """
+        Count rows given as arrays of years, Team codes, player ids and positions in MEDAL_COLUMNS
+        """
+        years, year_index = np.unique(year_values, return_inverse=True)
+        athlete_count = int(player_ids.max()) + 1 if len(player_ids) > 0 else 0
+
+        return cls(
+            years,
+            count_medals(year_index, medal_index, len(years)),
+            count_medals(team_codes, medal_index, team_count),
+            count_medals(player_ids, medal_index, athlete_count)
+        )
+
+    @classmethod
+    def from_dataset(cls, dataset):
+        """
+        Count the rows of a dataset with categorical columns
+        """
+        medal_index = medal_index_per_code(dataset['Medal'].cat.categories)[dataset['Medal'].cat.codes.to_numpy()]
+
+        return cls.count(
+            dataset['Year'].to_numpy(),
+            dataset['Team'].cat.codes.to_numpy(),
+            dataset['player_id'].to_numpy(),
+            medal_index,
+            len(dataset['Team'].cat.categories)
+        )
+
+    def merged(self, other):
+        """
+        Return aggregates of the rows of both, dictionaries are append-only so the Team codes
+        of the older aggregates are still valid for the newer ones
+        """
+        years = np.union1d(self.years, other.years)
+        year_counts = np.zeros((len(years), len(MEDAL_COLUMNS)), dtype=np.int64)
+        year_counts[np.searchsorted(years, self.years)] += self.year_counts
+        year_counts[np.searchsorted(years, other.years)] += other.year_counts
+
+        return DatasetAggregates(
+            years,
+            year_counts,
+            add_padded(self.team_counts, other.team_counts),
+            add_padded(self.athlete_counts, other.athlete_counts)
+        )
+
+    def reordered(self, team_order):
+        """
+        Return aggregates whose team axis follows the given code order
+        """
+        return DatasetAggregates(self.years, self.year_counts, self.team_counts[team_order], self.athlete_counts)
+
+    def save(self, path):
+        os.makedirs(path, exist_ok=True)
+
+        for name in AGGREGATE_ARRAYS:
+            np.save(os.path.join(path, f"{name}.npy"), getattr(self, name))
+
+    @classmethod
+    def load(cls, path):
+        return cls(*(np.load(os.path.join(path, f"{name}.npy")) for name in AGGREGATE_ARRAYS))
@@ -0,0 +1,119 @@
+import logging
+
+import numpy as np
+
+from common.dataset import get_derived
+from common.aggregates import (
+    MEDAL_COLUMNS,
+    medal_index_per_code
+)
+
+logger = logging.getLogger("SportsAthleteCareers")
+logger.setLevel(logging.INFO)
+
+# String columns of the career timeline
+TIMELINE_COLUMNS = ['Sex', 'Season', 'City', 'Team', 'NOC', 'Sport', 'Event', 'Medal']
+
+class AthleteCareers:
+    """
+    Rows of every athlete (player_id) in CSR layout, the rows of the athlete with code c are
+    rows[offsets[c]:offsets[c + 1]] in the order of the Games. Athlete codes follow the sorted player ids,
+    athletes sharing a name keep separate codes.
+    """
+    def __init__(self, dataset):
+        self.player_ids, row_codes = np.unique(dataset['player_id'].to_numpy(), return_inverse=True)
+
+        # Athlete code of every dataset row
+        self.row_codes = row_codes.astype(np.int32)
+
+        # Rows are sorted by year but ingested rows are appended, a lexsort puts every career in
+        # (year, season) order and keeps the order of the dataset within the same Games
+        self.rows = np.lexsort((
+            dataset['Season'].cat.codes.to_numpy(),
+            dataset['Year'].to_numpy(),
+            self.row_codes
+        )).astype(np.int32)
+
+        self.offsets = np.zeros(len(self.player_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.row_codes, minlength=len(self.player_ids)), out=self.offsets[1:])
+
+        # A player id has one name, the one of its first row
+        self.names = dataset['Name'].cat.categories
+        self.name_codes = dataset['Name'].cat.codes.to_numpy()[self.rows[self.offsets[:-1]]]
+
+        # Codes and dictionaries of the columns of a timeline, a profile only indexes them with the career rows
+        self.years = dataset['Year'].to_numpy()
+        self.codes = {column: dataset[column].cat.codes.to_numpy() for column in TIMELINE_COLUMNS}
+        self.dictionaries = {column: dataset[column].cat.categories for column in TIMELINE_COLUMNS}
+        self.medal_index = medal_index_per_code(dataset['Medal'].cat.categories)
+
+        logger.info(f"Careers of {len(self.player_ids)} athletes, index size: {self.rows.nbytes + self.offsets.nbytes + self.player_ids.nbytes} bytes")
+
+    def __len__(self):
+        return len(self.player_ids)
+
+    def player_code(self, player_id):
+        """
+        Return the athlete code of the player id, None when the player id is not in the dataset
+        """
+        code = int(np.searchsorted(self.player_ids, player_id))
+
+        if code == len(self.player_ids) or self.player_ids[code] != player_id:
+            return None
+
+        return code
+
+    def player_names(self, codes):
+        return self.names[self.name_codes[codes]]
+
+    def career_rows(self, code):
+        """
+        Return the dataset rows of the athlete in the order of the Games
+        """
+        return self.rows[self.offsets[code]:self.offsets[code + 1]]
+
+    def timeline(self, code):
+        """
+        Return the profile of an athlete: medal counts and the events of every Games.
+        Only the rows of the career are read, the cost follows the length of the career.
+        """
+        rows = self.career_rows(code)
+        values = {
+            column: self.dictionaries[column][self.codes[column][rows]].tolist()
+            for column in TIMELINE_COLUMNS
+        }
+        medal_index = self.medal_index[self.codes['Medal'][rows]]
+        medal_counts = np.bincount(medal_index, minlength=len(MEDAL_COLUMNS)).tolist()
+
+        games = []
+        for position, year in enumerate(self.years[rows].tolist()):
+            if not games or (games[-1]['year'], games[-1]['season']) != (year, values['Season'][position]):
+                games.append({
+                    'year': year,
+                    'season': values['Season'][position],
+                    'city': values['City'][position],
+                    'team': values['Team'][position],
+                    'noc': values['NOC'][position],
+                    'events': []
+                })
+
+            games[-1]['events'].append({
+                'sport': values['Sport'][position],
+                'event': values['Event'][position],
+                'medal': MEDAL_COLUMNS[medal_index[position]]
+            })
+
+        return {
+            'player_id': int(self.player_ids[code]),
+            'name': self.names[self.name_codes[code]],
+            'sex': values['Sex'][0],
+            'gold': medal_counts[0],
+            'silver': medal_counts[1],
+            'bronze': medal_counts[2],
+            'no_medal': medal_counts[3],
+            'appearances': len(rows),
+            'games': games
+        }
+
+def get_athlete_careers():
+    return get_derived("athlete_careers", AthleteCareers)
@@ -0,0 +1,184 @@
+import logging
+
+import numpy as np
+
+from common.dataset import (
+    get_derived,
+    get_dataset_aggregates,
+    get_zone_maps
+)
+from common.aggregates import (
+    MEDAL_COLUMNS,
+    count_medals
+)
+from common.medal_cube import YearPrefixCounts
+from common.athlete_careers import get_athlete_careers
+from common.medal_facts import get_medal_facts
+
+logger = logging.getLogger("SportsAthleteRankings")
+logger.setLevel(logging.INFO)
+
+# Every ranking key gets 15 bits of the composite score (gold, silver, bronze, appearances),
+# so the packed score stays positive in an int64
+SCORE_KEY_BITS = 15
+
+class AthleteAppearances:
+    """
+    Participations (rows with or without a medal) of every athlete code, as prefix counts over the Games years.
+    Appearances filtered by sport are counted from the rows of the row groups that can match.
+    """
+    def __init__(self, dataset):
+        athlete_careers = get_athlete_careers()
+
+        self.player_codes = athlete_careers.row_codes
+        self.sport_codes = dataset['Sport'].cat.codes.to_numpy()
+        self.row_years = dataset['Year'].to_numpy()
+        self.zone_maps = get_zone_maps()
+
+        player_count = len(athlete_careers)
+        years, year_index = np.unique(self.row_years, return_inverse=True)
+
+        counts = np.bincount(
+            year_index.astype(np.int64) * player_count + self.player_codes,
+            minlength=len(years) * player_count
+        ).reshape(len(years), player_count)
+
+        self.year_counts = YearPrefixCounts(years, counts)
+
+    def appearances(self, min_year, max_year, sport_codes=None):
+        """
+        Return the number of rows of every athlete in the inclusive year range and the given sports
+        """
+        if sport_codes is None:
+            return self.year_counts.range_counts(min_year, max_year)
+
+        player_codes = []
+
+        for start, end in self.zone_maps.row_ranges(min_year, max_year, sport_codes):
+            mask = (self.row_years[start:end] >= min_year) & (self.row_years[start:end] <= max_year)
+            mask &= np.isin(self.sport_codes[start:end], sport_codes)
+
+            player_codes.append(self.player_codes[start:end][mask])
+
+        return np.bincount(
+            np.concatenate(player_codes) if player_codes else np.empty(0, dtype=np.int64),
+            minlength=self.year_counts.prefix.shape[1]
+        )
+
+class AthleteMedalCounts:
+    """
+    Medal counts of every athlete code (sorted player ids of the dataset) and the athletes
+    presorted by gold, silver, bronze and appearances over the whole dataset
+    """
+    def __init__(self, dataset):
+        athlete_careers = get_athlete_careers()
+
+        self.player_ids = athlete_careers.player_ids
+        self.names = athlete_careers.player_names(np.arange(len(athlete_careers)))
+        self.sports = dataset['Sport'].cat.categories
+        self.years = dataset['Year'].to_numpy()
+
+        # Counts of the whole dataset are kept up to date by ingestion, no need to count them again
+        self.counts = get_dataset_aggregates().athlete_counts[self.player_ids]
+        self.ranking = rank_athletes(self.counts)
+
+    def sport_codes(self, list_of_sports):
+        """
+        Return Sport category codes of the sports that exist, unknown sports are ignored
+        """
+        indexer = self.sports.get_indexer(list_of_sports)
+
+        return indexer[indexer >= 0]
+
+    def is_whole_dataset(self, min_year, max_year, sport_codes):
+        return sport_codes is None and min_year <= self.years.min() and max_year >= self.years.max()
+
+    def filtered_counts(self, min_year, max_year, sport_codes=None):
+        """
+        Return per-athlete counts in the year range and the given sports, medals are counted
+        from the medal facts and "No medal" is what is left of the appearances
+        """
+        medal_facts = get_medal_facts()
+        year_slice = medal_facts.year_slice(min_year, max_year)
+
+        player_codes = medal_facts.player_codes[year_slice]
+        medals = medal_facts.medals[year_slice]
+
+        if sport_codes is not None:
+            mask = np.isin(medal_facts.sport_codes[year_slice], sport_codes)
+            player_codes = player_codes[mask]
+            medals = medals[mask]
+
+        counts = count_medals(player_codes, medals, len(self.player_ids))
+        counts[:, MEDAL_COLUMNS.index('No medal')] = get_athlete_appearances().appearances(min_year, max_year, sport_codes) - row_totals(counts)
+
+        return counts
+
+    def top(self, min_year, max_year, sport_codes=None, k=5):
+        """
+        Return (athlete codes, counts) of the best k athletes
+        """
+        if self.is_whole_dataset(min_year, max_year, sport_codes):
+            # Presorted once, the first k athletes are the answer
+            top_codes = self.ranking[:k]
+
+            return top_codes, self.counts[top_codes]
+
+        counts = self.filtered_counts(min_year, max_year, sport_codes)
+        top_codes = top_k_athletes(counts, k)
+
+        return top_codes, counts[top_codes]
+
+def row_totals(counts):
+    """
+    Return the sum of every row of the counts, adding the few columns is much faster than sum(axis=1)
+    """
+    totals = counts[:, 0].copy()
+
+    for column in range(1, counts.shape[1]):
+        totals += counts[:, column]
+
+    return totals
+
+def ranking_scores(counts):
+    """
+    Pack gold, silver, bronze and appearances into one sortable int64 per athlete
+    """
+    limit = (1 << SCORE_KEY_BITS) - 1
+    keys = [counts[:, 0], counts[:, 1], counts[:, 2], row_totals(counts)]
+
+    scores = np.zeros(len(counts), dtype=np.int64)
+    for key in keys:
+        scores = (scores << SCORE_KEY_BITS) | np.minimum(key, limit).astype(np.int64)
+
+    return scores
+
+def rank_athletes(counts):
+    """
+    Return athlete codes sorted by score, ties keep the code (player id) order
+    """
+    return np.argsort(-ranking_scores(counts), kind='stable')
+
+def top_k_athletes(counts, k):
+    """
+    Return codes of the best k athletes using partial selection, only athletes that can
+    be in the top k (score at least the k-th best score) are sorted. Athletes without
+    any row in the counts are never returned.
+    """
+    scores = ranking_scores(counts)
+
+    if k >= len(scores):
+        kth_score = 1
+    else:
+        kth_score = max(np.partition(scores, len(scores) - k)[len(scores) - k], 1)
+
+    candidates = np.flatnonzero(scores >= kth_score)
+
+    # Candidates are in ascending code order, a stable sort keeps ties in player id order
+    return candidates[np.argsort(-scores[candidates], kind='stable')][:k]
+
+def get_athlete_medal_counts():
+    return get_derived("athlete_medal_counts", AthleteMedalCounts)
+
+def get_athlete_appearances():
+    return get_derived("athlete_appearances", AthleteAppearances)
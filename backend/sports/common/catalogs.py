@@ -0,0 +1,102 @@
+import bisect
+import hashlib
+import json
+import logging
+
+import numpy as np
+
+from common.dataset import get_derived
+from common.medal_facts import get_medal_facts
+from common.inverted_index import normalize_value
+
+logger = logging.getLogger("SportsCatalogs")
+logger.setLevel(logging.INFO)
+
+# Catalog name of the endpoint and the column of its distinct values
+CATALOG_COLUMNS = {
+    'sports': 'Sport',
+    'events': 'Event',
+    'teams': 'Team',
+    'cities': 'City'
+}
+
+# Last code point, every string starting with a prefix sorts before prefix + PREFIX_END
+PREFIX_END = chr(0x10FFFF)
+
+class Catalog:
+    """
+    Distinct values of a column with their row and medal counts, sorted by the normalized value
+    so a prefix is a contiguous range found by binary search
+    """
+    def __init__(self, values, rows, medals):
+        """
+        Initialize a catalog
+
+        values: distinct values of the column
+        rows, medals: number of rows and of medal rows of every value
+        """
+        order = sorted(range(len(values)), key=lambda position: (normalize_value(values[position]), values[position]))
+
+        # Values without any row (left in the dictionary by ingestion) are not listed
+        self.items = [
+            {
+                'value': values[position],
+                'rows': int(rows[position]),
+                'medals': int(medals[position])
+            }
+            for position in order
+            if rows[position] > 0
+        ]
+        self.keys = [normalize_value(item['value']) for item in self.items]
+
+        # Strong validator of the content, changes whenever a value or a count changes
+        self.etag = hashlib.sha256(json.dumps(self.items, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def __len__(self):
+        return len(self.items)
+
+    def search(self, prefix=""):
+        """
+        Return the items whose value starts with the prefix, ignoring case
+        """
+        prefix = normalize_value(prefix)
+
+        start = bisect.bisect_left(self.keys, prefix)
+        end = bisect.bisect_left(self.keys, prefix + PREFIX_END, lo=start)
+
+        return self.items[start:end]
+
+class Catalogs:
+    """
+    Catalog of every column of CATALOG_COLUMNS
+    """
+    def __init__(self, dataset):
+        medal_facts = get_medal_facts()
+
+        self.catalogs = {}
+
+        for name, column in CATALOG_COLUMNS.items():
+            categories = dataset[column].cat.categories
+            codes = dataset[column].cat.codes.to_numpy()
+
+            self.catalogs[name] = Catalog(
+                categories.tolist(),
+                np.bincount(codes, minlength=len(categories)),
+                np.bincount(codes[medal_facts.row_ids], minlength=len(categories))
+            )
+
+        logger.info(f"Catalogs: { {name: len(catalog) for name, catalog in self.catalogs.items()} }")
+
+    def __getitem__(self, name):
+        return self.catalogs[name]
+
+def catalog_etag(catalog, prefix, limit):
+    """
+    Return the strong ETag of a catalog response, from the content of the catalog and the query
+    """
+    query = json.dumps([catalog.etag, normalize_value(prefix), limit])
+
+    return f'"{hashlib.sha256(query.encode("utf-8")).hexdigest()[:32]}"'
+
+def get_catalogs():
+    return get_derived("catalogs", Catalogs)
@@ -1,4 +1,5 @@
 from datetime import datetime, timezone, timedelta
+from boto3 import client
 from os import environ
 import jwt
 import logging
@@ -6,12 +7,35 @@ import bcrypt
 import boto3
 import logging
 import json
+import time
+import base64
 
 from aws_lambda_powertools.middleware_factory import lambda_handler_decorator
+from common.dataset import get_dataset_cache_stats
+from common.result_cache import get_result_cache
 
 logger = logging.getLogger("SportsCommon")
 logger.setLevel(logging.INFO)
 
+# Responses are only served to logged in users, browsers keep them but revalidate the ETag before every use
+RESPONSE_CACHE_CONTROL = environ.get("RESPONSE_CACHE_CONTROL", "private, no-cache")
+
+_LAMBDA_S3_CLIENT_FOR_SPORTS_EXPORTS = {
+    "client": client("s3", region_name=environ.get("AWS_REGION", "eu-central-1")),
+    "bucket_name": environ.get("SPORTS_EXPORTS_BUCKET", "test_exports_bucket")
+}
+
+class LambdaS3Class:
+    """
+    AWS S3 Resource Class
+    """
+    def __init__(self, lambda_s3_client):
+        """
+        Initialize an S3 Resource
+        """
+        self.client = lambda_s3_client["client"]
+        self.bucket_name = lambda_s3_client["bucket_name"]
+
 class ValidationError(Exception):
     """An error that should be thrown when validation on the request fails."""
     def __init__(self, message="Invalid request data"):
@@ -67,7 +91,12 @@ def lambda_middleware(handler, event, context):
             event['headers'].pop('Authorization', None)
             event['headers'].pop('authorization', None)
 
-        return handler(event, context)
+        start = time.perf_counter()
+        response = handler(event, context)
+
+        logger.info(f"Handler finished in {(time.perf_counter() - start) * 1000:.2f} ms, dataset cache stats: {get_dataset_cache_stats()}, result cache stats: {get_result_cache().get_stats()}")
+
+        return response
     except ValidationError as e:
         logger.error(f"Error in the handler: {e}")
 
@@ -226,15 +255,63 @@ def get_secrets_from_aws_secrets_manager(secret_id, region_name):
         logger.error(f'Failed to retrieve secrets: {str(e)}')
         return None
 
-def build_response(status_code, body, headers=None):
+def get_header(event, name):
+    """
+    Return the value of a request header or None, header names are case insensitive
+    """
+    for header, value in (event.get('headers') or {}).items():
+        if header.lower() == name.lower():
+            return value
+
+    return None
+
+def is_not_modified(event, etag):
+    """
+    Return True when the If-None-Match header of the request lists the ETag (or is *),
+    weak validators match too as If-None-Match uses the weak comparison
+    """
+    if_none_match = get_header(event, "If-None-Match")
+
+    if not if_none_match:
+        return False
+
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+def build_response(status_code, body, headers=None, etag=None):
+    """
+    Build the API Gateway response, headers are added to the JSON content type.
+    With an ETag the response also carries the ETag and Cache-Control headers.
+    A None body is sent empty, as a 304 Not Modified requires.
+    """
+    if etag is not None:
+        headers = {
+            'ETag': etag,
+            'Cache-Control': RESPONSE_CACHE_CONTROL,
+            **(headers or {})
+        }
+
     return {
         'statusCode': status_code,
-        headers if headers else 'headers': {
-            'Content-Type': 'application/json'
+        'headers': {
+            'Content-Type': 'application/json',
+            **(headers or {})
         },
-        'body': json.dumps(body)
+        'body': json.dumps(body) if body is not None else ""
     }
 
+def build_binary_response(status_code, payload, content_type, etag=None):
+    """
+    Build the API Gateway response of a binary body (bytes), API Gateway expects it base64 encoded
+    """
+    response = build_response(status_code, None, {'Content-Type': content_type}, etag)
+
+    response['body'] = base64.b64encode(payload).decode("ascii")
+    response['isBase64Encoded'] = True
+
+    return response
+
 def hash_password(password, salt_rounds=5):
     salt = bcrypt.gensalt(rounds=salt_rounds)
     return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
@@ -0,0 +1,153 @@
+import logging
+
+import numpy as np
+
+from common.dataset import get_derived
+from common.medal_cube import YearPrefixCounts
+from common.medal_facts import get_event_medals
+
+logger = logging.getLogger("SportsContinents")
+logger.setLevel(logging.INFO)
+
+continent_map = {
+    'asia': ['China', 'Iran', 'Pakistan', 'India', 'Malaysia', 'Japan', 'Thailand', 'Indonesia', 'Philippines', 
+             'Singapore', 'Uzbekistan', 'Kyrgyzstan', 'Tajikistan', 'Kazakhstan', 'Brunei', 'Turkmenistan', 
+             'Saudi Arabia', 'Syria', 'Maldives', 'United Arab Emirates', 'North Yemen', 'Lebanon', 'Qatar', 
+             'Jordan', 'Palestine', 'Bahrain', 'Kuwait', 'Iraq', 'Afghanistan', 'Mongolia', 'Bangladesh', 
+             'Sri Lanka', 'Nepal', 'Vietnam', 'Myanmar', 'Yemen', 'Oman', 'Cambodia', 'Bhutan', 'Chinese Taipei'],
+    
+    'europe': ['Denmark', 'Sweden', 'Netherlands', 'Finland', 'Norway', 'Romania', 'Estonia', 'France', 'Spain', 
+               'Bulgaria', 'Italy', 'Russia', 'Belarus', 'Greece', 'Turkey', 'Germany', 'Ireland', 'Belgium', 
+               'Portugal', 'Slovenia', 'Luxembourg', 'Czech Republic', 'Poland', 'Hungary', 'Ukraine', 'Iceland', 
+               'Switzerland', 'Austria', 'Lithuania', 'Cyprus', 'Slovakia', 'Latvia', 'Moldova', 'Serbia', 
+               'Montenegro', 'Bosnia and Herzegovina', 'Croatia', 'Macedonia', 'Albania', 'Andorra', 'San Marino', 
+               'Liechtenstein', 'Monaco', 'Great Britain', 'Soviet Union', 'Unified Team'],
+
+    'africa': ['Morocco', 'Egypt', 'Chad', 'Sudan', 'Algeria', 'Ethiopia', 'Eritrea', 'Tanzania', 'Tunisia', 'Libya', 
+               'Djibouti', 'Comoros', 'Mauritius', 'Seychelles', 'Nigeria', 'Cameroon', "Cote d'Ivoire", 'Kenya', 
+               'Benin', 'Ghana', 'Somalia', 'Niger', 'Mali', 'Uganda', 'Angola', 'South Africa', 'Senegal', 'Togo', 
+               'Namibia', 'Guinea', 'Guinea Bissau', 'Burkina Faso', 'Mozambique', 'Madagascar', 'Rwanda', 
+               'Equatorial Guinea', 'Central African Republic', 'Botswana', 'Liberia', 'Sierra Leone', 'Gambia', 
+               'Zimbabwe', 'Zambia', 'Malawi', 'Burundi', 'Sao Tome and Principe', 'Swaziland'],
+
+    'north_america': ['United States', 'Canada', 'Mexico', 'Cuba', 'Nicaragua', 'Costa Rica', 'Panama', 'Jamaica', 
+                      'Haiti', 'Dominican Republic', 'Puerto Rico', 'Honduras', 'El Salvador', 'Guatemala', 
+                      'Bahamas', 'Trinidad and Tobago', 'Belize', 'Saint Kitts and Nevis', 'Saint Vincent and the Grenadines', 
+                      'Dominica', 'Barbados', 'Bermuda', 'Saint Lucia', 'Cayman Islands', 'Antigua and Barbuda', 
+                      'United States Virgin Islands', 'British Virgin Islands', 'West Indies Federation', 'Greenland'],
+
+    'south_america': ['Argentina', 'Chile', 'Brazil', 'Venezuela', 'Colombia', 'Paraguay', 'Peru', 'Guyana', 'Uruguay', 
+                      'Ecuador', 'Suriname', 'Bolivia'],
+
+    'australia': ['Australia', 'New Zealand', 'Fiji', 'Papua New Guinea', 'Vanuatu', 'Solomon Islands', 'Samoa', 
+                'American Samoa', 'Palau', 'Marshall Islands', 'Micronesia', 'Kiribati', 'Nauru', 'Tuvalu']
+}
+
+CONTINENTS = sorted(continent_map)
+
+# Reverse lookup, every country points to its continent
+continent_per_country = {
+    country: continent
+    for continent, countries in continent_map.items()
+    for country in countries
+}
+
+UNKNOWN_CONTINENT = -1
+
+continent_resolution_stats = {
+    "unknown_teams": 0,
+    "unknown_rows": 0
+}
+
+def get_continent(country):
+    """
+    Return the continent of the team or None when it is unknown
+    """
+    # Handling combined country names like "Denmark/Sweden", the first known part wins
+    if '/' in country:
+        for part in country.split('/'):
+            continent = continent_per_country.get(part.strip())
+
+            if continent:
+                return continent
+
+        return None
+
+    return continent_per_country.get(country)
+
+def continent_code_per_team(teams):
+    """
+    Return the continent code (position in CONTINENTS, -1 for unknown) of every team
+    """
+    continent_index = {continent: code for code, continent in enumerate(CONTINENTS)}
+
+    return np.array(
+        [continent_index.get(get_continent(team), UNKNOWN_CONTINENT) for team in teams],
+        dtype=np.int8
+    )
+
+class ContinentCodes:
+    """
+    Continent code of every dataset row (position in CONTINENTS, -1 for unknown teams)
+    and the participation counts per (year, continent) as prefix sums
+    """
+    def __init__(self, dataset):
+        teams = dataset['Team']
+
+        # Every distinct team is resolved once, rows only look up the code of their team
+        code_per_team = continent_code_per_team(teams.cat.categories)
+
+        self.codes = code_per_team[teams.cat.codes.to_numpy()]
+        self.unknown_teams = [team for team, code in zip(teams.cat.categories, code_per_team) if code == UNKNOWN_CONTINENT]
+
+        known_rows = self.codes != UNKNOWN_CONTINENT
+
+        continent_resolution_stats["unknown_teams"] = len(self.unknown_teams)
+        continent_resolution_stats["unknown_rows"] = int(np.count_nonzero(~known_rows))
+
+        logger.warning(f"Teams without a continent: {continent_resolution_stats}, first teams: {self.unknown_teams[:20]}")
+
+        self.year_counts, self.unknown_year_counts = count_per_year_continent(
+            np.unique(dataset['Year'].to_numpy()),
+            dataset['Year'].to_numpy(),
+            self.codes
+        )
+
+class EventContinentCounts:
+    """
+    Event medals (team members count once) per (year, continent) as prefix sums, with the same
+    attributes as ContinentCodes
+    """
+    def __init__(self, dataset):
+        event_medals = get_event_medals()
+        code_per_team = continent_code_per_team(dataset['Team'].cat.categories)
+
+        self.year_counts, self.unknown_year_counts = count_per_year_continent(
+            np.unique(dataset['Year'].to_numpy()),
+            event_medals.years,
+            code_per_team[event_medals.team_codes]
+        )
+
+def count_per_year_continent(years, row_years, row_codes):
+    """
+    Return prefix counts of the rows per (year, continent) and of the rows without a continent per year
+    """
+    known_rows = row_codes != UNKNOWN_CONTINENT
+    year_index = np.searchsorted(years, row_years[known_rows])
+
+    # Number of rows per (year, continent) as a single bincount
+    counts = np.bincount(
+        year_index * len(CONTINENTS) + row_codes[known_rows],
+        minlength=len(years) * len(CONTINENTS)
+    ).reshape(len(years), len(CONTINENTS))
+
+    return (
+        YearPrefixCounts(years, counts),
+        YearPrefixCounts(years, np.bincount(np.searchsorted(years, row_years[~known_rows]), minlength=len(years)))
+    )
+
+def get_continent_codes():
+    return get_derived("continent_codes", ContinentCodes)
+
+def get_event_continent_counts():
+    return get_derived("event_continent_counts", EventContinentCounts)
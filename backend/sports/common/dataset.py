@@ -0,0 +1,510 @@
+"""
+Container wide cache of the sports dataset and of the structures derived from it.
+
+Importing this module enables pandas copy-on-write for the whole process. Views handed out
+by the cache share memory with the cached frame, copy-on-write makes sure that handlers adding
+or overwriting columns never touch the cached data. Every handler imports the dataset through
+this module, so the option is always set before the first frame is built.
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import namedtuple
+from os import environ
+
+import numpy as np
+import pandas as pd
+
+from common.aggregates import DatasetAggregates
+from common.zone_maps import (
+    ZoneMaps,
+    zone_map_row_groups
+)
+
+logger = logging.getLogger("SportsDataset")
+logger.setLevel(logging.INFO)
+
+# Process wide side effect of the import, see the module docstring
+pd.set_option("mode.copy_on_write", True)
+
+DATASET_PATH = environ.get("DATASET_PATH", "common/dataset.csv")
+DATASET_ARTIFACT_PATH = environ.get("DATASET_ARTIFACT_PATH", "common/dataset_columnar")
+
+ARTIFACT_FORMAT_VERSION = 4
+ARTIFACT_MANIFEST_FILE = "manifest.json"
+
+COLUMNS = ['player_id', 'Name', 'Sex', 'Team', 'NOC', 'Year', 'Season', 'City', 'Sport', 'Event', 'Medal']
+STRING_COLUMNS = ['Name', 'Sex', 'Team', 'NOC', 'Season', 'City', 'Sport', 'Event', 'Medal']
+INTEGER_COLUMNS = ['player_id', 'Year']
+
+# Order of the prepared rows, year ranges and sports are then contiguous row ranges
+SORT_COLUMNS = ['Year', 'Sport', 'Medal']
+
+# Narrow types of the numeric columns, used in memory and in the columnar artifact
+INTEGER_COLUMN_DTYPES = {
+    'player_id': 'int32',
+    'Year': 'int16'
+}
+
+# Dataset together with where it came from, version of the artifact manifest (None for CSV),
+# the medal aggregates and the zone maps stored in the artifact (None when they have to be computed)
+LoadedDataset = namedtuple("LoadedDataset", ["dataset", "source", "version", "aggregates", "zone_maps"])
+
+_dataset_cache = {
+    "dataset": None,
+    "source": None,
+    "version": None,
+    "aggregates": None,
+    "zone_maps": None,
+    "derived": {}
+}
+
+_dataset_cache_stats = {
+    "hits": 0,
+    "misses": 0,
+    "load_time_ms": None,
+    "loaded_at": None,
+    "rows": 0,
+    "derived_build_time_ms": {}
+}
+
+def load_dataset(csv_path=DATASET_PATH, artifact_path=DATASET_ARTIFACT_PATH):
+    """
+    Load the dataset from the prebuilt columnar artifact, falling back to the CSV
+    when the artifact is missing or was built from a different CSV
+    """
+    manifest = read_artifact_manifest(artifact_path)
+
+    if manifest is None:
+        logger.warning(f"Columnar artifact not found in {artifact_path}, falling back to CSV")
+        return LoadedDataset(load_csv_dataset(csv_path), "csv", None, None, None)
+
+    # The CSV is not packaged together with the artifact (the Makefile removes it from the build),
+    # so this check and its fallback only apply to local runs and tests where the CSV is present
+    if os.path.exists(csv_path) and file_sha256(csv_path) != manifest["source_sha256"]:
+        logger.warning(f"Columnar artifact in {artifact_path} is stale, falling back to CSV")
+        return LoadedDataset(load_csv_dataset(csv_path), "csv", None, None, None)
+
+    dataset, aggregates, zone_maps = load_columnar_dataset(artifact_path, manifest)
+
+    return LoadedDataset(dataset, "columnar", manifest["version"], aggregates, zone_maps)
+
+def load_csv_dataset(path=DATASET_PATH):
+    """
+    Read the dataset from the CSV file and normalize column types
+    """
+    logger.info(f"Loading dataset from CSV: {path}")
+
+    dataset = pd.read_csv(
+        path,
+        dtype={column: "object" for column in STRING_COLUMNS}
+    )
+
+    return normalize_dataset(dataset)
+
+def normalize_dataset(dataset):
+    """
+    Strip string columns, store them as categoricals (integer codes plus a sorted
+    dictionary of values), narrow the integer columns and sort the rows by SORT_COLUMNS
+    """
+    for column in STRING_COLUMNS:
+        dataset[column] = dataset[column].fillna('').astype(str).str.strip()
+
+    dataset['Medal'] = dataset['Medal'].replace('', 'No medal')
+
+    for column in STRING_COLUMNS:
+        dataset[column] = dataset[column].astype("category")
+
+    for column in INTEGER_COLUMNS:
+        dataset[column] = dataset[column].astype(integer_column_dtype(column, dataset[column]))
+
+    return sort_dataset(dataset)
+
+def sort_dataset(dataset):
+    """
+    Return the rows sorted by SORT_COLUMNS, rows with the same keys keep their order
+    """
+    return dataset.sort_values(SORT_COLUMNS, kind='stable', ignore_index=True)
+
+def integer_column_dtype(column, values):
+    """
+    Return the narrow type configured for the column, or int64 when the values do not fit in it
+    """
+    dtype = np.dtype(INTEGER_COLUMN_DTYPES[column])
+
+    if len(values) > 0 and (values.min() < np.iinfo(dtype).min or values.max() > np.iinfo(dtype).max):
+        return np.dtype(np.int64)
+
+    return dtype
+
+def get_memory_report(raw_dataset, encoded_dataset):
+    """
+    Return bytes used by every column of the raw (object strings, int64) and encoded dataset
+    """
+    before = raw_dataset.memory_usage(deep=True, index=False)
+    after = encoded_dataset.memory_usage(deep=True, index=False)
+
+    report = {
+        column: {
+            "before": int(before[column]),
+            "after": int(after[column])
+        }
+        for column in COLUMNS
+    }
+    report["total"] = {
+        "before": int(before.sum()),
+        "after": int(after.sum())
+    }
+
+    return report
+
+def category_code(series, value):
+    """
+    Return the integer code of the value in a categorical column, or -1 when the value does not exist
+    """
+    categories = series.cat.categories
+
+    return int(categories.get_loc(value)) if value in categories else -1
+
+def category_codes(series, values):
+    """
+    Return integer codes of all the values that exist in a categorical column
+    """
+    categories = series.cat.categories
+    indexer = categories.get_indexer(list(values))
+
+    return indexer[indexer >= 0]
+
+def file_sha256(path):
+    """
+    Return the hex encoded sha256 of the file content
+    """
+    digest = hashlib.sha256()
+
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+def smallest_code_dtype(dictionary_size):
+    """
+    Return the narrowest signed integer type able to index a dictionary of the given size
+    """
+    for dtype in (np.int8, np.int16, np.int32):
+        if dictionary_size <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+
+    return np.dtype(np.int64)
+
+def read_artifact_manifest(artifact_path):
+    """
+    Return the manifest of the columnar artifact or None when there is no usable artifact
+    """
+    manifest_path = os.path.join(artifact_path, ARTIFACT_MANIFEST_FILE)
+
+    if not os.path.exists(manifest_path):
+        return None
+
+    try:
+        with open(manifest_path, "r") as f:
+            manifest = json.load(f)
+    except Exception as e:
+        logger.error(f"Failed to read artifact manifest {manifest_path}: {e}")
+        return None
+
+    if manifest.get("format_version") != ARTIFACT_FORMAT_VERSION:
+        logger.warning(f"Unsupported artifact format version: {manifest.get('format_version')}")
+        return None
+
+    return manifest
+
+def write_columnar_dataset(dataset, artifact_path, source_sha256):
+    """
+    Write the dataset as version 1 of the columnar artifact, a set of .npy arrays where string columns
+    are stored as integer codes into a per-column dictionary, plus the medal aggregates of all the rows.
+    Rows keep the order of the dataset (sorted by SORT_COLUMNS) and every segment lists the min/max
+    values of its row groups. The manifest is written last, so a partially written artifact is never
+    picked up by the loader.
+    """
+    columns = {}
+    values = {}
+    dictionaries = {}
+
+    for column in COLUMNS:
+        if column in STRING_COLUMNS:
+            dictionary_file = f"dictionaries/{column}.json"
+            dictionaries[column] = dataset[column].cat.categories.tolist()
+            write_dictionary(artifact_path, dictionary_file, dictionaries[column])
+
+            columns[column] = {
+                "dictionary": dictionary_file
+            }
+            values[column] = dataset[column].cat.codes.to_numpy()
+        else:
+            columns[column] = {}
+            values[column] = dataset[column].to_numpy()
+
+    aggregates_path = "aggregates/v000001"
+    DatasetAggregates.from_dataset(dataset).save(os.path.join(artifact_path, aggregates_path))
+
+    manifest = {
+        "format_version": ARTIFACT_FORMAT_VERSION,
+        "version": 1,
+        "source_sha256": source_sha256,
+        "rows": len(dataset),
+        "columns": columns,
+        "segments": [
+            write_segment(artifact_path, "segments/000", values, dictionaries)
+        ],
+        "aggregates": aggregates_path,
+        "deltas": []
+    }
+
+    write_artifact_manifest(artifact_path, manifest)
+
+    return manifest
+
+def write_dictionary(artifact_path, dictionary_file, dictionary):
+    """
+    Write the dictionary of a string column as a JSON list with one category per entry, the position
+    of a category is its code on disk. Ingestion only appends new categories to a copy of the list.
+    """
+    os.makedirs(os.path.dirname(os.path.join(artifact_path, dictionary_file)), exist_ok=True)
+
+    with open(os.path.join(artifact_path, dictionary_file), "w") as f:
+        json.dump(dictionary, f)
+
+def read_dictionary(artifact_path, dictionary_file):
+    """
+    Return the categories of a dictionary file as a list of strings in the append-only order of
+    their codes on disk, not sorted
+    """
+    with open(os.path.join(artifact_path, dictionary_file), "r") as f:
+        return json.load(f)
+
+def write_segment(artifact_path, segment_path, values, dictionaries):
+    """
+    Write one .npy array per column, values holds dictionary codes of the string columns
+    and values of the integer columns. Returns the manifest entry of the segment, with
+    the zone maps of its row groups.
+    """
+    os.makedirs(os.path.join(artifact_path, segment_path), exist_ok=True)
+
+    dtypes = {}
+
+    for column in COLUMNS:
+        if column in STRING_COLUMNS:
+            dtype = smallest_code_dtype(int(values[column].max()) + 1 if len(values[column]) > 0 else 0)
+        else:
+            dtype = integer_column_dtype(column, values[column])
+
+        np.save(os.path.join(artifact_path, segment_path, f"{column}.npy"), values[column].astype(dtype))
+        dtypes[column] = str(dtype)
+
+    return {
+        "path": segment_path,
+        "rows": len(values[COLUMNS[0]]),
+        "dtypes": dtypes,
+        "row_groups": zone_map_row_groups(values, dictionaries)
+    }
+
+def write_artifact_manifest(artifact_path, manifest):
+    """
+    Publish a manifest version, every file it points to has to be written already. Replacing the
+    manifest is atomic, so readers see either the previous or the new version of the dataset.
+    """
+    manifest_path = os.path.join(artifact_path, ARTIFACT_MANIFEST_FILE)
+    history_path = os.path.join(artifact_path, "manifests", f"v{manifest['version']:06d}.json")
+
+    os.makedirs(os.path.dirname(history_path), exist_ok=True)
+
+    with open(history_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    with open(f"{manifest_path}.tmp", "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    os.replace(f"{manifest_path}.tmp", manifest_path)
+
+def load_columnar_dataset(artifact_path, manifest):
+    """
+    Read the columnar artifact, arrays are memory-mapped instead of parsed and the columns of the
+    dataset are read-only views of them. Dictionaries are append-only on disk, in memory they are
+    sorted again so category codes follow the alphabetical order, as they do for a dataset loaded
+    from CSV. Only artifacts with ingested deltas are copied into memory: their segments are
+    concatenated and the codes of appended dictionary values are mapped onto the sorted dictionary.
+    """
+    logger.info(f"Loading dataset version {manifest['version']} from columnar artifact: {artifact_path}")
+
+    columns = {}
+    code_orders = {}
+
+    for column, column_info in manifest["columns"].items():
+        parts = [
+            np.load(os.path.join(artifact_path, segment["path"], f"{column}.npy"), mmap_mode="r")
+            for segment in manifest["segments"]
+        ]
+        # A single segment stays memory-mapped, several segments are concatenated in memory
+        values = parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+        if "dictionary" in column_info:
+            dictionary = read_dictionary(artifact_path, column_info["dictionary"])
+            code_orders[column] = np.argsort(np.array(dictionary, dtype=object), kind='stable')
+
+            if not np.array_equal(code_orders[column], np.arange(len(dictionary))):
+                # Values appended by ingestion, map the codes onto the sorted dictionary
+                sorted_codes = np.empty(len(dictionary), dtype=smallest_code_dtype(len(dictionary)))
+                sorted_codes[code_orders[column]] = np.arange(len(dictionary))
+
+                values = sorted_codes[values]
+                dictionary = [dictionary[code] for code in code_orders[column]]
+
+            # Codes are kept as they are, the Categorical is a view of the array
+            columns[column] = pd.Categorical.from_codes(values, categories=dictionary)
+        else:
+            columns[column] = np.asarray(values)
+
+    # Without copy=False the frame would copy every column out of the memory-mapped files
+    dataset = pd.DataFrame(columns, columns=COLUMNS, copy=False)
+    aggregates = DatasetAggregates.load(os.path.join(artifact_path, manifest["aggregates"]))
+    zone_maps = ZoneMaps.from_row_groups(
+        [row_group for segment in manifest["segments"] for row_group in segment["row_groups"]],
+        dataset
+    )
+
+    return dataset, aggregates.reordered(code_orders['Team']), zone_maps
+
+def get_dataset():
+    """
+    Return a read-only view of the dataset, loading it only on the first call in the container
+    """
+    if _dataset_cache["dataset"] is None:
+        cache_dataset()
+    else:
+        _dataset_cache_stats["hits"] += 1
+
+    # Shallow copy shares the column data, with copy-on-write enabled any modification
+    # made by the caller creates a private copy instead of changing the cached dataset
+    return _dataset_cache["dataset"].copy(deep=False)
+
+def cache_dataset():
+    """
+    Load the dataset and store it in the container wide cache
+    """
+    _dataset_cache_stats["misses"] += 1
+
+    start = time.perf_counter()
+    dataset, source, version, aggregates, zone_maps = load_dataset()
+    load_time_ms = (time.perf_counter() - start) * 1000
+
+    _dataset_cache["dataset"] = dataset
+    _dataset_cache["source"] = source
+    _dataset_cache["version"] = version
+    _dataset_cache["aggregates"] = aggregates
+    _dataset_cache["zone_maps"] = zone_maps
+    _dataset_cache["derived"] = {}
+    _dataset_cache_stats["derived_build_time_ms"] = {}
+    _dataset_cache_stats["load_time_ms"] = round(load_time_ms, 2)
+    _dataset_cache_stats["loaded_at"] = time.time()
+    _dataset_cache_stats["rows"] = len(dataset)
+
+    logger.info(f"Dataset version {version} loaded from {source} in {load_time_ms:.2f} ms, rows: {len(dataset)}, memory: {dataset.memory_usage(deep=True).sum()} bytes")
+
+def get_derived(name, builder):
+    """
+    Return a structure derived from the dataset (index, aggregate...), it is built
+    by calling builder(dataset) once and cached together with the dataset. Lookups of
+    an already built structure count as hits of the dataset cache.
+    """
+    if name not in _dataset_cache["derived"]:
+        dataset = get_dataset()
+
+        start = time.perf_counter()
+        _dataset_cache["derived"][name] = builder(dataset)
+        build_time_ms = (time.perf_counter() - start) * 1000
+
+        _dataset_cache_stats["derived_build_time_ms"][name] = round(build_time_ms, 2)
+
+        logger.info(f"Derived structure {name} built in {build_time_ms:.2f} ms")
+    else:
+        _dataset_cache_stats["hits"] += 1
+
+    return _dataset_cache["derived"][name]
+
+def preload_dataset(*derived_getters):
+    """
+    Load the dataset and build the given derived structures during the Lambda init phase,
+    so the first request does not pay for it. Errors are only logged here, the request
+    path will raise them again if the dataset is still missing.
+    """
+    try:
+        if _dataset_cache["dataset"] is None:
+            cache_dataset()
+
+        for derived_getter in derived_getters:
+            derived_getter()
+    except Exception as e:
+        logger.error(f"Failed to preload dataset: {e}")
+
+def get_dataset_cache_stats():
+    """
+    Return the load time and hit/miss counters of the dataset cache
+    """
+    return {
+        **_dataset_cache_stats,
+        "source": _dataset_cache["source"],
+        "version": _dataset_cache["version"]
+    }
+
+def get_dataset_fingerprint():
+    return get_derived("dataset_fingerprint", dataset_fingerprint)
+
+def dataset_fingerprint(dataset):
+    """
+    Return the hex encoded sha256 of the dataset content (dictionaries and values of every column
+    in row order). Containers that load the same data get the same fingerprint, unlike loaded_at.
+    """
+    digest = hashlib.sha256()
+
+    for column in COLUMNS:
+        digest.update(column.encode("utf-8"))
+
+        if column in STRING_COLUMNS:
+            digest.update(json.dumps(dataset[column].cat.categories.tolist()).encode("utf-8"))
+            values = dataset[column].cat.codes.to_numpy()
+        else:
+            values = dataset[column].to_numpy()
+
+        # Code and integer widths depend on how the dataset was loaded, not on its content
+        digest.update(values.astype(np.int64).tobytes())
+
+    return digest.hexdigest()
+
+def get_dataset_aggregates():
+    """
+    Return medal counts per year, team and athlete, as stored in the columnar artifact
+    or counted from the dataset when it was loaded from CSV
+    """
+    return get_derived("dataset_aggregates", build_dataset_aggregates)
+
+def build_dataset_aggregates(dataset):
+    if _dataset_cache["aggregates"] is not None:
+        return _dataset_cache["aggregates"]
+
+    return DatasetAggregates.from_dataset(dataset)
+
+def get_zone_maps():
+    """
+    Return the zone maps of the row groups, as stored in the columnar artifact
+    or computed from the dataset when it was loaded from CSV
+    """
+    return get_derived("zone_maps", build_zone_maps)
+
+def build_zone_maps(dataset):
+    if _dataset_cache["zone_maps"] is not None:
+        return _dataset_cache["zone_maps"]
+
+    return ZoneMaps.from_dataset(dataset)
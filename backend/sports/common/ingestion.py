@@ -0,0 +1,189 @@
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+from common.dataset import (
+    COLUMNS,
+    STRING_COLUMNS,
+    INTEGER_COLUMNS,
+    SORT_COLUMNS,
+    DATASET_ARTIFACT_PATH,
+    read_artifact_manifest,
+    read_dictionary,
+    write_dictionary,
+    write_segment,
+    write_artifact_manifest,
+    file_sha256
+)
+from common.aggregates import (
+    DatasetAggregates,
+    medal_index_per_code
+)
+
+logger = logging.getLogger("SportsIngestion")
+logger.setLevel(logging.INFO)
+
+ALLOWED_VALUES = {
+    'Sex': ['M', 'F'],
+    'Season': ['Summer', 'Winter'],
+    'Medal': ['Gold', 'Silver', 'Bronze', 'No medal']
+}
+
+# String columns that can't be empty, an empty Medal means "No medal"
+REQUIRED_STRING_COLUMNS = ['Name', 'Team', 'NOC', 'City', 'Sport', 'Event']
+
+MAX_REPORTED_ERRORS = 20
+
+class DeltaValidationError(Exception):
+    """An error that should be thrown when a delta file doesn't match the dataset schema."""
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(f"Delta doesn't match the dataset schema: {'; '.join(errors[:MAX_REPORTED_ERRORS])}")
+
+def read_delta(delta_path):
+    """
+    Read a delta CSV with the same columns as the dataset and validate it
+    """
+    delta = pd.read_csv(delta_path, dtype=str, keep_default_na=False)
+
+    return validate_delta(delta)
+
+def validate_delta(delta):
+    """
+    Return the delta with stripped strings, integer columns and "No medal" for empty medals.
+    Raises DeltaValidationError listing the problems when the delta doesn't match the schema.
+    """
+    missing_columns = [column for column in COLUMNS if column not in delta.columns]
+    unexpected_columns = [column for column in delta.columns if column not in COLUMNS]
+
+    if missing_columns or unexpected_columns:
+        raise DeltaValidationError([f"missing columns: {missing_columns}, unexpected columns: {unexpected_columns}"])
+
+    if len(delta) == 0:
+        raise DeltaValidationError(["delta has no rows"])
+
+    delta = delta[COLUMNS].copy()
+    errors = []
+
+    def report(invalid_rows, message):
+        # Line numbers of the CSV, the header is line 1
+        errors.extend(f"line {row + 2}: {message(row)}" for row in np.flatnonzero(invalid_rows)[:MAX_REPORTED_ERRORS])
+
+    for column in STRING_COLUMNS:
+        delta[column] = delta[column].astype(str).str.strip()
+
+    delta['Medal'] = delta['Medal'].replace('', 'No medal')
+
+    for column in REQUIRED_STRING_COLUMNS:
+        report((delta[column] == '').to_numpy(), lambda row, column=column: f"{column} is empty")
+
+    for column, allowed_values in ALLOWED_VALUES.items():
+        report(
+            (~delta[column].isin(allowed_values)).to_numpy(),
+            lambda row, column=column, allowed_values=allowed_values: f"{column} must be one of {allowed_values}, got {delta[column].iloc[row]!r}"
+        )
+
+    for column in INTEGER_COLUMNS:
+        parsed = pd.to_numeric(delta[column].str.strip(), errors='coerce')
+        invalid = (parsed.isna() | (parsed < 0) | (parsed != parsed.round())).to_numpy()
+
+        report(invalid, lambda row, column=column: f"{column} must be a non negative integer, got {delta[column].iloc[row]!r}")
+
+        if not invalid.any():
+            delta[column] = parsed.astype(np.int64)
+
+    if errors:
+        raise DeltaValidationError(errors)
+
+    return delta
+
+def ingest_delta(delta_path, artifact_path=DATASET_ARTIFACT_PATH):
+    """
+    Append the rows of a delta CSV to the columnar artifact as a new version:
+    - rows are sorted by SORT_COLUMNS and written as a new segment, existing segments are never rewritten
+    - dictionaries are append-only, new values get the next codes so existing codes stay valid
+    - medal aggregates of the previous version are updated with counts of the delta rows only
+    - the new manifest is published last with an atomic replace
+
+    Only one ingestion should run at a time for an artifact.
+    """
+    manifest = read_artifact_manifest(artifact_path)
+
+    if manifest is None:
+        raise FileNotFoundError(f"No columnar artifact in {artifact_path}, build it with build_dataset.py first")
+
+    delta_sha256 = file_sha256(delta_path)
+
+    for ingested_delta in manifest["deltas"]:
+        if ingested_delta["sha256"] == delta_sha256:
+            raise ValueError(f"Delta {delta_path} was already ingested in version {ingested_delta['version']}")
+
+    # Sorted like the prepared dataset, so the row groups of the segment get narrow zone maps
+    delta = read_delta(delta_path).sort_values(SORT_COLUMNS, kind='stable', ignore_index=True)
+    version = manifest["version"] + 1
+
+    columns = {}
+    values = {}
+    dictionaries = {}
+
+    for column in COLUMNS:
+        if column not in STRING_COLUMNS:
+            columns[column] = {}
+            values[column] = delta[column].to_numpy()
+            continue
+
+        dictionary = read_dictionary(artifact_path, manifest["columns"][column]["dictionary"])
+        known_values = set(dictionary)
+        new_values = sorted(value for value in delta[column].unique() if value not in known_values)
+
+        columns[column] = manifest["columns"][column]
+
+        if new_values:
+            dictionary = dictionary + new_values
+            dictionary_file = f"dictionaries/v{version:06d}/{column}.json"
+            write_dictionary(artifact_path, dictionary_file, dictionary)
+
+            columns[column] = {
+                "dictionary": dictionary_file
+            }
+
+        values[column] = pd.Index(dictionary).get_indexer(delta[column])
+        dictionaries[column] = dictionary
+
+    segment = write_segment(artifact_path, f"segments/{len(manifest['segments']):03d}", values, dictionaries)
+
+    delta_aggregates = DatasetAggregates.count(
+        values['Year'],
+        values['Team'],
+        values['player_id'],
+        medal_index_per_code(dictionaries['Medal'])[values['Medal']],
+        len(dictionaries['Team'])
+    )
+
+    aggregates_path = f"aggregates/v{version:06d}"
+    aggregates = DatasetAggregates.load(os.path.join(artifact_path, manifest["aggregates"]))
+    aggregates.merged(delta_aggregates).save(os.path.join(artifact_path, aggregates_path))
+
+    new_manifest = {
+        **manifest,
+        "version": version,
+        "rows": manifest["rows"] + len(delta),
+        "columns": columns,
+        "segments": manifest["segments"] + [segment],
+        "aggregates": aggregates_path,
+        "deltas": manifest["deltas"] + [
+            {
+                "version": version,
+                "sha256": delta_sha256,
+                "rows": len(delta)
+            }
+        ]
+    }
+
+    write_artifact_manifest(artifact_path, new_manifest)
+
+    logger.info(f"Ingested {len(delta)} rows from {delta_path} as version {version}, total rows: {new_manifest['rows']}")
+
+    return new_manifest
@@ -0,0 +1,95 @@
+import logging
+
+import numpy as np
+
+from common.dataset import get_derived
+
+logger = logging.getLogger("SportsInvertedIndex")
+logger.setLevel(logging.INFO)
+
+INDEXED_COLUMNS = ['Medal', 'Name', 'Sex', 'Sport', 'Event', 'Team']
+
+def normalize_value(value):
+    return str(value).strip().lower()
+
+class ColumnPostings:
+    """
+    Sorted row ids for every value of a categorical column, stored as one array
+    of row ids grouped by category code (CSR layout) plus offsets per code
+    """
+    def __init__(self, codes, categories):
+        """
+        Initialize posting lists of a column
+
+        codes: category code of every row
+        categories: dictionary of the column, position is the category code
+        """
+        # Stable sort keeps row ids ascending inside every code group
+        self.row_ids = np.argsort(codes, kind='stable').astype(np.int32)
+        self.offsets = np.zeros(len(categories) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(codes, minlength=len(categories)), out=self.offsets[1:])
+
+        # Different spellings can normalize to the same value, so every value maps to a list of codes
+        self.codes_by_value = {}
+        for code, category in enumerate(categories):
+            self.codes_by_value.setdefault(normalize_value(category), []).append(code)
+
+    def rows(self, value):
+        """
+        Return sorted row ids where the column equals the value, ignoring case
+        """
+        codes = self.codes_by_value.get(normalize_value(value), [])
+
+        if len(codes) == 1:
+            return self.row_ids[self.offsets[codes[0]]:self.offsets[codes[0] + 1]]
+
+        return np.sort(np.concatenate(
+            [self.row_ids[self.offsets[code]:self.offsets[code + 1]] for code in codes] or [np.empty(0, dtype=np.int32)]
+        ))
+
+class InvertedIndex:
+    """
+    Posting lists for the columns that GetAllSportsAchievements can filter on
+    """
+    def __init__(self, dataset):
+        self.row_count = len(dataset)
+        self.columns = {
+            column: ColumnPostings(dataset[column].cat.codes.to_numpy(), dataset[column].cat.categories)
+            for column in INDEXED_COLUMNS
+        }
+
+    def filter_rows(self, filters):
+        """
+        Return sorted row ids matching all the filters ({column: value}), or None when there are no filters.
+        Posting lists are intersected from the smallest one, so only matching rows are touched.
+        """
+        postings = [self.columns[column].rows(value) for column, value in filters.items() if value]
+
+        if not postings:
+            return None
+
+        postings.sort(key=len)
+
+        rows = postings[0]
+        for posting in postings[1:]:
+            if len(rows) == 0:
+                break
+
+            rows = intersect_sorted(rows, posting)
+
+        logger.debug(f"Posting list sizes: {[len(posting) for posting in postings]}, matching rows: {len(rows)}")
+
+        return rows
+
+def intersect_sorted(small, large):
+    """
+    Intersect two sorted arrays of unique row ids by binary searching the smaller one in the larger one
+    """
+    positions = np.searchsorted(large, small)
+    found = positions < len(large)
+    found[found] = large[positions[found]] == small[found]
+
+    return small[found]
+
+def get_inverted_index():
+    return get_derived("inverted_index", InvertedIndex)
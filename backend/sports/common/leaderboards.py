@@ -0,0 +1,217 @@
+import json
+import logging
+
+from common.common import ValidationError
+from common.continents import CONTINENTS
+from common.medal_cube import (
+    leaderboard_order,
+    leaderboard_records,
+    leaderboard_sort_key,
+    leaderboard_start_after
+)
+from common.medal_facts import ATHLETE_COUNTING
+from common.pagination import (
+    encode_cursor,
+    decode_cursor
+)
+from common.query_engine import get_query_engine
+
+logger = logging.getLogger("SportsLeaderboards")
+logger.setLevel(logging.INFO)
+
+class LeaderboardQueries:
+    """
+    Query engine calls behind the leaderboards, memoized by their arguments. A batch shares one instance
+    between its sub-queries, so sub-queries with the same filters (pages of the same leaderboard, rankings
+    with different limits...) count and sort the medals once.
+    """
+    def __init__(self, query_engine=None):
+        self.query_engine = query_engine or get_query_engine()
+        self.results = {}
+        self.stats = {
+            "hits": 0,
+            "misses": 0
+        }
+
+    def memoized(self, name, arguments, compute):
+        key = json.dumps([name, arguments], sort_keys=True, default=str)
+
+        if key in self.results:
+            self.stats["hits"] += 1
+        else:
+            self.stats["misses"] += 1
+            self.results[key] = compute()
+
+        return self.results[key]
+
+    def medals_per_year(self, counting):
+        return self.memoized(
+            "medals_per_year",
+            [counting],
+            lambda: self.query_engine.medals_per_year(counting)
+        )
+
+    def continent_totals(self, min_year, max_year, counting):
+        return self.memoized(
+            "continent_totals",
+            [min_year, max_year, counting],
+            lambda: self.query_engine.continent_totals(min_year, max_year, counting)
+        )
+
+    def top_athletes(self, min_year, max_year, list_of_sports, limit):
+        return self.memoized(
+            "top_athletes",
+            [min_year, max_year, list_of_sports, limit],
+            lambda: self.query_engine.top_athletes(min_year, max_year, list_of_sports, limit)
+        )
+
+    def leaderboard(self, min_year, max_year, as_of_year, list_of_sports, counting):
+        """
+        Return (teams, team medals, order of the teams in the leaderboard)
+        """
+        def compute():
+            if as_of_year is not None:
+                logger.info(f"Getting cumulative medals of countries as of {as_of_year} counting {counting}...")
+
+                teams, team_medals = self.query_engine.team_medals_as_of(as_of_year, list_of_sports, counting)
+            else:
+                logger.info(f"Getting medals of countries counting {counting}...")
+
+                teams, team_medals = self.query_engine.team_medals(min_year, max_year, list_of_sports, counting)
+
+            return teams, team_medals, leaderboard_order(team_medals)
+
+        return self.memoized(
+            "leaderboard",
+            [min_year, max_year, as_of_year, list_of_sports, counting],
+            compute
+        )
+
+def get_medals_per_year(counting=ATHLETE_COUNTING, queries=None):
+    queries = queries or LeaderboardQueries()
+
+    # Years without any medal are kept with 0
+    years, totals = queries.medals_per_year(counting)
+
+    return [
+        {
+            'year': year,
+            'total': total
+        }
+        for year, total in zip(years, totals)
+    ]
+
+def get_medals_per_continent_data(min_year, max_year, counting=ATHLETE_COUNTING, queries=None):
+    logger.debug(f"min year and max year: {min_year} {max_year} counting {counting}")
+
+    queries = queries or LeaderboardQueries()
+    totals, unknown_rows = queries.continent_totals(min_year, max_year, counting)
+
+    if unknown_rows > 0:
+        logger.warning(f"Rows of teams without a continent in the year range: {unknown_rows}")
+
+    return [
+        {
+            'continent': continent,
+            'total': total
+        }
+        for continent, total in zip(CONTINENTS, totals)
+        if total > 0
+    ]
+
+def get_medals_per_sportsmen(min_year, max_year, list_of_sports, limit=5, queries=None):
+    logger.debug(f"min year and max year: {min_year} {max_year}, list of sports: {list_of_sports}, limit: {limit}")
+
+    queries = queries or LeaderboardQueries()
+
+    # Only the best athletes are sorted and converted to records, athletes sharing a name are kept apart
+    player_ids, names, counts = queries.top_athletes(min_year, max_year, get_sports_filter(list_of_sports), limit)
+
+    return [
+        {
+            'player_id': player_id,
+            'name': name,
+            'bronze': bronze,
+            'gold': gold,
+            'no_medal': no_medal,
+            'silver': silver,
+            'appearances': gold + silver + bronze + no_medal
+        }
+        for player_id, name, (gold, silver, bronze, no_medal) in zip(player_ids, names, counts)
+    ]
+
+def get_leaderboard_page(min_year, max_year, as_of_year, list_of_sports, page, limit, cursor=None, counting=ATHLETE_COUNTING, queries=None):
+    queries = queries or LeaderboardQueries()
+
+    logger.debug(f"list of sports count and shape: {len(list_of_sports)} {list_of_sports} for min_year: {min_year} and max_year: {max_year}")
+
+    teams, team_medals, order = queries.leaderboard(
+        min_year,
+        max_year,
+        as_of_year,
+        get_sports_filter(list_of_sports),
+        counting
+    )
+
+    # Both the cursor and the filters it was created for
+    filters = {
+        'min_year': min_year,
+        'max_year': max_year,
+        'as_of_year': as_of_year,
+        'list_of_sports': list_of_sports,
+        'counting': counting
+    }
+
+    if cursor is not None:
+        sort_key, previous_page = decode_leaderboard_cursor(cursor, filters)
+        page = previous_page + 1
+
+        # Resume right after the last returned team, earlier pages are never built
+        start_index = leaderboard_start_after(teams, team_medals, order, sort_key)
+        page_order = order[start_index:start_index + limit]
+    else:
+        page_order = paginate_list(order, page, limit)
+
+    # Only the teams of the requested page are converted into records
+    paginated_list = leaderboard_records(teams, team_medals, page_order)
+
+    next_cursor = None
+    if len(page_order) > 0 and page_order[-1] != order[-1]:
+        next_cursor = encode_cursor(filters, leaderboard_sort_key(teams, team_medals, page_order[-1]), page)
+
+    return {
+        'page': page,
+        'total_records_found': len(order),
+        'item_count': len(paginated_list),
+        'items': paginated_list,
+        'next_cursor': next_cursor
+    }
+
+def decode_leaderboard_cursor(cursor, filters):
+    sort_key, page = decode_cursor(cursor, filters)
+
+    if not isinstance(sort_key, list) or len(sort_key) != 4 or not all(isinstance(count, int) for count in sort_key[:3]) or not isinstance(sort_key[3], str):
+        logger.error(f"Unexpected leaderboard sort key: {sort_key}")
+
+        raise ValidationError("Invalid cursor.")
+
+    return sort_key, page
+
+def get_sports_filter(list_of_sports):
+    if list_of_sports and len(list_of_sports) > 0 and list_of_sports[0] != '':
+        return list_of_sports
+
+    return None
+
+def paginate_list(data, page_number, limit_per_page):
+    """
+    Return the items of the page, a partial last page holds only the remaining items
+    and a page past the end is empty, like the pages reached with a cursor
+    """
+    # It's page_number - 1 because the minimum page is 1 not 0
+    start_index = (page_number - 1) * limit_per_page
+    end_index = page_number * limit_per_page
+
+    logger.debug(f"start index: {start_index} end index: {end_index}")
+
+    return data[start_index:end_index]
@@ -0,0 +1,204 @@
+import logging
+
+import numpy as np
+
+from common.dataset import get_derived
+from common.medal_facts import (
+    get_medal_facts,
+    get_event_medals
+)
+
+logger = logging.getLogger("SportsMedalCube")
+logger.setLevel(logging.INFO)
+
+MEDAL_TYPES = ['Gold', 'Silver', 'Bronze']
+
+class YearPrefixCounts:
+    """
+    Cumulative counts over the Games years, any inclusive year range is the difference of two prefix rows
+    """
+    def __init__(self, years, counts):
+        """
+        Initialize prefix counts
+
+        years: sorted Games years
+        counts: array whose first axis follows years, prefix rows are accumulated along it
+        """
+        self.years = years
+        self.prefix = np.zeros((len(years) + 1,) + counts.shape[1:], dtype=np.int32)
+        np.cumsum(counts, axis=0, out=self.prefix[1:])
+
+    def year_bounds(self, min_year, max_year):
+        """
+        Return prefix row positions that cover the inclusive year range
+        """
+        start = np.searchsorted(self.years, min_year, side='left')
+        end = np.searchsorted(self.years, max_year, side='right')
+
+        return start, max(start, end)
+
+    def range_counts(self, min_year, max_year):
+        """
+        Return counts for the inclusive year range
+        """
+        start, end = self.year_bounds(min_year, max_year)
+
+        return self.prefix[end] - self.prefix[start]
+
+    def cumulative_counts(self, as_of_year):
+        """
+        Return counts of all the Games up to and including the given year
+        """
+        end = np.searchsorted(self.years, as_of_year, side='right')
+
+        return self.prefix[end]
+
+class MedalCube:
+    """
+    Medal counts indexed by (year, team, sport, medal), stored as prefix sums over the years
+    """
+    def __init__(self, years, teams, sports, counts):
+        """
+        Initialize a medal cube
+
+        years: sorted Games years, first axis of counts
+        teams: team names, second axis of counts (only teams that won at least one medal)
+        sports: sport names, third axis of counts (the Sport dictionary of the dataset)
+        counts: int32 array of shape (years, teams, sports, medals), the medal axis follows MEDAL_TYPES
+        """
+        self.years = years
+        self.teams = teams
+        self.sports = sports
+        self.team_sport_counts = YearPrefixCounts(years, counts)
+        self.team_counts = YearPrefixCounts(years, counts.sum(axis=2, dtype=np.int32))
+
+    def sport_codes(self, list_of_sports):
+        """
+        Return positions on the sport axis for the sports that exist, unknown sports are ignored
+        """
+        indexer = self.sports.get_indexer(list_of_sports)
+
+        return indexer[indexer >= 0]
+
+    def team_medals(self, min_year, max_year, sport_codes=None):
+        """
+        Return (teams, medals) totals for the year range and optional list of sport codes,
+        the cost does not depend on how many years the range covers
+        """
+        if sport_codes is None:
+            return self.team_counts.range_counts(min_year, max_year)
+
+        start, end = self.team_sport_counts.year_bounds(min_year, max_year)
+        prefix = self.team_sport_counts.prefix
+
+        return (prefix[end][:, sport_codes, :] - prefix[start][:, sport_codes, :]).sum(axis=1)
+
+    def team_medals_as_of(self, as_of_year, sport_codes=None):
+        """
+        Return (teams, medals) totals of all the Games up to and including the given year
+        """
+        if sport_codes is None:
+            return self.team_counts.cumulative_counts(as_of_year)
+
+        return self.team_sport_counts.cumulative_counts(as_of_year)[:, sport_codes, :].sum(axis=1)
+
+def build_medal_cube(dataset):
+    """
+    Count the medal facts of the dataset into a MedalCube
+    """
+    return count_medal_cube(dataset, get_medal_facts())
+
+def build_event_medal_cube(dataset):
+    """
+    Count the event medals of the dataset into a MedalCube, team members share one medal
+    """
+    return count_medal_cube(dataset, get_event_medals())
+
+def count_medal_cube(dataset, medals):
+    """
+    Count medals with years, team_codes, sport_codes and medals (positions in MEDAL_TYPES) into a MedalCube
+    """
+    # Games years without any medal are kept, so year ranges resolve the same way as on all the rows
+    years = np.unique(dataset['Year'].to_numpy())
+    year_index = np.searchsorted(years, medals.years)
+
+    team_codes, team_index = np.unique(medals.team_codes, return_inverse=True)
+    teams = dataset['Team'].cat.categories[team_codes]
+
+    sports = dataset['Sport'].cat.categories
+
+    shape = (len(years), len(teams), len(sports), len(MEDAL_TYPES))
+    flat_index = np.ravel_multi_index((year_index, team_index, medals.sport_codes, medals.medals), shape)
+    counts = np.bincount(flat_index, minlength=int(np.prod(shape))).astype(np.int32).reshape(shape)
+
+    medal_cube = MedalCube(years, teams, sports, counts)
+
+    logger.info(f"Medal cube shape: {shape}, prefix sums size: {medal_cube.team_sport_counts.prefix.nbytes + medal_cube.team_counts.prefix.nbytes} bytes")
+
+    return medal_cube
+
+def get_medal_cube():
+    return get_derived("medal_cube", build_medal_cube)
+
+def get_event_medal_cube():
+    return get_derived("event_medal_cube", build_event_medal_cube)
+
+def leaderboard_order(team_medals):
+    """
+    Return positions of the teams with at least one medal sorted by gold, silver and bronze count.
+    Ties keep the alphabetical order of the team names.
+    """
+    gold, silver, bronze = team_medals[:, 0], team_medals[:, 1], team_medals[:, 2]
+    with_medals = np.flatnonzero(team_medals.sum(axis=1) > 0)
+
+    # lexsort uses the last key as the primary one and is stable
+    return with_medals[np.lexsort((-bronze[with_medals], -silver[with_medals], -gold[with_medals]))]
+
+def leaderboard_records(teams, team_medals, order):
+    """
+    Return leaderboard entries of the teams at the given positions
+    """
+    return [
+        {
+            'country': country,
+            'gold': gold_count,
+            'silver': silver_count,
+            'bronze': bronze_count
+        }
+        for country, (gold_count, silver_count, bronze_count) in zip(
+            teams[order].tolist(),
+            team_medals[order].tolist()
+        )
+    ]
+
+def leaderboard_sort_key(teams, team_medals, position):
+    """
+    Return (gold, silver, bronze, country) of the team, the key the leaderboard is ordered by
+    """
+    gold, silver, bronze = team_medals[position].tolist()
+
+    return [gold, silver, bronze, teams[position]]
+
+def leaderboard_start_after(teams, team_medals, order, sort_key):
+    """
+    Return index in the leaderboard order of the first team that comes after the sort key
+    """
+    gold, silver, bronze, country = sort_key
+    team_gold, team_silver, team_bronze = team_medals[order].T
+    team_names = teams[order].to_numpy()
+
+    # Teams up to and including the sort key, the order is sorted so they are all before the start
+    not_after = (team_gold > gold) | ((team_gold == gold) & (
+        (team_silver > silver) | ((team_silver == silver) & (
+            (team_bronze > bronze) | ((team_bronze == bronze) & (team_names <= country))
+        ))
+    ))
+
+    return int(not_after.sum())
+
+def sorted_leaderboard(teams, team_medals):
+    """
+    Return teams with at least one medal sorted by gold, silver and bronze count.
+    Ties keep the alphabetical order of the team names.
+    """
+    return leaderboard_records(teams, team_medals, leaderboard_order(team_medals))
@@ -0,0 +1,112 @@
+import logging
+
+import numpy as np
+
+from common.dataset import get_derived
+from common.athlete_careers import get_athlete_careers
+from common.aggregates import (
+    MEDAL_COLUMNS,
+    medal_index_per_code
+)
+
+logger = logging.getLogger("SportsMedalFacts")
+logger.setLevel(logging.INFO)
+
+# Counting modes of the medal tables: every medal row of an athlete, or every medal of the official
+# medal table where the members of a team count once
+ATHLETE_COUNTING = "athletes"
+EVENT_COUNTING = "events"
+COUNTING_MODES = [ATHLETE_COUNTING, EVENT_COUNTING]
+
+# Columns identifying one medal of the official medal table
+EVENT_MEDAL_COLUMNS = ['Year', 'Season', 'Event', 'Team', 'Medal']
+
+class MedalFacts:
+    """
+    One row per medal won (gold, silver and bronze rows of the dataset) with integer coded dimensions,
+    sorted by year so a year range is a contiguous slice. "No medal" participations are left out.
+    """
+    def __init__(self, dataset):
+        medal_index = medal_index_per_code(dataset['Medal'].cat.categories)[dataset['Medal'].cat.codes.to_numpy()]
+        year_values = dataset['Year'].to_numpy()
+
+        # Ingested rows are appended after the sorted ones, a stable sort puts them back in year order
+        rows = np.flatnonzero(medal_index < MEDAL_COLUMNS.index('No medal'))
+        rows = rows[np.argsort(year_values[rows], kind='stable')]
+
+        self.row_ids = rows.astype(np.int32)
+        self.years = year_values[rows]
+        self.player_codes = get_athlete_careers().row_codes[rows]
+        self.team_codes = dataset['Team'].cat.codes.to_numpy()[rows]
+        self.sport_codes = dataset['Sport'].cat.codes.to_numpy()[rows]
+
+        # Position in MEDAL_COLUMNS, only gold, silver and bronze are left
+        self.medals = medal_index[rows]
+
+        logger.info(f"Medal facts: {len(rows)} of {len(dataset)} rows")
+
+    def __len__(self):
+        return len(self.row_ids)
+
+    def year_slice(self, min_year=None, max_year=None):
+        """
+        Return the slice of the facts in the inclusive year range
+        """
+        return sorted_year_slice(self.years, min_year, max_year)
+
+class EventMedals:
+    """
+    One row per medal of the official medal table, the medal facts sharing (Year, Season, Event, Team, Medal)
+    are the members of one team and are collapsed into the first of them. Sorted by year like the medal facts.
+    """
+    def __init__(self, dataset):
+        medal_facts = get_medal_facts()
+
+        keys = np.stack([
+            medal_facts.years.astype(np.int64),
+            dataset['Season'].cat.codes.to_numpy()[medal_facts.row_ids],
+            dataset['Event'].cat.codes.to_numpy()[medal_facts.row_ids],
+            medal_facts.team_codes,
+            medal_facts.medals
+        ], axis=1)
+
+        # Unique keys are sorted with the year first, so the kept facts stay in year order
+        _, facts = np.unique(keys, axis=0, return_index=True)
+
+        self.row_ids = medal_facts.row_ids[facts]
+        self.years = medal_facts.years[facts]
+        self.team_codes = medal_facts.team_codes[facts]
+        self.sport_codes = medal_facts.sport_codes[facts]
+        self.medals = medal_facts.medals[facts]
+
+        logger.info(f"Event medals: {len(facts)} of {len(medal_facts)} medal facts")
+
+    def __len__(self):
+        return len(self.row_ids)
+
+    def year_slice(self, min_year=None, max_year=None):
+        """
+        Return the slice of the event medals in the inclusive year range
+        """
+        return sorted_year_slice(self.years, min_year, max_year)
+
+    def year_totals(self, years):
+        """
+        Return the number of event medals of every one of the sorted years
+        """
+        return np.bincount(np.searchsorted(years, self.years), minlength=len(years))
+
+def sorted_year_slice(years, min_year=None, max_year=None):
+    """
+    Return the slice of the sorted years in the inclusive year range
+    """
+    start = 0 if min_year is None else int(np.searchsorted(years, min_year, side='left'))
+    end = len(years) if max_year is None else int(np.searchsorted(years, max_year, side='right'))
+
+    return slice(start, max(start, end))
+
+def get_medal_facts():
+    return get_derived("medal_facts", MedalFacts)
+
+def get_event_medals():
+    return get_derived("event_medals", EventMedals)
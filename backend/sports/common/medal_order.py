@@ -0,0 +1,68 @@
+import logging
+
+import numpy as np
+
+from common.dataset import get_derived
+
+logger = logging.getLogger("SportsMedalOrder")
+logger.setLevel(logging.INFO)
+
+# Rows without a medal are listed after all the medal rows
+MEDAL_ORDER = {'Gold': 1, 'Silver': 2, 'Bronze': 3}
+
+class MedalOrderPermutation:
+    """
+    Row ids of the dataset presorted by medal (gold, silver, bronze, no medal),
+    rows with the same medal keep the dataset order
+    """
+    def __init__(self, dataset):
+        medals = dataset['Medal']
+        order_per_code = np.array(
+            [MEDAL_ORDER.get(medal, len(MEDAL_ORDER) + 1) for medal in medals.cat.categories],
+            dtype=np.int8
+        )
+
+        # permutation[position] is a row id, positions[row id] is where the row is in the permutation
+        self.permutation = np.argsort(order_per_code[medals.cat.codes.to_numpy()], kind='stable').astype(np.int32)
+        self.positions = np.empty_like(self.permutation)
+        self.positions[self.permutation] = np.arange(len(self.permutation), dtype=np.int32)
+
+    def sorted_rows(self, rows=None):
+        """
+        Return row ids in medal order, for all the rows when rows is None (no copy is made)
+        or for the given subset of row ids
+        """
+        if rows is None:
+            return self.permutation
+
+        return self.permutation[np.sort(self.positions[rows])]
+
+    def rows_after(self, after_position, limit, rows=None):
+        """
+        Return up to limit row ids that come after the position in medal order, for all the rows
+        when rows is None or for the given subset of row ids. Earlier rows are never materialized.
+        """
+        if rows is None:
+            start = after_position + 1
+
+            return self.permutation[start:start + limit]
+
+        sorted_positions = np.sort(self.positions[rows])
+        start = np.searchsorted(sorted_positions, after_position, side='right')
+
+        return self.permutation[sorted_positions[start:start + limit]]
+
+    def last_position(self, rows=None):
+        """
+        Return position in medal order of the last row, -1 when there are no rows
+        """
+        if rows is None:
+            return len(self.permutation) - 1
+
+        if len(rows) == 0:
+            return -1
+
+        return int(self.positions[rows].max())
+
+def get_medal_order_permutation():
+    return get_derived("medal_order_permutation", MedalOrderPermutation)
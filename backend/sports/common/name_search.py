@@ -0,0 +1,158 @@
+import logging
+import unicodedata
+
+import numpy as np
+
+from common.dataset import get_derived
+
+logger = logging.getLogger("SportsNameSearch")
+logger.setLevel(logging.INFO)
+
+# Minimum trigram similarity of a fuzzy match, same default as PostgreSQL pg_trgm
+SIMILARITY_THRESHOLD = 0.3
+
+# Prefix matches are ranked before fuzzy ones
+PREFIX_MATCH_BONUS = 1.0
+
+def normalize_name(name):
+    """
+    Return the searchable form of a name, lowercase without accents and repeated whitespace
+    """
+    name = str(name)
+
+    if not name.isascii():
+        decomposed = unicodedata.normalize("NFKD", name)
+        name = "".join(char for char in decomposed if not unicodedata.combining(char))
+
+    return " ".join(name.lower().split())
+
+def name_trigrams(normalized_name):
+    """
+    Return the set of trigrams of every word, words are padded so their start weighs more than their end
+    """
+    trigrams = set()
+
+    for word in normalized_name.split():
+        padded_word = f"  {word} "
+        trigrams.update(padded_word[position:position + 3] for position in range(len(padded_word) - 2))
+
+    return trigrams
+
+class NameSearchIndex:
+    """
+    Trigram index over the distinct athlete names of the dataset, with player ids of every name
+    and the normalized names sorted for prefix lookups
+    """
+    def __init__(self, dataset):
+        self.names = dataset['Name'].cat.categories
+        self.normalized_names = [normalize_name(name) for name in self.names]
+
+        self.build_player_ids(dataset)
+        self.build_trigram_postings()
+
+        # Name codes in the order of their normalized names, a prefix is a contiguous range of it
+        self.prefix_order = np.array(sorted(range(len(self.names)), key=self.normalized_names.__getitem__), dtype=np.int32)
+        self.sorted_normalized_names = np.array([self.normalized_names[code] for code in self.prefix_order], dtype=str)
+
+    def build_player_ids(self, dataset):
+        """
+        Group the distinct player ids per name code in CSR layout
+        """
+        pairs = np.unique(
+            np.stack([dataset['Name'].cat.codes.to_numpy().astype(np.int64), dataset['player_id'].to_numpy().astype(np.int64)], axis=1),
+            axis=0
+        )
+
+        self.player_ids = pairs[:, 1]
+        self.player_id_offsets = np.zeros(len(self.names) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(pairs[:, 0], minlength=len(self.names)), out=self.player_id_offsets[1:])
+
+    def build_trigram_postings(self):
+        """
+        Build posting lists of name codes per trigram in CSR layout, and the trigram count of every name
+        """
+        trigram_ids = {}
+        posting_trigrams = []
+        posting_codes = []
+
+        self.trigram_counts = np.zeros(len(self.names), dtype=np.int32)
+
+        for code, normalized_name in enumerate(self.normalized_names):
+            trigrams = name_trigrams(normalized_name)
+            self.trigram_counts[code] = len(trigrams)
+
+            for trigram in trigrams:
+                posting_trigrams.append(trigram_ids.setdefault(trigram, len(trigram_ids)))
+                posting_codes.append(code)
+
+        posting_trigrams = np.array(posting_trigrams, dtype=np.int32)
+        order = np.argsort(posting_trigrams, kind='stable')
+
+        self.trigram_ids = trigram_ids
+        self.posting_codes = np.array(posting_codes, dtype=np.int32)[order]
+        self.posting_offsets = np.zeros(len(trigram_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(posting_trigrams, minlength=len(trigram_ids)), out=self.posting_offsets[1:])
+
+        logger.info(f"Trigram index of {len(self.names)} names, trigrams: {len(trigram_ids)}, postings: {len(self.posting_codes)}")
+
+    def get_player_ids(self, code):
+        return self.player_ids[self.player_id_offsets[code]:self.player_id_offsets[code + 1]].tolist()
+
+    def prefix_matches(self, normalized_query):
+        """
+        Return name codes whose normalized name starts with the query
+        """
+        start = np.searchsorted(self.sorted_normalized_names, normalized_query, side='left')
+        end = np.searchsorted(self.sorted_normalized_names, normalized_query + "\uffff", side='left')
+
+        return self.prefix_order[start:end]
+
+    def similarities(self, normalized_query):
+        """
+        Return (name codes, trigram similarity) of the names sharing at least one trigram with the query
+        """
+        query_trigrams = name_trigrams(normalized_query)
+        postings = [
+            self.posting_codes[self.posting_offsets[trigram_id]:self.posting_offsets[trigram_id + 1]]
+            for trigram_id in (self.trigram_ids.get(trigram) for trigram in query_trigrams)
+            if trigram_id is not None
+        ]
+
+        if not postings:
+            return np.empty(0, dtype=np.int32), np.empty(0)
+
+        # Every posting list holds a name once, so counting codes gives the shared trigrams
+        shared_counts = np.bincount(np.concatenate(postings), minlength=len(self.names))
+        codes = np.flatnonzero(shared_counts)
+        shared = shared_counts[codes]
+
+        return codes, shared / (len(query_trigrams) + self.trigram_counts[codes] - shared)
+
+    def search(self, query, limit=10):
+        """
+        Return up to limit (name code, score) pairs, prefix matches first and then fuzzy matches by similarity
+        """
+        normalized_query = normalize_name(query)
+
+        if not normalized_query:
+            return []
+
+        scores = np.zeros(len(self.names))
+
+        codes, similarities = self.similarities(normalized_query)
+        scores[codes] = np.where(similarities >= SIMILARITY_THRESHOLD, similarities, 0)
+        scores[self.prefix_matches(normalized_query)] += PREFIX_MATCH_BONUS
+
+        candidates = np.flatnonzero(scores)
+
+        # Partial selection of the best candidates, only they are sorted. Ties keep the alphabetical order.
+        if len(candidates) > limit:
+            kth_score = np.partition(scores[candidates], len(candidates) - limit)[len(candidates) - limit]
+            candidates = candidates[scores[candidates] >= kth_score]
+
+        ranked = candidates[np.argsort(-scores[candidates], kind='stable')][:limit]
+
+        return list(zip(ranked.tolist(), scores[ranked].tolist()))
+
+def get_name_search_index():
+    return get_derived("name_search_index", NameSearchIndex)
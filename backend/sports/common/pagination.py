@@ -0,0 +1,74 @@
+import base64
+import binascii
+import hashlib
+import json
+import logging
+
+from common.common import ValidationError
+
+logger = logging.getLogger("SportsPagination")
+logger.setLevel(logging.INFO)
+
+CURSOR_VERSION = 1
+
+def filters_fingerprint(filters):
+    """
+    Return a short hash of the request filters, a cursor is only valid for the filters it was created with.
+    List values are sorted, their order doesn't change the result.
+    """
+    canonical_filters = json.dumps(
+        {name: sorted(value) if isinstance(value, list) else value for name, value in filters.items()},
+        sort_keys=True,
+        separators=(',', ':'),
+        default=str
+    )
+
+    return hashlib.sha256(canonical_filters.encode("utf-8")).hexdigest()[:16]
+
+def encode_cursor(filters, sort_key, page, dataset_version=None):
+    """
+    Return an opaque token with the sort key of the last returned item and the page it was on.
+    Sort keys that are only meaningful for one dataset (row positions) pass its dataset_version,
+    the cursor is then rejected once the dataset changes.
+    """
+    payload = {
+        "v": CURSOR_VERSION,
+        "f": filters_fingerprint(filters),
+        "k": sort_key,
+        "p": page
+    }
+
+    if dataset_version is not None:
+        payload["d"] = dataset_version
+
+    token = base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode("utf-8"))
+
+    return token.decode("utf-8").rstrip("=")
+
+def decode_cursor(cursor, filters, dataset_version=None):
+    """
+    Return (sort key, page) of the cursor, raises ValidationError when the cursor is malformed
+    or was created for different filters or another dataset version
+    """
+    try:
+        padded_cursor = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded_cursor.encode("utf-8")))
+    except (ValueError, binascii.Error) as e:
+        logger.error(f"Cursor can't be decoded: {e}")
+
+        raise ValidationError("Invalid cursor.")
+
+    if not isinstance(payload, dict) or payload.get("v") != CURSOR_VERSION or "k" not in payload or not isinstance(payload.get("p"), int):
+        logger.error(f"Unexpected cursor payload: {payload}")
+
+        raise ValidationError("Invalid cursor.")
+
+    if payload.get("f") != filters_fingerprint(filters):
+        raise ValidationError("Cursor doesn't match the request filters.")
+
+    if payload.get("d") != dataset_version:
+        logger.error(f"Cursor of dataset {payload.get('d')} used with dataset {dataset_version}")
+
+        raise ValidationError("Cursor was created for a previous version of the dataset.")
+
+    return payload["k"], payload["p"]
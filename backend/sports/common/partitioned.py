@@ -0,0 +1,173 @@
+import atexit
+import logging
+import multiprocessing
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from os import environ
+
+import numpy as np
+
+from common.aggregates import (
+    MEDAL_COLUMNS,
+    count_medals
+)
+
+logger = logging.getLogger("SportsPartitioned")
+logger.setLevel(logging.INFO)
+
+PARTITION_WORKERS = int(environ.get("SPORTS_PARTITION_WORKERS", "4"))
+
+# More partitions than workers keeps the workers busy when a year range prunes some of them
+PARTITIONS_PER_WORKER = 2
+
+# Contiguous rows of the year ordered columns, every Games year is in exactly one partition
+Partition = namedtuple("Partition", ["start", "end", "first_year_index", "last_year_index"])
+
+# Shared columns mapped by a pool worker, {column: (shared memory, array)}
+_worker_columns = {}
+
+def attach_columns(column_specs):
+    """
+    Pool initializer, every worker maps the shared columns once
+    """
+    for column, (shared_memory_name, dtype, length) in column_specs.items():
+        block = shared_memory.SharedMemory(name=shared_memory_name)
+
+        _worker_columns[column] = (block, np.ndarray(length, dtype=dtype, buffer=block.buf))
+
+def count_partition(start, end, key_column, key_size, year_bounds, sport_codes):
+    """
+    Pool task, count the rows of a partition of the shared columns
+    """
+    columns = {column: values for column, (_, values) in _worker_columns.items()}
+
+    return count_rows(columns, start, end, key_column, key_size, year_bounds, sport_codes)
+
+def count_rows(columns, start, end, key_column, key_size, year_bounds=None, sport_codes=None):
+    """
+    Return (keys, counts per MEDAL_COLUMNS) of the rows start:end that are in the year index bounds
+    and sports. Only keys with at least one row are returned, so partial results stay small.
+    """
+    mask = np.ones(end - start, dtype=bool)
+
+    if year_bounds is not None:
+        year_index = columns['year_index'][start:end]
+        mask &= (year_index >= year_bounds[0]) & (year_index < year_bounds[1])
+
+    if sport_codes is not None:
+        mask &= np.isin(columns['sport'][start:end], sport_codes)
+
+    counts = count_medals(columns[key_column][start:end][mask], columns['medal'][start:end][mask], key_size)
+    keys = np.flatnonzero(counts.any(axis=1))
+
+    # Partial results are pickled back to the caller, a partition never has more than 2^31 rows
+    return keys.astype(np.int32), counts[keys].astype(np.int32)
+
+def year_partitions(year_index, partition_count):
+    """
+    Split year ordered rows into about partition_count partitions of similar size, cut between Games years
+    """
+    year_count = int(year_index[-1]) + 1 if len(year_index) > 0 else 0
+
+    if year_count == 0:
+        return []
+
+    year_starts = np.searchsorted(year_index, np.arange(year_count))
+    target_starts = np.arange(partition_count) * len(year_index) / partition_count
+
+    # Year holding every target row, partitions start at the first row of that year
+    first_years = np.unique(np.searchsorted(year_starts, target_starts, side='right') - 1)
+    bounds = np.append(year_starts[first_years], len(year_index))
+    last_years = np.append(first_years[1:] - 1, year_count - 1)
+
+    return [
+        Partition(int(start), int(end), int(first_year), int(last_year))
+        for start, end, first_year, last_year in zip(bounds[:-1], bounds[1:], first_years, last_years)
+    ]
+
+class PartitionedCounter:
+    """
+    Filter and count over columns in shared memory, split in year partitions that a process pool
+    scans in parallel. Partial counts of the partitions are merged by the caller process.
+
+    Needs /dev/shm and process support, AWS Lambda provides neither.
+    """
+    def __init__(self, year_values, columns, workers=PARTITION_WORKERS, partition_count=None):
+        """
+        Initialize a counter and copy the columns into shared memory
+
+        year_values: Games year of every row
+        columns: {column: codes} of the rows, 'medal' holds positions in MEDAL_COLUMNS and 'sport' the codes sports are filtered by
+        workers: processes of the pool
+        partition_count: partitions of the rows, by default PARTITIONS_PER_WORKER for every worker
+        """
+        order = np.argsort(year_values, kind='stable')
+        self.years, year_index = np.unique(year_values, return_inverse=True)
+
+        year_index = year_index.astype(np.int16)[order]
+        self.partitions = year_partitions(year_index, partition_count or workers * PARTITIONS_PER_WORKER)
+        self.row_count = len(year_index)
+
+        self.blocks = []
+        column_specs = {}
+
+        for column, values in {'year_index': year_index, **{column: values[order] for column, values in columns.items()}}.items():
+            block = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+            np.ndarray(len(values), dtype=values.dtype, buffer=block.buf)[:] = values
+
+            self.blocks.append(block)
+            column_specs[column] = (block.name, values.dtype, len(values))
+
+        # Spawned workers only share the columns, nothing else of the parent process
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=attach_columns,
+            initargs=(column_specs,)
+        )
+
+        atexit.register(self.close)
+
+        logger.info(f"Partitioned {self.row_count} rows into {len(self.partitions)} partitions for {workers} workers, shared memory: {sum(block.size for block in self.blocks)} bytes")
+
+    def count(self, key_column, key_size, min_year=None, max_year=None, sport_codes=None):
+        """
+        Return (key_size, MEDAL_COLUMNS) counts of the rows in the inclusive year range and the given sport codes.
+        Partitions outside of the year range are skipped, partitions inside of it are not filtered by year.
+        """
+        start_year = 0 if min_year is None else int(np.searchsorted(self.years, min_year, side='left'))
+        end_year = len(self.years) if max_year is None else int(np.searchsorted(self.years, max_year, side='right'))
+
+        futures = []
+        for partition in self.partitions:
+            if partition.last_year_index < start_year or partition.first_year_index >= end_year:
+                continue
+
+            year_bounds = None
+            if partition.first_year_index < start_year or partition.last_year_index >= end_year:
+                year_bounds = (start_year, end_year)
+
+            futures.append(self.executor.submit(
+                count_partition, partition.start, partition.end, key_column, key_size, year_bounds, sport_codes
+            ))
+
+        counts = np.zeros((key_size, len(MEDAL_COLUMNS)), dtype=np.int64)
+
+        for future in futures:
+            keys, partial_counts = future.result()
+            counts[keys] += partial_counts
+
+        return counts
+
+    def close(self):
+        """
+        Stop the workers and release the shared memory
+        """
+        self.executor.shutdown()
+
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+
+        self.blocks = []
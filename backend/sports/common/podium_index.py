@@ -0,0 +1,120 @@
+import logging
+
+import numpy as np
+
+from common.dataset import get_derived
+from common.aggregates import MEDAL_COLUMNS
+from common.medal_facts import get_medal_facts
+from common.inverted_index import normalize_value
+
+logger = logging.getLogger("SportsPodiumIndex")
+logger.setLevel(logging.INFO)
+
+# String columns read by a podium, codes are kept in the order of the podium rows
+PODIUM_COLUMNS = ['Name', 'Team', 'NOC', 'City', 'Sport']
+
+class PodiumIndex:
+    """
+    Hash index from (Event, Year, Season) to the medal rows of that event, stored as one array of rows
+    sorted by event, medal, team and athlete, plus the (start, end) range of every event
+    """
+    def __init__(self, dataset):
+        medal_facts = get_medal_facts()
+        rows = medal_facts.row_ids
+
+        event_codes = dataset['Event'].cat.codes.to_numpy()[rows]
+        season_codes = dataset['Season'].cat.codes.to_numpy()[rows]
+        team_codes = medal_facts.team_codes
+        name_codes = dataset['Name'].cat.codes.to_numpy()[rows]
+
+        # lexsort uses the last key as the primary one
+        order = np.lexsort((name_codes, team_codes, medal_facts.medals, season_codes, medal_facts.years, event_codes))
+
+        self.rows = rows[order]
+        self.medals = medal_facts.medals[order]
+        self.player_ids = dataset['player_id'].to_numpy()[self.rows]
+        self.codes = {column: dataset[column].cat.codes.to_numpy()[self.rows] for column in PODIUM_COLUMNS}
+        self.dictionaries = {column: dataset[column].cat.categories for column in PODIUM_COLUMNS + ['Event', 'Season']}
+
+        keys = np.stack([event_codes[order], medal_facts.years[order], season_codes[order]], axis=1)
+        starts = np.flatnonzero(np.concatenate([[True], (keys[1:] != keys[:-1]).any(axis=1)]))
+        ends = np.append(starts[1:], len(keys))
+
+        self.ranges = {
+            (event, year, season): (start, end)
+            for (event, year, season), start, end in zip(keys[starts].tolist(), starts.tolist(), ends.tolist())
+        }
+
+        # Different spellings can normalize to the same value, so every value maps to a list of codes
+        self.event_codes = codes_by_value(self.dictionaries['Event'])
+        self.season_codes = codes_by_value(self.dictionaries['Season'])
+
+        logger.info(f"Podium index of {len(self.ranges)} events, {len(self.rows)} medal rows")
+
+    def __len__(self):
+        return len(self.ranges)
+
+    def find_key(self, event, year, season):
+        """
+        Return the (Event code, Year, Season code) key of the event, None when the event wasn't held.
+        Event and season names are matched ignoring case.
+        """
+        for event_code in self.event_codes.get(normalize_value(event), []):
+            for season_code in self.season_codes.get(normalize_value(season), []):
+                if (event_code, year, season_code) in self.ranges:
+                    return (event_code, year, season_code)
+
+        return None
+
+    def podium(self, event, year, season):
+        """
+        Return the medal winners of the event grouped by medal and team, None when the event wasn't held
+        """
+        key = self.find_key(event, year, season)
+
+        if key is None:
+            return None
+
+        start, end = self.ranges[key]
+        values = {
+            column: self.dictionaries[column][self.codes[column][start:end]].tolist()
+            for column in PODIUM_COLUMNS
+        }
+        medals = self.medals[start:end].tolist()
+        player_ids = self.player_ids[start:end].tolist()
+
+        podium = []
+        for position, medal in enumerate(medals):
+            # Members of a team share one podium place
+            if not podium or (podium[-1]['medal'], podium[-1]['team']) != (MEDAL_COLUMNS[medal], values['Team'][position]):
+                podium.append({
+                    'medal': MEDAL_COLUMNS[medal],
+                    'team': values['Team'][position],
+                    'noc': values['NOC'][position],
+                    'athletes': []
+                })
+
+            podium[-1]['athletes'].append({
+                'player_id': player_ids[position],
+                'name': values['Name'][position]
+            })
+
+        return {
+            'event': self.dictionaries['Event'][key[0]],
+            'sport': values['Sport'][0],
+            'year': year,
+            'season': self.dictionaries['Season'][key[2]],
+            'city': values['City'][0],
+            'podium': podium
+        }
+
+def codes_by_value(categories):
+    codes = {}
+
+    for code, category in enumerate(categories):
+        codes.setdefault(normalize_value(category), []).append(code)
+
+    return codes
+
+def get_podium_index():
+    return get_derived("podium_index", PodiumIndex)
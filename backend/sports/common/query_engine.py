@@ -0,0 +1,524 @@
+import logging
+import sqlite3
+from abc import (
+    ABC,
+    abstractmethod
+)
+from os import environ
+
+import numpy as np
+import pandas as pd
+
+from common.dataset import (
+    COLUMNS,
+    STRING_COLUMNS,
+    get_dataset,
+    get_derived,
+    get_dataset_aggregates,
+    preload_dataset
+)
+from common.aggregates import medal_index_per_code
+from common.medal_cube import (
+    get_medal_cube,
+    get_event_medal_cube
+)
+from common.medal_facts import (
+    ATHLETE_COUNTING,
+    EVENT_COUNTING,
+    get_event_medals
+)
+from common.continents import (
+    CONTINENTS,
+    UNKNOWN_CONTINENT,
+    continent_code_per_team,
+    get_continent_codes,
+    get_event_continent_counts
+)
+from common.athlete_careers import get_athlete_careers
+from common.athlete_rankings import (
+    get_athlete_medal_counts,
+    top_k_athletes
+)
+from common.partitioned import PartitionedCounter
+from common.inverted_index import (
+    INDEXED_COLUMNS,
+    get_inverted_index,
+    normalize_value
+)
+
+logger = logging.getLogger("SportsQueryEngine")
+logger.setLevel(logging.INFO)
+
+# Engine that answers the sports queries, selected per deployment
+QUERY_ENGINE = environ.get("SPORTS_QUERY_ENGINE", "numpy")
+
+class QueryEngine(ABC):
+    """
+    Queries behind the sports handlers. Engines only compute the data, validation,
+    pagination and the response format stay in the handlers.
+
+    Sports filters are lists of sport names (unknown sports are ignored) or None for all sports,
+    team results are in the alphabetical order of their names and athletes are keyed by player_id.
+
+    Medal counts take a counting mode, ATHLETE_COUNTING counts every row of the dataset and
+    EVENT_COUNTING every medal of the official medal table (team members count once).
+    """
+    name = None
+
+    @abstractmethod
+    def medals_per_year(self, counting=ATHLETE_COUNTING):
+        """
+        Return (years, totals) with the number of gold, silver and bronze medals of every Games year
+        """
+
+    @abstractmethod
+    def continent_totals(self, min_year, max_year, counting=ATHLETE_COUNTING):
+        """
+        Return (totals in the order of CONTINENTS, rows of teams without a continent) for the inclusive year range.
+        Athlete counting totals all the participations, event counting only the medals.
+        """
+
+    @abstractmethod
+    def team_medals(self, min_year, max_year, list_of_sports=None, counting=ATHLETE_COUNTING):
+        """
+        Return (teams, array of gold, silver and bronze counts per team) for the inclusive year range
+        """
+
+    @abstractmethod
+    def team_medals_as_of(self, as_of_year, list_of_sports=None, counting=ATHLETE_COUNTING):
+        """
+        Return (teams, array of gold, silver and bronze counts per team) of all the Games up to and including the year
+        """
+
+    @abstractmethod
+    def top_athletes(self, min_year, max_year, list_of_sports=None, limit=5):
+        """
+        Return (player ids, names, counts in the order of MEDAL_COLUMNS) of the best athletes by gold, silver,
+        bronze and appearances, ties in player id order
+        """
+
+    @abstractmethod
+    def filter_rows(self, filters):
+        """
+        Return sorted row ids matching all the filters ({column: value}, case insensitive),
+        or None when there are no filters
+        """
+
+class NumpyQueryEngine(QueryEngine):
+    """
+    Queries answered by the prebuilt in-memory structures (medal cube, inverted index...)
+    """
+    name = "numpy"
+
+    def __init__(self, dataset):
+        # Structures are derived from the dataset cache by the first query that needs them
+        pass
+
+    def medals_per_year(self, counting=ATHLETE_COUNTING):
+        aggregates = get_dataset_aggregates()
+
+        if counting == EVENT_COUNTING:
+            return aggregates.years.tolist(), get_event_medals().year_totals(aggregates.years).tolist()
+
+        return aggregates.years.tolist(), aggregates.year_counts[:, :3].sum(axis=1).tolist()
+
+    def continent_totals(self, min_year, max_year, counting=ATHLETE_COUNTING):
+        continent_counts = get_event_continent_counts() if counting == EVENT_COUNTING else get_continent_codes()
+
+        # Difference of two prefix rows, the cost does not depend on the width of the year range
+        totals = continent_counts.year_counts.range_counts(min_year, max_year)
+        unknown_rows = int(continent_counts.unknown_year_counts.range_counts(min_year, max_year))
+
+        return totals.tolist(), unknown_rows
+
+    def team_medals(self, min_year, max_year, list_of_sports=None, counting=ATHLETE_COUNTING):
+        stored = stored_team_medals(min_year, max_year, list_of_sports, counting)
+
+        if stored is not None:
+            return stored
+
+        medal_cube = self.medal_cube(counting)
+
+        return medal_cube.teams, medal_cube.team_medals(min_year, max_year, self.sport_codes(medal_cube, list_of_sports))
+
+    def team_medals_as_of(self, as_of_year, list_of_sports=None, counting=ATHLETE_COUNTING):
+        stored = stored_team_medals(None, as_of_year, list_of_sports, counting)
+
+        if stored is not None:
+            return stored
+
+        medal_cube = self.medal_cube(counting)
+
+        return medal_cube.teams, medal_cube.team_medals_as_of(as_of_year, self.sport_codes(medal_cube, list_of_sports))
+
+    def top_athletes(self, min_year, max_year, list_of_sports=None, limit=5):
+        athlete_medal_counts = get_athlete_medal_counts()
+
+        top_codes, counts = athlete_medal_counts.top(min_year, max_year, self.sport_codes(athlete_medal_counts, list_of_sports), limit)
+
+        return athlete_medal_counts.player_ids[top_codes].tolist(), athlete_medal_counts.names[top_codes].tolist(), counts.tolist()
+
+    def filter_rows(self, filters):
+        return get_inverted_index().filter_rows(filters)
+
+    def sport_codes(self, structure, list_of_sports):
+        return structure.sport_codes(list_of_sports) if list_of_sports is not None else None
+
+    def medal_cube(self, counting):
+        return get_event_medal_cube() if counting == EVENT_COUNTING else get_medal_cube()
+
+class PartitionedQueryEngine(NumpyQueryEngine):
+    """
+    Filter and count queries scanned by a process pool over year partitions of the rows in shared memory,
+    meant for datasets too big for a single core. Row filters and event counting, whose table is
+    a small fraction of the rows, are answered like the numpy engine.
+    """
+    name = "partitioned"
+
+    def __init__(self, dataset):
+        self.athlete_careers = get_athlete_careers()
+        self.teams = dataset['Team'].cat.categories
+        self.sports = dataset['Sport'].cat.categories
+        self.continent_per_team = continent_code_per_team(self.teams)
+
+        self.counter = PartitionedCounter(
+            dataset['Year'].to_numpy(),
+            {
+                'player': self.athlete_careers.row_codes,
+                'team': dataset['Team'].cat.codes.to_numpy(),
+                'sport': dataset['Sport'].cat.codes.to_numpy(),
+                'medal': medal_index_per_code(dataset['Medal'].cat.categories)[dataset['Medal'].cat.codes.to_numpy()]
+            }
+        )
+
+    def medals_per_year(self, counting=ATHLETE_COUNTING):
+        if counting == EVENT_COUNTING:
+            return super().medals_per_year(counting)
+
+        counts = self.counter.count('year_index', len(self.counter.years))
+
+        return self.counter.years.tolist(), counts[:, :3].sum(axis=1).tolist()
+
+    def continent_totals(self, min_year, max_year, counting=ATHLETE_COUNTING):
+        if counting == EVENT_COUNTING:
+            return super().continent_totals(min_year, max_year, counting)
+
+        team_rows = self.counter.count('team', len(self.teams), min_year, max_year).sum(axis=1)
+        known_teams = self.continent_per_team != UNKNOWN_CONTINENT
+
+        totals = np.zeros(len(CONTINENTS), dtype=np.int64)
+        np.add.at(totals, self.continent_per_team[known_teams], team_rows[known_teams])
+
+        return totals.tolist(), int(team_rows[~known_teams].sum())
+
+    def team_medals(self, min_year, max_year, list_of_sports=None, counting=ATHLETE_COUNTING):
+        stored = stored_team_medals(min_year, max_year, list_of_sports, counting)
+
+        if stored is not None:
+            return stored
+
+        if counting == EVENT_COUNTING:
+            return super().team_medals(min_year, max_year, list_of_sports, counting)
+
+        counts = self.counter.count('team', len(self.teams), min_year, max_year, self.filter_sport_codes(list_of_sports))
+
+        return self.teams, counts[:, :3]
+
+    def team_medals_as_of(self, as_of_year, list_of_sports=None, counting=ATHLETE_COUNTING):
+        stored = stored_team_medals(None, as_of_year, list_of_sports, counting)
+
+        if stored is not None:
+            return stored
+
+        if counting == EVENT_COUNTING:
+            return super().team_medals_as_of(as_of_year, list_of_sports, counting)
+
+        counts = self.counter.count('team', len(self.teams), None, as_of_year, self.filter_sport_codes(list_of_sports))
+
+        return self.teams, counts[:, :3]
+
+    def top_athletes(self, min_year, max_year, list_of_sports=None, limit=5):
+        counts = self.counter.count('player', len(self.athlete_careers), min_year, max_year, self.filter_sport_codes(list_of_sports))
+        top_codes = top_k_athletes(counts, limit)
+
+        return (
+            self.athlete_careers.player_ids[top_codes].tolist(),
+            self.athlete_careers.player_names(top_codes).tolist(),
+            counts[top_codes].tolist()
+        )
+
+    def filter_sport_codes(self, list_of_sports):
+        """
+        Return Sport category codes of the sports that exist, unknown sports are ignored
+        """
+        if list_of_sports is None:
+            return None
+
+        indexer = self.sports.get_indexer(list_of_sports)
+
+        return indexer[indexer >= 0]
+
+class SqliteQueryEngine(QueryEngine):
+    """
+    Queries answered with SQL by an in-memory SQLite database holding the columnar dataset:
+    a results table of dictionary codes and one dictionary table per string column
+    """
+    name = "sqlite"
+
+    def __init__(self, dataset):
+        self.connection = sqlite3.connect(":memory:", check_same_thread=False)
+
+        self.create_dictionaries(dataset)
+        self.create_results(dataset)
+
+        logger.info(f"SQLite database with {len(dataset)} rows, size: {self.database_bytes()} bytes")
+
+    def create_dictionaries(self, dataset):
+        """
+        Create the dictionary of every string column, the medal position of every Medal code
+        and the continent of every Team code
+        """
+        for column in STRING_COLUMNS:
+            table = dictionary_table(column)
+            categories = dataset[column].cat.categories
+
+            self.connection.execute(f"CREATE TABLE {table} (code INTEGER PRIMARY KEY, value TEXT NOT NULL, normalized TEXT NOT NULL)")
+            self.connection.executemany(
+                f"INSERT INTO {table} VALUES (?, ?, ?)",
+                ((code, value, normalize_value(value)) for code, value in enumerate(categories))
+            )
+            self.connection.execute(f"CREATE INDEX {table}_normalized ON {table} (normalized)")
+
+        self.connection.execute("CREATE TABLE medal_positions (code INTEGER PRIMARY KEY, position INTEGER NOT NULL)")
+        self.connection.executemany(
+            "INSERT INTO medal_positions VALUES (?, ?)",
+            enumerate(medal_index_per_code(dataset['Medal'].cat.categories).tolist())
+        )
+
+        self.connection.execute("CREATE TABLE team_continents (code INTEGER PRIMARY KEY, continent INTEGER NOT NULL)")
+        self.connection.executemany(
+            "INSERT INTO team_continents VALUES (?, ?)",
+            enumerate(continent_code_per_team(dataset['Team'].cat.categories).tolist())
+        )
+
+    def create_results(self, dataset):
+        """
+        Create the results table, row_id is the position of the row in the dataset
+        """
+        columns = [column.lower() for column in COLUMNS]
+        values = [
+            dataset[column].cat.codes.to_numpy().tolist() if column in STRING_COLUMNS else dataset[column].to_numpy().tolist()
+            for column in COLUMNS
+        ]
+
+        self.connection.execute(f"CREATE TABLE results (row_id INTEGER PRIMARY KEY, {', '.join(f'{column} INTEGER NOT NULL' for column in columns)})")
+        self.connection.executemany(
+            f"INSERT INTO results VALUES ({', '.join(['?'] * (len(columns) + 1))})",
+            zip(range(len(dataset)), *values)
+        )
+
+        # Year ranges and the filters of the sportsmen list are answered from indexes
+        for column in ['Year'] + INDEXED_COLUMNS:
+            self.connection.execute(f"CREATE INDEX results_{column.lower()} ON results ({column.lower()})")
+
+        # Medal-only fact table, medal counts don't read the "No medal" participations
+        self.connection.execute(
+            """
+            CREATE TABLE medals AS
+            SELECT r.row_id, r.year, r.team, r.sport, p.position AS medal
+            FROM results r JOIN medal_positions p ON p.code = r.medal
+            WHERE p.position < 3
+            """
+        )
+        self.connection.execute("CREATE INDEX medals_year ON medals (year)")
+
+        # Official medal table, the members of a team share one medal
+        self.connection.execute(
+            """
+            CREATE TABLE event_medals AS
+            SELECT MIN(m.row_id) AS row_id, m.year, m.team, m.sport, m.medal
+            FROM medals m JOIN results r ON r.row_id = m.row_id
+            GROUP BY m.year, r.season, r.event, m.team, m.medal
+            """
+        )
+        self.connection.execute("CREATE INDEX event_medals_year ON event_medals (year)")
+
+        self.connection.execute("ANALYZE")
+        self.connection.commit()
+
+    def database_bytes(self):
+        page_count = self.connection.execute("PRAGMA page_count").fetchone()[0]
+        page_size = self.connection.execute("PRAGMA page_size").fetchone()[0]
+
+        return page_count * page_size
+
+    def medals_per_year(self, counting=ATHLETE_COUNTING):
+        rows = self.connection.execute(
+            f"""
+            SELECT y.year, COUNT(m.row_id)
+            FROM (SELECT DISTINCT year FROM results) y LEFT JOIN {medal_table(counting)} m ON m.year = y.year
+            GROUP BY y.year
+            ORDER BY y.year
+            """
+        ).fetchall()
+
+        return [year for year, _ in rows], [total for _, total in rows]
+
+    def continent_totals(self, min_year, max_year, counting=ATHLETE_COUNTING):
+        totals = [0] * len(CONTINENTS)
+        unknown_rows = 0
+
+        # Athlete counting totals all the participations, not only the medals
+        table = "event_medals" if counting == EVENT_COUNTING else "results"
+
+        rows = self.connection.execute(
+            f"""
+            SELECT c.continent, COUNT(*)
+            FROM {table} r JOIN team_continents c ON c.code = r.team
+            WHERE r.year BETWEEN ? AND ?
+            GROUP BY c.continent
+            """,
+            (min_year, max_year)
+        )
+
+        for continent, total in rows:
+            if continent == UNKNOWN_CONTINENT:
+                unknown_rows = total
+            else:
+                totals[continent] = total
+
+        return totals, unknown_rows
+
+    def team_medals(self, min_year, max_year, list_of_sports=None, counting=ATHLETE_COUNTING):
+        stored = stored_team_medals(min_year, max_year, list_of_sports, counting)
+
+        if stored is not None:
+            return stored
+
+        return self.query_team_medals("r.year BETWEEN ? AND ?", [min_year, max_year], list_of_sports, counting)
+
+    def team_medals_as_of(self, as_of_year, list_of_sports=None, counting=ATHLETE_COUNTING):
+        stored = stored_team_medals(None, as_of_year, list_of_sports, counting)
+
+        if stored is not None:
+            return stored
+
+        return self.query_team_medals("r.year <= ?", [as_of_year], list_of_sports, counting)
+
+    def query_team_medals(self, year_condition, parameters, list_of_sports, counting=ATHLETE_COUNTING):
+        sport_condition, sport_parameters = sport_filter(list_of_sports)
+
+        rows = self.connection.execute(
+            f"""
+            SELECT d.value, SUM(r.medal = 0), SUM(r.medal = 1), SUM(r.medal = 2)
+            FROM {medal_table(counting)} r
+                JOIN {dictionary_table('Team')} d ON d.code = r.team
+            WHERE {year_condition} {sport_condition}
+            GROUP BY r.team
+            ORDER BY r.team
+            """,
+            parameters + sport_parameters
+        ).fetchall()
+
+        return (
+            pd.Index([team for team, *_ in rows]),
+            np.array([counts for _, *counts in rows], dtype=np.int64).reshape(len(rows), 3)
+        )
+
+    def top_athletes(self, min_year, max_year, list_of_sports=None, limit=5):
+        sport_condition, sport_parameters = sport_filter(list_of_sports)
+
+        rows = self.connection.execute(
+            f"""
+            SELECT r.player_id, MIN(d.value), SUM(p.position = 0) AS gold, SUM(p.position = 1) AS silver, SUM(p.position = 2) AS bronze, SUM(p.position = 3)
+            FROM results r
+                JOIN medal_positions p ON p.code = r.medal
+                JOIN {dictionary_table('Name')} d ON d.code = r.name
+            WHERE r.year BETWEEN ? AND ? {sport_condition}
+            GROUP BY r.player_id
+            ORDER BY gold DESC, silver DESC, bronze DESC, COUNT(*) DESC, r.player_id
+            LIMIT ?
+            """,
+            [min_year, max_year] + sport_parameters + [limit]
+        ).fetchall()
+
+        return [player_id for player_id, *_ in rows], [name for _, name, *_ in rows], [counts for _, _, *counts in rows]
+
+    def filter_rows(self, filters):
+        conditions = []
+        parameters = []
+
+        for column, value in filters.items():
+            if value:
+                conditions.append(f"r.{column.lower()} IN (SELECT code FROM {dictionary_table(column)} WHERE normalized = ?)")
+                parameters.append(normalize_value(value))
+
+        if not conditions:
+            return None
+
+        rows = self.connection.execute(
+            f"SELECT r.row_id FROM results r WHERE {' AND '.join(conditions)} ORDER BY r.row_id",
+            parameters
+        )
+
+        return np.fromiter((row_id for row_id, in rows), dtype=np.int32)
+
+def stored_team_medals(min_year, max_year, list_of_sports, counting):
+    """
+    Return (teams, array of gold, silver and bronze counts per team) from the team counts of the dataset
+    aggregates, which ingestion keeps up to date, when the query covers all the rows they count: every
+    sport and every year (min_year None for as_of queries) with athlete counting. Otherwise None.
+    """
+    if list_of_sports is not None or counting != ATHLETE_COUNTING:
+        return None
+
+    aggregates = get_dataset_aggregates()
+
+    if len(aggregates.years) == 0 or (min_year is not None and min_year > aggregates.years[0]) or max_year < aggregates.years[-1]:
+        return None
+
+    # The team axis follows the Team dictionary, teams without medals are left out by the leaderboard order
+    return get_dataset()['Team'].cat.categories, aggregates.team_counts[:, :3]
+
+def dictionary_table(column):
+    return f"dictionary_{column.lower()}"
+
+def medal_table(counting):
+    return "event_medals" if counting == EVENT_COUNTING else "medals"
+
+def sport_filter(list_of_sports):
+    """
+    Return the SQL condition and parameters that keep the rows of the given sports
+    """
+    if list_of_sports is None:
+        return "", []
+
+    placeholders = ", ".join(["?"] * len(list_of_sports))
+
+    return f"AND r.sport IN (SELECT code FROM {dictionary_table('Sport')} WHERE value IN ({placeholders}))", list(list_of_sports)
+
+QUERY_ENGINES = {
+    engine.name: engine
+    for engine in [NumpyQueryEngine, PartitionedQueryEngine, SqliteQueryEngine]
+}
+
+def get_query_engine(name=None):
+    """
+    Return the engine with the given name, by default the one configured with SPORTS_QUERY_ENGINE
+    """
+    name = name or QUERY_ENGINE
+
+    if name not in QUERY_ENGINES:
+        raise ValueError(f"Unknown query engine {name}, expected one of {sorted(QUERY_ENGINES)}")
+
+    return get_derived(f"query_engine_{name}", QUERY_ENGINES[name])
+
+def preload_query_engine(*numpy_getters):
+    """
+    Build the configured engine during the Lambda init phase, for the numpy engine
+    only the structures the handler reads are built
+    """
+    if QUERY_ENGINE == NumpyQueryEngine.name:
+        preload_dataset(get_query_engine, *numpy_getters)
+    else:
+        preload_dataset(get_query_engine)
@@ -0,0 +1,65 @@
+import logging
+
+import msgpack
+
+from common.dataset import (
+    STRING_COLUMNS,
+    get_derived
+)
+
+logger = logging.getLogger("SportsResponseFormats")
+logger.setLevel(logging.INFO)
+
+JSON_FORMAT = "json"
+COLUMNAR_FORMAT = "columnar"
+MSGPACK_FORMAT = "msgpack"
+RESPONSE_FORMATS = [JSON_FORMAT, COLUMNAR_FORMAT, MSGPACK_FORMAT]
+
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+class ColumnarRows:
+    """
+    Codes and dictionaries of dataset columns, a set of rows is read as one list per column
+    by indexing the arrays, without going through a DataFrame or a dict per row
+    """
+    def __init__(self, dataset, columns):
+        self.fields = [column.lower() for column in columns]
+        self.arrays = {}
+        self.dictionaries = {}
+
+        for field, column in zip(self.fields, columns):
+            if column in STRING_COLUMNS:
+                self.arrays[field] = dataset[column].cat.codes.to_numpy()
+                self.dictionaries[field] = dataset[column].cat.categories.to_numpy(dtype=object)
+            else:
+                self.arrays[field] = dataset[column].to_numpy()
+
+    def columns(self, rows):
+        """
+        Return {field: list of the values of the rows}
+        """
+        columns = {}
+
+        for field in self.fields:
+            values = self.arrays[field][rows]
+
+            if field in self.dictionaries:
+                values = self.dictionaries[field][values]
+
+            columns[field] = values.tolist()
+
+        return columns
+
+def columns_to_records(columns):
+    """
+    Return one dict per row of {field: list of values}, the classic JSON format
+    """
+    fields = list(columns)
+
+    return [dict(zip(fields, values)) for values in zip(*columns.values())]
+
+def encode_msgpack(body):
+    return msgpack.packb(body, use_bin_type=True)
+
+def get_columnar_rows(columns):
+    return get_derived(f"columnar_rows_{'_'.join(columns)}", lambda dataset: ColumnarRows(dataset, columns))
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from os import environ
+
+from common.dataset import (
+    get_dataset_cache_stats,
+    get_dataset_fingerprint
+)
+
+logger = logging.getLogger("SportsResultCache")
+logger.setLevel(logging.INFO)
+
+RESULT_CACHE_MAX_ENTRIES = int(environ.get("RESULT_CACHE_MAX_ENTRIES", "256"))
+RESULT_CACHE_MAX_BYTES = int(environ.get("RESULT_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+RESULT_CACHE_TTL_SECONDS = float(environ.get("RESULT_CACHE_TTL_SECONDS", "3600"))
+
+class ResultCache:
+    """
+    Container wide cache of query results, bounded by number of entries and by bytes held
+    (size of the JSON serialized result). Least recently used entries are evicted first
+    and entries older than the TTL are treated as missing.
+    """
+    def __init__(self, max_entries=RESULT_CACHE_MAX_ENTRIES, max_bytes=RESULT_CACHE_MAX_BYTES, ttl_seconds=RESULT_CACHE_TTL_SECONDS, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+
+        # key -> (expires at, size in bytes, result), the most recently used entry is the last one
+        self.entries = OrderedDict()
+        self.bytes_held = 0
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0
+        }
+
+    def get(self, key):
+        """
+        Return (found, result) for the key, a hit moves the entry to the most recently used end
+        """
+        entry = self.entries.get(key)
+
+        if entry is None:
+            self.stats["misses"] += 1
+            return False, None
+
+        expires_at, _, result = entry
+
+        if self.clock() >= expires_at:
+            self.remove(key)
+            self.stats["expirations"] += 1
+            self.stats["misses"] += 1
+            return False, None
+
+        self.entries.move_to_end(key)
+        self.stats["hits"] += 1
+
+        return True, result
+
+    def put(self, key, result):
+        """
+        Store the result, evicting least recently used entries until it fits.
+        Results bigger than the whole cache are not stored.
+        """
+        size = len(json.dumps(result, default=str))
+
+        if size > self.max_bytes or self.max_entries < 1:
+            logger.info(f"Result of {size} bytes is not cached, cache limit is {self.max_bytes} bytes")
+            return
+
+        if key in self.entries:
+            self.remove(key)
+
+        while self.entries and (len(self.entries) >= self.max_entries or self.bytes_held + size > self.max_bytes):
+            self.remove(next(iter(self.entries)))
+            self.stats["evictions"] += 1
+
+        self.entries[key] = (self.clock() + self.ttl_seconds, size, result)
+        self.bytes_held += size
+
+    def remove(self, key):
+        _, size, _ = self.entries.pop(key)
+        self.bytes_held -= size
+
+    def get_or_compute(self, key, compute):
+        """
+        Return the cached result of the key, or call compute() and cache what it returns
+        """
+        found, result = self.get(key)
+
+        if found:
+            logger.debug(f"Result cache hit for {key}")
+            return result
+
+        result = compute()
+        self.put(key, result)
+
+        return result
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes_held = 0
+
+    def get_stats(self):
+        """
+        Return hit ratio, bytes held and eviction counters of the cache
+        """
+        lookups = self.stats["hits"] + self.stats["misses"]
+
+        return {
+            **self.stats,
+            "hit_ratio": round(self.stats["hits"] / lookups, 4) if lookups else 0.0,
+            "entries": len(self.entries),
+            "bytes_held": self.bytes_held
+        }
+
+_result_cache = ResultCache()
+
+def get_result_cache():
+    return _result_cache
+
+def canonical_query_key(endpoint, params):
+    """
+    Return the cache key of validated query parameters, callers pass the parsed values with defaults
+    filled in so equivalent query strings share an entry. List values are sorted and the key is tied
+    to the loaded dataset, a reloaded dataset never serves results computed from the previous one.
+    """
+    return json.dumps(
+        [endpoint, get_dataset_cache_stats().get("loaded_at"), canonical_params(params)],
+        sort_keys=True,
+        separators=(',', ':'),
+        default=str
+    )
+
+def query_etag(endpoint, params):
+    """
+    Return the strong ETag of the response to validated query parameters (same parameters as
+    canonical_query_key). It is hashed from the dataset fingerprint instead of the load time,
+    so every container serving the same data returns the same ETag.
+    """
+    query = json.dumps(
+        [endpoint, get_dataset_fingerprint(), canonical_params(params)],
+        sort_keys=True,
+        separators=(',', ':'),
+        default=str
+    )
+
+    return f'"{hashlib.sha256(query.encode("utf-8")).hexdigest()[:32]}"'
+
+def canonical_params(params):
+    return {
+        name: sorted(value) if isinstance(value, list) else value
+        for name, value in params.items()
+    }
@@ -0,0 +1,144 @@
+import numpy as np
+
+# Rows of a row group, the last group of a segment can be smaller
+ROW_GROUP_ROWS = 8192
+
+# Columns with min/max metadata per row group, string columns use the alphabetical order of their values
+ZONE_MAP_COLUMNS = ['Year', 'Sport', 'Medal']
+
+def row_group_starts(row_count, row_group_rows=ROW_GROUP_ROWS):
+    return np.arange(0, row_count, row_group_rows)
+
+def zone_map_row_groups(values, dictionaries, row_group_rows=ROW_GROUP_ROWS):
+    """
+    Return the manifest entries of the row groups of a segment, the row count and the min/max value of every zone map column
+
+    values: {column: values of the integer columns and dictionary codes of the string columns}
+    dictionaries: {column: dictionary} of the string columns, in code order
+    """
+    row_count = len(values[ZONE_MAP_COLUMNS[0]])
+    starts = row_group_starts(row_count, row_group_rows)
+    row_groups = [
+        {
+            "rows": int(min(row_group_rows, row_count - start)),
+            "min": {},
+            "max": {}
+        }
+        for start in starts.tolist()
+    ]
+
+    if row_count == 0:
+        return row_groups
+
+    for column in ZONE_MAP_COLUMNS:
+        column_values = np.asarray(values[column])
+        to_value = int
+
+        if column in dictionaries:
+            # Dictionaries can be append-only, min/max are taken over the alphabetical rank of the codes
+            dictionary = dictionaries[column]
+            order = np.argsort(np.array(dictionary, dtype=object), kind='stable')
+            rank_per_code = np.empty(len(dictionary), dtype=np.int64)
+            rank_per_code[order] = np.arange(len(dictionary))
+
+            column_values = rank_per_code[column_values]
+            to_value = lambda rank, dictionary=dictionary, order=order: dictionary[order[rank]]
+
+        minimums = np.minimum.reduceat(column_values, starts).tolist()
+        maximums = np.maximum.reduceat(column_values, starts).tolist()
+
+        for row_group, minimum, maximum in zip(row_groups, minimums, maximums):
+            row_group["min"][column] = to_value(minimum)
+            row_group["max"][column] = to_value(maximum)
+
+    return row_groups
+
+class ZoneMaps:
+    """
+    Row groups of the dataset with the min/max Year and Sport and Medal category codes of their rows.
+    The base segment is sorted by Year but segments appended by ingestion are not, so pruning relies on
+    the own min/max of every row group rather than on a global order: a year range only reads the row
+    groups whose Year range overlaps it.
+    """
+    def __init__(self, offsets, minimums, maximums):
+        """
+        Initialize zone maps
+
+        offsets: first row of every row group followed by the row count
+        minimums, maximums: {column: array with a value per row group} of the ZONE_MAP_COLUMNS
+        """
+        self.offsets = offsets
+        self.minimums = minimums
+        self.maximums = maximums
+
+    @classmethod
+    def from_dataset(cls, dataset, row_group_rows=ROW_GROUP_ROWS):
+        """
+        Build zone maps over fixed size row groups of a dataset with categorical columns
+        """
+        starts = row_group_starts(len(dataset), row_group_rows)
+        minimums = {}
+        maximums = {}
+
+        for column in ZONE_MAP_COLUMNS:
+            values = dataset[column].cat.codes.to_numpy() if hasattr(dataset[column], 'cat') else dataset[column].to_numpy()
+
+            minimums[column] = np.minimum.reduceat(values, starts) if len(values) > 0 else values[:0]
+            maximums[column] = np.maximum.reduceat(values, starts) if len(values) > 0 else values[:0]
+
+        return cls(np.append(starts, len(dataset)), minimums, maximums)
+
+    @classmethod
+    def from_row_groups(cls, row_groups, dataset):
+        """
+        Build zone maps from the manifest entries of the row groups of all the segments, in segment order
+        """
+        offsets = np.zeros(len(row_groups) + 1, dtype=np.int64)
+        np.cumsum([row_group["rows"] for row_group in row_groups], out=offsets[1:])
+
+        minimums = {}
+        maximums = {}
+
+        for column in ZONE_MAP_COLUMNS:
+            minimum_values = [row_group["min"][column] for row_group in row_groups]
+            maximum_values = [row_group["max"][column] for row_group in row_groups]
+
+            if hasattr(dataset[column], 'cat'):
+                # Categories are sorted, so the min/max value is also the min/max code
+                minimums[column] = dataset[column].cat.categories.get_indexer(minimum_values)
+                maximums[column] = dataset[column].cat.categories.get_indexer(maximum_values)
+            else:
+                minimums[column] = np.array(minimum_values, dtype=np.int64)
+                maximums[column] = np.array(maximum_values, dtype=np.int64)
+
+        return cls(offsets, minimums, maximums)
+
+    def candidate_groups(self, min_year=None, max_year=None, sport_codes=None, medal_codes=None):
+        """
+        Return a mask of the row groups that can hold rows in the inclusive year range and the given codes
+        """
+        mask = np.ones(len(self.offsets) - 1, dtype=bool)
+
+        if min_year is not None:
+            mask &= self.maximums['Year'] >= min_year
+
+        if max_year is not None:
+            mask &= self.minimums['Year'] <= max_year
+
+        for column, codes in (('Sport', sport_codes), ('Medal', medal_codes)):
+            if codes is not None:
+                sorted_codes = np.sort(codes)
+
+                # A group can match when at least one of the codes is between its min and max
+                mask &= np.searchsorted(sorted_codes, self.minimums[column], side='left') < np.searchsorted(sorted_codes, self.maximums[column], side='right')
+
+        return mask
+
+    def row_ranges(self, min_year=None, max_year=None, sport_codes=None, medal_codes=None):
+        """
+        Return (start, end) row ranges of the row groups that can match, adjacent groups are merged
+        """
+        mask = np.concatenate([[False], self.candidate_groups(min_year, max_year, sport_codes, medal_codes), [False]])
+        changes = np.flatnonzero(mask[1:] != mask[:-1])
+
+        return list(zip(self.offsets[changes[::2]].tolist(), self.offsets[changes[1::2]].tolist()))
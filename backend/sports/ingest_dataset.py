@@ -0,0 +1,32 @@
+import argparse
+import sys
+
+from common.dataset import DATASET_ARTIFACT_PATH
+from common.ingestion import (
+    DeltaValidationError,
+    ingest_delta
+)
+
+def ingest_deltas(delta_paths, artifact):
+    for delta_path in delta_paths:
+        print(f"Ingesting {delta_path} into {artifact}")
+
+        try:
+            manifest = ingest_delta(delta_path, artifact)
+        except DeltaValidationError as e:
+            print(f"Delta {delta_path} is not valid:")
+
+            for error in e.errors:
+                print(f"  {error}")
+
+            sys.exit(1)
+
+        print(f"Version: {manifest['version']}, rows: {manifest['rows']}, segments: {len(manifest['segments'])}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Append new Games results to the columnar artifact without rebuilding it")
+    parser.add_argument("--delta", nargs="+", required=True, help="Delta CSV files with the dataset columns, ingested in the given order")
+    parser.add_argument("--artifact", default=DATASET_ARTIFACT_PATH, help="Directory of the columnar artifact")
+    args = parser.parse_args()
+
+    ingest_deltas(args.delta, args.artifact)
@@ -5,6 +5,11 @@ import json
 from moto import mock_aws
 from boto3 import resource, client
 
+# Clients in common are created when the handlers are imported, before moto starts,
+# so fake credentials have to exist already at import time
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
 @mock_aws
 class BaseTestSetup(unittest.TestCase):
     def setUp(self):
@@ -13,6 +18,7 @@ class BaseTestSetup(unittest.TestCase):
         os.environ["JWT_SECRET_NAME"] = "secret"
         os.environ["SECRETS_REGION_NAME"] = "eu-central-1"
         os.environ["AWS_REGION"] = "eu-central-1"
+        os.environ["SPORTS_EXPORTS_BUCKET"] = "test_exports_bucket"
 
         # Mocked Secrets Manager
         self.secrets_manager = client('secretsmanager', region_name='eu-central-1')
@@ -54,4 +60,14 @@ class BaseTestSetup(unittest.TestCase):
         }
 
         self.table.put_item(Item=self.sample_user)
-        
\ No newline at end of file
+        
+
+        # Mocked S3
+        self.s3_client = client('s3', region_name='eu-central-1')
+
+        self.s3_client.create_bucket(
+            Bucket=os.environ["SPORTS_EXPORTS_BUCKET"],
+            CreateBucketConfiguration={
+                'LocationConstraint': 'eu-central-1'
+            }
+        )
@@ -0,0 +1,166 @@
+import unittest
+import tempfile
+import shutil
+import os
+import numpy as np
+import pandas as pd
+
+from common.dataset import (
+    get_dataset,
+    get_dataset_cache_stats,
+    get_derived,
+    load_dataset,
+    load_csv_dataset,
+    file_sha256,
+    dataset_fingerprint,
+    write_columnar_dataset
+)
+
+class TestDatasetCache(unittest.TestCase):
+    def test_dataset_is_loaded_once(self):
+        """
+        Test that repeated calls are served from the cache.
+        """
+
+        # Arrange
+        get_dataset()
+        stats_before = get_dataset_cache_stats()
+
+        # Act
+        get_dataset()
+        get_dataset()
+        stats_after = get_dataset_cache_stats()
+
+        # Assert
+        self.assertEqual(stats_after['misses'], stats_before['misses'])
+        self.assertEqual(stats_after['hits'], stats_before['hits'] + 2)
+        self.assertIsNotNone(stats_after['load_time_ms'])
+        self.assertGreater(stats_after['rows'], 0)
+
+    def test_derived_lookups_are_counted_as_hits(self):
+        """
+        Test that lookups of an already built derived structure count as cache hits.
+        """
+
+        # Arrange
+        get_derived("test_row_count", len)
+        stats_before = get_dataset_cache_stats()
+
+        # Act
+        row_count = get_derived("test_row_count", len)
+        get_derived("test_row_count", len)
+        stats_after = get_dataset_cache_stats()
+
+        # Assert
+        self.assertEqual(row_count, stats_after['rows'])
+        self.assertEqual(stats_after['misses'], stats_before['misses'])
+        self.assertEqual(stats_after['hits'], stats_before['hits'] + 2)
+
+    def test_modifying_view_does_not_change_cache(self):
+        """
+        Test that changes made on a returned dataset are not visible to other callers.
+        """
+
+        # Arrange
+        dataset = get_dataset()
+        original_first_team = dataset['Team'].iloc[0]
+
+        # Act
+        dataset['Team'] = 'Modified'
+        dataset['continent'] = 'unknown'
+        fresh_dataset = get_dataset()
+
+        # Assert
+        self.assertEqual(fresh_dataset['Team'].iloc[0], original_first_team)
+        self.assertNotIn('continent', fresh_dataset.columns)
+
+class TestColumnarDataset(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.temp_dir, "dataset.csv")
+        self.artifact_path = os.path.join(self.temp_dir, "dataset_columnar")
+
+        get_dataset().head(1000).to_csv(self.csv_path, index=False)
+        write_columnar_dataset(load_csv_dataset(self.csv_path), self.artifact_path, file_sha256(self.csv_path))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_columnar_artifact_matches_csv(self):
+        """
+        Test that the columnar artifact is used and holds the same data as the CSV.
+        """
+
+        # Act
+        dataset, source, _, _, _ = load_dataset(self.csv_path, self.artifact_path)
+
+        # Assert
+        self.assertEqual(source, "columnar")
+        pd.testing.assert_frame_equal(dataset, load_csv_dataset(self.csv_path))
+
+    def test_columnar_dataset_is_not_copied(self):
+        """
+        Test that the columns of a dataset loaded from the artifact are views of the memory-mapped files.
+        """
+
+        def is_memory_mapped(values):
+            while values is not None and not isinstance(values, np.memmap):
+                values = values.base
+
+            return values is not None
+
+        # Act
+        dataset, _, _, _, _ = load_dataset(self.csv_path, self.artifact_path)
+
+        # Assert
+        for column in dataset.columns:
+            with self.subTest(column=column):
+                values = dataset[column].array.codes if hasattr(dataset[column], 'cat') else dataset[column].to_numpy()
+
+                self.assertTrue(is_memory_mapped(values))
+
+    def test_fingerprint_follows_content(self):
+        """
+        Test that the fingerprint doesn't depend on how the dataset was loaded, only on its content.
+        """
+
+        # Arrange
+        csv_dataset = load_csv_dataset(self.csv_path)
+        columnar_dataset, _, _, _, _ = load_dataset(self.csv_path, self.artifact_path)
+
+        # Act
+        fingerprint = dataset_fingerprint(csv_dataset)
+
+        # Assert
+        self.assertEqual(dataset_fingerprint(columnar_dataset), fingerprint)
+        self.assertNotEqual(dataset_fingerprint(csv_dataset.head(999)), fingerprint)
+
+    def test_fallback_to_csv_when_artifact_is_stale(self):
+        """
+        Test that the CSV is used when it changed after the artifact was built.
+        """
+
+        # Arrange
+        load_csv_dataset(self.csv_path).head(10).to_csv(self.csv_path, index=False)
+
+        # Act
+        dataset, source, _, _, _ = load_dataset(self.csv_path, self.artifact_path)
+
+        # Assert
+        self.assertEqual(source, "csv")
+        self.assertEqual(len(dataset), 10)
+
+    def test_fallback_to_csv_when_artifact_is_missing(self):
+        """
+        Test that the CSV is used when there is no artifact.
+        """
+
+        # Arrange
+        shutil.rmtree(self.artifact_path)
+
+        # Act
+        dataset, source, _, _, _ = load_dataset(self.csv_path, self.artifact_path)
+
+        # Assert
+        self.assertEqual(source, "csv")
+        self.assertEqual(len(dataset), 1000)
@@ -0,0 +1,199 @@
+from base_test_setups import BaseTestSetup
+from moto import mock_aws
+from unittest.mock import patch
+
+import json
+import jwt
+
+import sys
+import os
+
+if 'validation_schema' in sys.modules:
+    del sys.modules['validation_schema']
+
+new_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ExportSportsAchievements'))
+sys.path.append(new_path)
+
+from ExportSportsAchievements import lambda_handler as export_handler
+from ExportSportsAchievements.lambda_handler import lambda_handler
+from common.inverted_index import get_inverted_index
+
+@mock_aws
+class TestExportSportsAchievementsLambda(BaseTestSetup):
+    def setUp(self):
+        super().setUp()
+
+    def build_event(self, query_params, headers=None):
+        return {
+            'headers': {
+                'Authorization': jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256"),
+                **(headers or {})
+            },
+            "queryStringParameters": query_params
+        }
+
+    def test_when_user_unauthorized(self):
+        """
+        Test response when user is unauthorized.
+        """
+        
+        # Arrange
+        event = {
+            'headers': {}
+        }
+
+        # Act
+        response = lambda_handler(event, {})
+        body = json.loads(response['body'])
+        
+        # Assert
+        self.assertEqual(response['statusCode'], 401)
+        self.assertEqual(body['message'], "Invalid token, please login again")
+
+    def test_validation_schema(self):
+        """
+        Test response when validation schema is not satisfied.
+        """
+
+        test_cases = [
+            {
+                "request_query": {
+                    "format": "xml"
+                },
+                "expected_validation_message": "data.format must be one of ['ndjson', 'csv']"
+            },
+            {
+                "request_query": {
+                    "sex": "NOT_VALID"
+                },
+                "expected_validation_message": "sex must be one of ['M', 'F']"
+            },
+            {
+                "request_query": {
+                    "additional_field": "1"
+                },
+                "expected_validation_message": "data must not contain {'additional_field'} properties"
+            }
+        ]
+
+        for case in test_cases:
+            with self.subTest(request_query=case["request_query"], expected_validation_message=case["expected_validation_message"]):
+                # Act
+                response = lambda_handler(self.build_event(case["request_query"]), {})
+                body = json.loads(response['body'])
+                
+                # Assert
+                self.assertEqual(response['statusCode'], 400)
+                self.assertIn(case["expected_validation_message"], body['message'])
+
+    def test_success_inline_ndjson(self):
+        """
+        Test that a small export is returned in the response as one JSON object per row.
+        """
+
+        # Arrange
+        query_params = {
+            "sex": "F",
+            "medal": "gold",
+            "sport": "judo"
+        }
+        expected_rows = get_inverted_index().filter_rows({'Sex': "F", 'Medal': "gold", 'Sport': "judo"})
+
+        # Act
+        response = lambda_handler(self.build_event(query_params), {})
+        body = json.loads(response['body'])
+
+        # Assert
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(body['format'], "ndjson")
+        self.assertEqual(body['row_count'], len(expected_rows))
+
+        lines = body['data'].splitlines()
+        self.assertEqual(len(lines), len(expected_rows))
+
+        for line in lines:
+            record = json.loads(line)
+            self.assertEqual(set(record), {'name', 'sex', 'sport', 'event', 'medal', 'team', 'year'})
+            self.assertEqual(record['medal'], "Gold")
+
+    def test_inline_export_not_modified(self):
+        """
+        Test that an inline export carries an ETag and a matching If-None-Match gets a 304 without filtering again.
+        """
+
+        # Arrange
+        query_params = {
+            "sex": "F",
+            "medal": "gold",
+            "sport": "judo"
+        }
+
+        response = lambda_handler(self.build_event(query_params), {})
+        etag = response['headers']['ETag']
+
+        # Act
+        with patch.object(export_handler, "apply_filters_to_dataset") as apply_filters_to_dataset:
+            not_modified = lambda_handler(self.build_event(query_params, {'If-None-Match': etag}), {})
+
+        other_format = lambda_handler(self.build_event({**query_params, "format": "csv"}, {'If-None-Match': etag}), {})
+
+        # Assert
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(response['headers']['Cache-Control'], "private, no-cache")
+
+        self.assertEqual(not_modified['statusCode'], 304)
+        self.assertEqual(not_modified['body'], "")
+        self.assertEqual(not_modified['headers']['ETag'], etag)
+        apply_filters_to_dataset.assert_not_called()
+
+        self.assertEqual(other_format['statusCode'], 200)
+        self.assertNotEqual(other_format['headers']['ETag'], etag)
+
+    def test_chunks_are_generated_lazily(self):
+        """
+        Test that the CSV export is produced in chunks with a single header.
+        """
+
+        # Arrange
+        rows = get_inverted_index().filter_rows({'Sex': "F", 'Sport': "judo"})
+
+        # Act
+        chunks = export_handler.iter_export_chunks(rows, "csv", chunk_rows=10)
+        header = next(chunks)
+        body_chunks = list(chunks)
+
+        # Assert
+        self.assertEqual(header.decode("utf-8"), "name,sex,sport,event,medal,team,year\n")
+        self.assertEqual(len(body_chunks), -(-len(rows) // 10))
+        self.assertEqual(sum(chunk.decode("utf-8").count("\n") for chunk in body_chunks), len(rows))
+
+    def test_success_s3_csv(self):
+        """
+        Test that an export bigger than the inline limit is uploaded to S3 and returned as a presigned URL.
+        """
+
+        # Arrange
+        query_params = {
+            "format": "csv",
+            "sex": "F"
+        }
+
+        # Act
+        with patch.object(export_handler, "EXPORT_INLINE_MAX_BYTES", 1024), patch.object(export_handler, "EXPORT_PART_BYTES", 5 * 1024 * 1024):
+            response = lambda_handler(self.build_event(query_params), {})
+
+        body = json.loads(response['body'])
+
+        # Assert
+        self.assertEqual(response['statusCode'], 200)
+        self.assertNotIn('data', body)
+        self.assertIn("test_exports_bucket", body['url'])
+        self.assertNotIn('ETag', response['headers'])
+
+        objects = self.s3_client.list_objects_v2(Bucket=os.environ["SPORTS_EXPORTS_BUCKET"])['Contents']
+        self.assertEqual(len(objects), 1)
+
+        exported = self.s3_client.get_object(Bucket=os.environ["SPORTS_EXPORTS_BUCKET"], Key=objects[0]['Key'])['Body'].read().decode("utf-8")
+        self.assertEqual(len(exported.splitlines()), body['row_count'] + 1)
+
+sys.path.remove(new_path)
@@ -14,6 +14,8 @@ new_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'GetAll
 sys.path.append(new_path)
 
 from GetAllCountriesAchievements.lambda_handler import lambda_handler
+from common.dataset import get_dataset
+from common.medal_facts import EVENT_MEDAL_COLUMNS
 
 @mock_aws
 class TestGetAllCountriesAchievementsLambda(BaseTestSetup):
@@ -86,6 +88,14 @@ class TestGetAllCountriesAchievementsLambda(BaseTestSetup):
                 },
                 "expected_validation_message": "data.max_year must match pattern"
             },
+            {
+                "request_query": {
+                    "page": "1",
+                    "limit": "1",
+                    "as_of_year": "test"
+                },
+                "expected_validation_message": "data.as_of_year must match pattern"
+            },
             {
                 "request_query": {
                     "page": "1",
@@ -101,6 +111,21 @@ class TestGetAllCountriesAchievementsLambda(BaseTestSetup):
                     "additional_field": 1
                 },
                 "expected_validation_message": "data must not contain {'additional_field'} properties"
+            },
+            {
+                "request_query": {
+                    "limit": "1",
+                    "cursor": "not a cursor"
+                },
+                "expected_validation_message": "data.cursor must match pattern"
+            },
+            {
+                "request_query": {
+                    "page": "1",
+                    "limit": "1",
+                    "counting": "teams"
+                },
+                "expected_validation_message": "data.counting must be one of"
             }
         ]
 
@@ -190,6 +215,178 @@ class TestGetAllCountriesAchievementsLambda(BaseTestSetup):
         self.assertEqual(response['statusCode'], 400)
         self.assertEqual(body['message'], "min_year should be less than max_year.")
 
+    def test_as_of_year_combined_with_year_range(self):
+        """
+        Test response when as_of_year is sent together with min_year or max_year.
+        """
+
+        # Arrange
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        event = {
+            'headers': {
+                'Authorization': jwt_token
+            },
+            "queryStringParameters": {
+                "page": "1",
+                "limit": "1",
+                "min_year": "2000",
+                "as_of_year": "2020"
+            }
+        }
+
+        # Act
+        response = lambda_handler(event, {})
+        body = json.loads(response['body'])
+
+        # Assert
+        self.assertEqual(response['statusCode'], 400)
+        self.assertEqual(body['message'], "as_of_year can't be combined with min_year or max_year.")
+
+    def test_success_as_of_year(self):
+        """
+        Test that the cumulative leaderboard as of a year equals the leaderboard of all years up to it.
+        """
+
+        # Arrange
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        as_of_event = {
+            'headers': {
+                'Authorization': jwt_token
+            },
+            "queryStringParameters": {
+                "page": "1",
+                "limit": "20",
+                "as_of_year": "1960"
+            }
+        }
+        year_range_event = {
+            'headers': {
+                'Authorization': jwt_token
+            },
+            "queryStringParameters": {
+                "page": "1",
+                "limit": "20",
+                "max_year": "1960"
+            }
+        }
+
+        # Act
+        as_of_response = lambda_handler(as_of_event, {})
+        year_range_response = lambda_handler(year_range_event, {})
+
+        as_of_body = json.loads(as_of_response['body'])
+        year_range_body = json.loads(year_range_response['body'])
+
+        # Assert
+        self.assertEqual(as_of_response['statusCode'], 200)
+        self.assertEqual(as_of_body['total_records_found'], year_range_body['total_records_found'])
+        self.assertEqual(as_of_body['items'], year_range_body['items'])
+
+    def test_invalid_cursor(self):
+        """
+        Test response when cursor is malformed or combined with page.
+        """
+
+        test_cases = [
+            {
+                "request_query": {
+                    "limit": "20",
+                    "cursor": "bm90LWEtY3Vyc29y"
+                },
+                "expected_message": "Invalid cursor."
+            },
+            {
+                "request_query": {
+                    "page": "1",
+                    "limit": "20",
+                    "cursor": "bm90LWEtY3Vyc29y"
+                },
+                "expected_message": "cursor can't be combined with page."
+            }
+        ]
+
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        for case in test_cases:
+            with self.subTest(request_query=case["request_query"], expected_message=case["expected_message"]):
+                # Arrange
+                event = {
+                    'headers': {
+                        'Authorization': jwt_token
+                    },
+                    "queryStringParameters": case["request_query"]
+                }
+
+                # Act
+                response = lambda_handler(event, {})
+                body = json.loads(response['body'])
+
+                # Assert
+                self.assertEqual(response['statusCode'], 400)
+                self.assertEqual(body['message'], case["expected_message"])
+
+    def test_success_cursor(self):
+        """
+        Test that following next_cursor returns the same items as the next page.
+        """
+
+        # Arrange
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        def build_event(query_params):
+            return {
+                'headers': {
+                    'Authorization': jwt_token
+                },
+                "queryStringParameters": query_params
+            }
+
+        first_page_response = lambda_handler(build_event({"page": "1", "limit": "5", "min_year": "1950"}), {})
+        next_cursor = json.loads(first_page_response['body'])['next_cursor']
+
+        # Act
+        cursor_response = lambda_handler(build_event({"limit": "5", "cursor": next_cursor, "min_year": "1950"}), {})
+        second_page_response = lambda_handler(build_event({"page": "2", "limit": "5", "min_year": "1950"}), {})
+
+        cursor_body = json.loads(cursor_response['body'])
+        second_page_body = json.loads(second_page_response['body'])
+
+        # Assert
+        self.assertIsNotNone(next_cursor)
+        self.assertEqual(cursor_response['statusCode'], 200)
+        self.assertEqual(cursor_body['page'], 2)
+        self.assertEqual(cursor_body['items'], second_page_body['items'])
+        self.assertEqual(cursor_body['next_cursor'], second_page_body['next_cursor'])
+
+    def test_cursor_with_different_filters(self):
+        """
+        Test response when cursor is used with filters different from the ones it was created with.
+        """
+
+        # Arrange
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        def build_event(query_params):
+            return {
+                'headers': {
+                    'Authorization': jwt_token
+                },
+                "queryStringParameters": query_params
+            }
+
+        first_page_response = lambda_handler(build_event({"page": "1", "limit": "5"}), {})
+        next_cursor = json.loads(first_page_response['body'])['next_cursor']
+
+        # Act
+        response = lambda_handler(build_event({"limit": "5", "cursor": next_cursor, "min_year": "1960"}), {})
+        body = json.loads(response['body'])
+
+        # Assert
+        self.assertEqual(response['statusCode'], 400)
+        self.assertEqual(body['message'], "Cursor doesn't match the request filters.")
+
     def test_success(self):
         """
         Test response when successfully get all countries with medals.
@@ -222,4 +419,76 @@ class TestGetAllCountriesAchievementsLambda(BaseTestSetup):
         self.assertIn("total_records_found", body)
         self.assertIn("items", body)
 
-sys.path.remove(new_path)
\ No newline at end of file
+    def test_success_counting_events(self):
+        """
+        Test that counting events gives the official medal table, one medal per team and event.
+        """
+
+        # Arrange
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        event = {
+            'headers': {
+                'Authorization': jwt_token
+            },
+            "queryStringParameters": {
+                "page": "1",
+                "limit": "10",
+                "counting": "events"
+            }
+        }
+
+        dataset = get_dataset()
+        event_medals = dataset[dataset['Medal'] != 'No medal'].drop_duplicates(EVENT_MEDAL_COLUMNS)
+        expected = event_medals.groupby('Team', observed=True)['Medal'].value_counts().unstack(fill_value=0)
+
+        # Act
+        response = lambda_handler(event, {})
+        body = json.loads(response['body'])
+
+        # Assert
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(body['total_records_found'], len(expected))
+        self.assertEqual(body['item_count'], 10)
+
+        for item in body['items']:
+            self.assertEqual(item['gold'], expected.loc[item['country']].get('Gold', 0))
+            self.assertEqual(item['silver'], expected.loc[item['country']].get('Silver', 0))
+            self.assertEqual(item['bronze'], expected.loc[item['country']].get('Bronze', 0))
+
+    def test_not_modified(self):
+        """
+        Test that the ETag ignores the order of the sports and a matching If-None-Match gets a 304.
+        """
+
+        # Arrange
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        def conditional_event(list_of_sports, if_none_match=None):
+            return {
+                'headers': {
+                    'Authorization': jwt_token,
+                    **({'if-none-match': if_none_match} if if_none_match else {})
+                },
+                "queryStringParameters": {
+                    "page": "1",
+                    "limit": "10",
+                    "list_of_sports": list_of_sports
+                }
+            }
+
+        response = lambda_handler(conditional_event("Judo,Boxing"), {})
+        etag = response['headers']['ETag']
+
+        # Act
+        not_modified = lambda_handler(conditional_event("Boxing,Judo", etag), {})
+        other_sports = lambda_handler(conditional_event("Boxing", etag), {})
+
+        # Assert
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(not_modified['statusCode'], 304)
+        self.assertEqual(not_modified['body'], "")
+        self.assertEqual(other_sports['statusCode'], 200)
+        self.assertNotEqual(other_sports['headers']['ETag'], etag)
+
+sys.path.remove(new_path)
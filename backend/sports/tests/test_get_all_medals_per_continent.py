@@ -0,0 +1,157 @@
+from base_test_setups import BaseTestSetup
+from moto import mock_aws
+
+import json
+import jwt
+
+import sys
+import os
+
+if 'validation_schema' in sys.modules:
+    del sys.modules['validation_schema']
+
+new_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'GetAllMedalsPerContinent'))
+sys.path.append(new_path)
+
+from GetAllMedalsPerContinent.lambda_handler import lambda_handler
+from common.continents import (
+    CONTINENTS,
+    get_continent,
+    get_continent_codes
+)
+from common.dataset import get_dataset
+from common.medal_facts import EVENT_MEDAL_COLUMNS
+
+@mock_aws
+class TestGetAllMedalsPerContinentLambda(BaseTestSetup):
+    def setUp(self):
+        super().setUp()
+
+    def test_when_user_unauthorized(self):
+        """
+        Test response when user is unauthorized.
+        """
+        
+        # Arrange
+        event = {
+            'headers': {}
+        }
+
+        # Act
+        response = lambda_handler(event, {})
+        body = json.loads(response['body'])
+        
+        # Assert
+        self.assertEqual(response['statusCode'], 401)
+        self.assertEqual(body['message'], "Invalid token, please login again")
+
+    def test_min_year_greater_than_max_year(self):
+        """
+        Test response when min_year is greater than max_year.
+        """
+
+        # Arrange
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        event = {
+            'headers': {
+                'Authorization': jwt_token
+            },
+            "queryStringParameters": {
+                "min_year": "2021",
+                "max_year": "2020"
+            }
+        }
+
+        # Act
+        response = lambda_handler(event, {})
+        body = json.loads(response['body'])
+        
+        # Assert
+        self.assertEqual(response['statusCode'], 400)
+        self.assertEqual(body['message'], "min_year should be less than max_year.")
+
+    def test_compound_team_continent(self):
+        """
+        Test that compound teams resolve to the continent of their first known part.
+        """
+
+        # Assert
+        self.assertEqual(get_continent("Denmark/Sweden"), "europe")
+        self.assertEqual(get_continent("Vesper Boat Club/Canada"), "north_america")
+        self.assertIsNone(get_continent("Vesper Boat Club"))
+
+    def test_success(self):
+        """
+        Test response when successfully get medal count per continents.
+        """
+
+        # Arrange
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+        
+        event = {
+            'headers': {
+                'Authorization': jwt_token
+            },
+            "queryStringParameters": {
+                "min_year": "1800",
+                "max_year": "9999"
+            }
+        }
+
+        dataset = get_dataset()
+        continent_per_row = dataset['Team'].astype(str).map(get_continent)
+
+        # Act
+        response = lambda_handler(event, {})
+        body = json.loads(response['body'])
+        
+        # Assert
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(body['message'], "Retrieved medal count per continents")
+
+        for item in body['data']:
+            self.assertIn(item['continent'], CONTINENTS)
+            self.assertEqual(item['total'], int((continent_per_row == item['continent']).sum()))
+
+        self.assertEqual(int(continent_per_row.isna().sum()), int((get_continent_codes().codes == -1).sum()))
+
+    def test_success_counting_events(self):
+        """
+        Test response when counting event medals, the members of a team share one medal.
+        """
+
+        # Arrange
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        event = {
+            'headers': {
+                'Authorization': jwt_token
+            },
+            "queryStringParameters": {
+                "min_year": "1950",
+                "max_year": "2000",
+                "counting": "events"
+            }
+        }
+
+        dataset = get_dataset()
+        event_medals = dataset[
+            (dataset['Year'] >= 1950) &
+            (dataset['Year'] <= 2000) &
+            (dataset['Medal'] != 'No medal')
+        ].drop_duplicates(EVENT_MEDAL_COLUMNS)
+        continent_per_medal = event_medals['Team'].astype(str).map(get_continent)
+
+        # Act
+        response = lambda_handler(event, {})
+        body = json.loads(response['body'])
+
+        # Assert
+        self.assertEqual(response['statusCode'], 200)
+        self.assertGreater(len(body['data']), 0)
+
+        for item in body['data']:
+            self.assertEqual(item['total'], int((continent_per_medal == item['continent']).sum()))
+
+sys.path.remove(new_path)
\ No newline at end of file
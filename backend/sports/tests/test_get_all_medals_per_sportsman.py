@@ -0,0 +1,133 @@
+from base_test_setups import BaseTestSetup
+from moto import mock_aws
+
+import json
+import jwt
+
+import sys
+import os
+
+import numpy as np
+
+if 'validation_schema' in sys.modules:
+    del sys.modules['validation_schema']
+
+new_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'GetAllMedalsPerSportsman'))
+sys.path.append(new_path)
+
+from GetAllMedalsPerSportsman.lambda_handler import lambda_handler
+from common.athlete_rankings import top_k_athletes
+from common.dataset import get_dataset
+
+@mock_aws
+class TestGetAllMedalsPerSportsmanLambda(BaseTestSetup):
+    def setUp(self):
+        super().setUp()
+
+    def test_when_user_unauthorized(self):
+        """
+        Test response when user is unauthorized.
+        """
+        
+        # Arrange
+        event = {
+            'headers': {}
+        }
+
+        # Act
+        response = lambda_handler(event, {})
+        body = json.loads(response['body'])
+        
+        # Assert
+        self.assertEqual(response['statusCode'], 401)
+        self.assertEqual(body['message'], "Invalid token, please login again")
+
+    def test_limit_out_of_range(self):
+        """
+        Test response when limit is not between 1 and 100.
+        """
+
+        # Arrange
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        event = {
+            'headers': {
+                'Authorization': jwt_token
+            },
+            "queryStringParameters": {
+                "limit": "0"
+            }
+        }
+
+        # Act
+        response = lambda_handler(event, {})
+        body = json.loads(response['body'])
+        
+        # Assert
+        self.assertEqual(response['statusCode'], 400)
+        self.assertEqual(body['message'], "limit should be between 1 and 100.")
+
+    def test_top_k_athletes(self):
+        """
+        Test that partial selection returns the best athletes, ties in alphabetical order and no athletes without rows.
+        """
+
+        # Arrange
+        counts = np.array([
+            [0, 0, 0, 0],
+            [1, 0, 0, 2],
+            [2, 0, 0, 0],
+            [1, 0, 0, 2],
+            [0, 3, 0, 0]
+        ])
+
+        # Act
+        top_codes = top_k_athletes(counts, 10)
+
+        # Assert
+        self.assertEqual(top_codes.tolist(), [2, 1, 3, 4])
+        self.assertEqual(top_k_athletes(counts, 2).tolist(), [2, 1])
+
+    def test_success(self):
+        """
+        Test response when successfully get medals per sportsmen.
+        """
+
+        # Arrange
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+        
+        event = {
+            'headers': {
+                'Authorization': jwt_token
+            },
+            "queryStringParameters": {
+                "min_year": "1990",
+                "max_year": "2010",
+                "limit": "10"
+            }
+        }
+
+        # Act
+        response = lambda_handler(event, {})
+        body = json.loads(response['body'])
+        
+        # Assert
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(body['message'], "List of medals per sportsmen returned successfully")
+        self.assertLessEqual(len(body['data']), 10)
+
+        ranking_keys = [(item['gold'], item['silver'], item['bronze'], item['appearances']) for item in body['data']]
+        self.assertEqual(ranking_keys, sorted(ranking_keys, reverse=True))
+
+        dataset = get_dataset()
+        rows = dataset[(dataset['Year'] >= 1990) & (dataset['Year'] <= 2010)]
+        medals_per_player = rows.groupby('player_id')['Medal'].value_counts().unstack(fill_value=0)
+
+        for item in body['data']:
+            self.assertEqual(item['appearances'], item['gold'] + item['silver'] + item['bronze'] + item['no_medal'])
+
+            # Counted per player id, sportsmen sharing a name are not merged
+            self.assertEqual(item['gold'], medals_per_player.loc[item['player_id']].get('Gold', 0))
+            self.assertEqual(item['appearances'], medals_per_player.loc[item['player_id']].sum())
+
+sys.path.remove(new_path)
@@ -0,0 +1,132 @@
+from base_test_setups import BaseTestSetup
+from moto import mock_aws
+
+import json
+import jwt
+from unittest.mock import patch
+
+import sys
+import os
+
+if 'validation_schema' in sys.modules:
+    del sys.modules['validation_schema']
+
+new_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'GetAllMedalsPerYear'))
+sys.path.append(new_path)
+
+from GetAllMedalsPerYear.lambda_handler import lambda_handler
+from common.dataset import get_dataset
+from common.medal_facts import EVENT_MEDAL_COLUMNS
+
+@mock_aws
+class TestGetAllMedalsPerYearLambda(BaseTestSetup):
+    def setUp(self):
+        super().setUp()
+
+    def get_response(self, query_params):
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        event = {
+            'headers': {
+                'Authorization': jwt_token
+            },
+            "queryStringParameters": query_params
+        }
+
+        response = lambda_handler(event, {})
+
+        return response, json.loads(response['body'])
+
+    def test_when_user_unauthorized(self):
+        """
+        Test response when user is unauthorized.
+        """
+
+        # Arrange
+        event = {
+            'headers': {}
+        }
+
+        # Act
+        response = lambda_handler(event, {})
+        body = json.loads(response['body'])
+
+        # Assert
+        self.assertEqual(response['statusCode'], 401)
+        self.assertEqual(body['message'], "Invalid token, please login again")
+
+    def test_invalid_counting(self):
+        """
+        Test response when the counting mode doesn't exist.
+        """
+
+        # Act
+        response, body = self.get_response({"counting": "teams"})
+
+        # Assert
+        self.assertEqual(response['statusCode'], 400)
+
+    def test_success(self):
+        """
+        Test response when successfully get medals per year, counting athletes and events.
+        """
+
+        # Arrange
+        dataset = get_dataset()
+        medals = dataset[dataset['Medal'] != 'No medal']
+        event_medals = medals.drop_duplicates(EVENT_MEDAL_COLUMNS)
+
+        for query_params, expected_rows in [(None, medals), ({"counting": "events"}, event_medals)]:
+            with self.subTest(query_params=query_params):
+                # Act
+                response, body = self.get_response(query_params)
+
+                # Assert
+                self.assertEqual(response['statusCode'], 200)
+                self.assertEqual(body['message'], "List of medals per year returned successfully")
+                self.assertEqual([item['year'] for item in body['data']], sorted(dataset['Year'].unique().tolist()))
+
+                expected_totals = expected_rows['Year'].value_counts()
+                for item in body['data']:
+                    self.assertEqual(item['total'], int(expected_totals.get(item['year'], 0)))
+
+    def test_not_modified(self):
+        """
+        Test that a matching If-None-Match gets a 304 without counting the medals again.
+        """
+
+        # Arrange
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        def conditional_event(if_none_match, counting="athletes"):
+            return {
+                'headers': {
+                    'Authorization': jwt_token,
+                    'If-None-Match': if_none_match
+                },
+                "queryStringParameters": {"counting": counting}
+            }
+
+        response, _ = self.get_response({"counting": "athletes"})
+        etag = response['headers']['ETag']
+
+        # Act
+        with patch("GetAllMedalsPerYear.lambda_handler.get_medals_per_year") as get_medals_per_year:
+            not_modified = lambda_handler(conditional_event(etag), {})
+            weak_not_modified = lambda_handler(conditional_event(f'"other", W/{etag}'), {})
+
+        other_counting = lambda_handler(conditional_event(etag, "events"), {})
+
+        # Assert
+        self.assertEqual(response['headers']['Cache-Control'], "private, no-cache")
+
+        self.assertEqual(not_modified['statusCode'], 304)
+        self.assertEqual(not_modified['body'], "")
+        self.assertEqual(not_modified['headers']['ETag'], etag)
+        self.assertEqual(weak_not_modified['statusCode'], 304)
+        get_medals_per_year.assert_not_called()
+
+        self.assertEqual(other_counting['statusCode'], 200)
+        self.assertNotEqual(other_counting['headers']['ETag'], etag)
+
+sys.path.remove(new_path)
@@ -3,6 +3,8 @@ from moto import mock_aws
 
 import json
 import jwt
+import base64
+import msgpack
 
 import sys
 import os
@@ -14,6 +16,7 @@ new_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'GetAll
 sys.path.append(new_path)
 
 from GetAllSportsAchievements.lambda_handler import lambda_handler
+from common.pagination import encode_cursor
 
 @mock_aws
 class TestGetAllSportsAchievementsLambda(BaseTestSetup):
@@ -78,6 +81,13 @@ class TestGetAllSportsAchievementsLambda(BaseTestSetup):
                 },
                 "expected_validation_message": "data must not contain {'additional_field'} properties"
             },
+            {
+                "request_query": {
+                    "limit": "1",
+                    "cursor": "not a cursor"
+                },
+                "expected_validation_message": "data.cursor must match pattern"
+            },
             {
                 "request_query": {
                     "page": "1",
@@ -174,6 +184,14 @@ class TestGetAllSportsAchievementsLambda(BaseTestSetup):
                 },
                 "expected_validation_message": "data.country must be longer than or equal to 1 characters"
             },
+            {
+                "request_query": {
+                    "page": "1",
+                    "limit": "1",
+                    "format": "arrow"
+                },
+                "expected_validation_message": "data.format must be one of"
+            },
         ]
 
         jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
@@ -234,6 +252,109 @@ class TestGetAllSportsAchievementsLambda(BaseTestSetup):
                 self.assertEqual(response['statusCode'], 400)
                 self.assertEqual(body['message'], "Page and limit should be greater than 0.")
 
+    def test_invalid_cursor(self):
+        """
+        Test response when cursor is malformed or combined with page.
+        """
+
+        test_cases = [
+            {
+                "request_query": {
+                    "limit": "20",
+                    "cursor": "bm90LWEtY3Vyc29y"
+                },
+                "expected_message": "Invalid cursor."
+            },
+            {
+                "request_query": {
+                    "page": "1",
+                    "limit": "20",
+                    "cursor": "bm90LWEtY3Vyc29y"
+                },
+                "expected_message": "cursor can't be combined with page."
+            }
+        ]
+
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        for case in test_cases:
+            with self.subTest(request_query=case["request_query"], expected_message=case["expected_message"]):
+                # Arrange
+                event = {
+                    'headers': {
+                        'Authorization': jwt_token
+                    },
+                    "queryStringParameters": case["request_query"]
+                }
+
+                # Act
+                response = lambda_handler(event, {})
+                body = json.loads(response['body'])
+
+                # Assert
+                self.assertEqual(response['statusCode'], 400)
+                self.assertEqual(body['message'], case["expected_message"])
+
+    def test_success_cursor(self):
+        """
+        Test that following next_cursor returns the same items as the next page.
+        """
+
+        # Arrange
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        def build_event(query_params):
+            return {
+                'headers': {
+                    'Authorization': jwt_token
+                },
+                "queryStringParameters": query_params
+            }
+
+        first_page_response = lambda_handler(build_event({"page": "1", "limit": "5", "sex": "F"}), {})
+        next_cursor = json.loads(first_page_response['body'])['next_cursor']
+
+        # Act
+        cursor_response = lambda_handler(build_event({"limit": "5", "cursor": next_cursor, "sex": "F"}), {})
+        second_page_response = lambda_handler(build_event({"page": "2", "limit": "5", "sex": "F"}), {})
+
+        cursor_body = json.loads(cursor_response['body'])
+        second_page_body = json.loads(second_page_response['body'])
+
+        # Assert
+        self.assertIsNotNone(next_cursor)
+        self.assertEqual(cursor_response['statusCode'], 200)
+        self.assertEqual(cursor_body['page'], 2)
+        self.assertEqual(cursor_body['items'], second_page_body['items'])
+        self.assertEqual(cursor_body['next_cursor'], second_page_body['next_cursor'])
+
+    def test_cursor_with_different_filters(self):
+        """
+        Test response when cursor is used with filters different from the ones it was created with.
+        """
+
+        # Arrange
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        def build_event(query_params):
+            return {
+                'headers': {
+                    'Authorization': jwt_token
+                },
+                "queryStringParameters": query_params
+            }
+
+        first_page_response = lambda_handler(build_event({"page": "1", "limit": "5"}), {})
+        next_cursor = json.loads(first_page_response['body'])['next_cursor']
+
+        # Act
+        response = lambda_handler(build_event({"limit": "5", "cursor": next_cursor, "sex": "M"}), {})
+        body = json.loads(response['body'])
+
+        # Assert
+        self.assertEqual(response['statusCode'], 400)
+        self.assertEqual(body['message'], "Cursor doesn't match the request filters.")
+
     def test_success(self):
         """
         Test response when successfully get all sportsmen details.
@@ -264,4 +385,145 @@ class TestGetAllSportsAchievementsLambda(BaseTestSetup):
         self.assertIn("total_records_found", body)
         self.assertIn("items", body)
 
-sys.path.remove(new_path)
\ No newline at end of file
+    def test_success_formats(self):
+        """
+        Test that the columnar and msgpack formats hold the items of the JSON format, one list per field.
+        """
+
+        # Arrange
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        def build_event(response_format=None):
+            query_params = {"page": "2", "limit": "7", "sport": "judo"}
+
+            if response_format is not None:
+                query_params["format"] = response_format
+
+            return {
+                'headers': {
+                    'Authorization': jwt_token
+                },
+                "queryStringParameters": query_params
+            }
+
+        # Act
+        json_response = lambda_handler(build_event(), {})
+        columnar_response = lambda_handler(build_event("columnar"), {})
+        msgpack_response = lambda_handler(build_event("msgpack"), {})
+
+        json_body = json.loads(json_response['body'])
+        columnar_body = json.loads(columnar_response['body'])
+        msgpack_body = msgpack.unpackb(base64.b64decode(msgpack_response['body']))
+
+        # Assert
+        expected_columns = {
+            field: [item[field] for item in json_body['items']]
+            for field in ['name', 'sex', 'sport', 'event', 'medal', 'team', 'year']
+        }
+
+        self.assertEqual(json_body['item_count'], 7)
+        self.assertEqual(columnar_response['statusCode'], 200)
+        self.assertEqual(columnar_body['items'], expected_columns)
+        self.assertEqual(columnar_body['next_cursor'], json_body['next_cursor'])
+
+        self.assertEqual(msgpack_response['statusCode'], 200)
+        self.assertTrue(msgpack_response['isBase64Encoded'])
+        self.assertEqual(msgpack_response['headers']['Content-Type'], "application/msgpack")
+        self.assertEqual(msgpack_body, columnar_body)
+
+        self.assertEqual(len({json_response['headers']['ETag'], columnar_response['headers']['ETag'], msgpack_response['headers']['ETag']}), 3)
+
+    def test_partial_last_page(self):
+        """
+        Test that the last page only holds the remaining rows, the same ones a cursor from the previous page returns.
+        """
+
+        # Arrange
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        def build_event(query_params):
+            return {
+                'headers': {
+                    'Authorization': jwt_token
+                },
+                "queryStringParameters": {"limit": "10", "sport": "judo", "sex": "F", **query_params}
+            }
+
+        total = json.loads(lambda_handler(build_event({"page": "1"}), {})['body'])['total_records_found']
+        last_page = (total + 9) // 10
+
+        # Act
+        previous_page_body = json.loads(lambda_handler(build_event({"page": str(last_page - 1)}), {})['body'])
+        last_page_body = json.loads(lambda_handler(build_event({"page": str(last_page)}), {})['body'])
+        cursor_body = json.loads(lambda_handler(build_event({"cursor": previous_page_body['next_cursor']}), {})['body'])
+
+        # Assert
+        self.assertNotEqual(total % 10, 0)
+        self.assertEqual(last_page_body['item_count'], total % 10)
+        self.assertEqual(last_page_body['items'], cursor_body['items'])
+        self.assertIsNone(last_page_body['next_cursor'])
+
+    def test_page_overrun(self):
+        """
+        Test that a page past the last one is empty instead of repeating the last rows.
+        """
+
+        # Arrange
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        event = {
+            'headers': {
+                'Authorization': jwt_token
+            },
+            "queryStringParameters": {"page": "100000", "limit": "10", "sport": "judo"}
+        }
+
+        # Act
+        response = lambda_handler(event, {})
+        body = json.loads(response['body'])
+
+        # Assert
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(body['page'], 100000)
+        self.assertGreater(body['total_records_found'], 0)
+        self.assertEqual(body['item_count'], 0)
+        self.assertEqual(body['items'], [])
+        self.assertIsNone(body['next_cursor'])
+
+    def test_cursor_of_previous_dataset(self):
+        """
+        Test that a cursor created for another version of the dataset is rejected.
+        """
+
+        # Arrange
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        filters = {
+            'medal': None,
+            'sportsman_name': None,
+            'sex': "F",
+            'sport': None,
+            'event': None,
+            'country': None
+        }
+
+        event = {
+            'headers': {
+                'Authorization': jwt_token
+            },
+            "queryStringParameters": {
+                "limit": "5",
+                "sex": "F",
+                "cursor": encode_cursor(filters, 4, 1, "previous dataset")
+            }
+        }
+
+        # Act
+        response = lambda_handler(event, {})
+        body = json.loads(response['body'])
+
+        # Assert
+        self.assertEqual(response['statusCode'], 400)
+        self.assertEqual(body['message'], "Cursor was created for a previous version of the dataset.")
+
+sys.path.remove(new_path)
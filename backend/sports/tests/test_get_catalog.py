@@ -0,0 +1,173 @@
+from base_test_setups import BaseTestSetup
+from moto import mock_aws
+
+import json
+import jwt
+
+import sys
+import os
+
+if 'validation_schema' in sys.modules:
+    del sys.modules['validation_schema']
+
+new_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'GetCatalog'))
+sys.path.append(new_path)
+
+from GetCatalog.lambda_handler import lambda_handler
+from common.dataset import get_dataset
+from common.medal_facts import get_medal_facts
+
+@mock_aws
+class TestGetCatalogLambda(BaseTestSetup):
+    def setUp(self):
+        super().setUp()
+
+    def get_response(self, query_params, headers=None):
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        event = {
+            'headers': {
+                'Authorization': jwt_token,
+                **(headers or {})
+            },
+            "queryStringParameters": query_params
+        }
+
+        return lambda_handler(event, {})
+
+    def test_when_user_unauthorized(self):
+        """
+        Test response when user is unauthorized.
+        """
+
+        # Arrange
+        event = {
+            'headers': {}
+        }
+
+        # Act
+        response = lambda_handler(event, {})
+        body = json.loads(response['body'])
+
+        # Assert
+        self.assertEqual(response['statusCode'], 401)
+        self.assertEqual(body['message'], "Invalid token, please login again")
+
+    def test_validation_schema(self):
+        """
+        Test response when validation schema is not satisfied.
+        """
+
+        test_cases = [
+            {},
+            {"catalog": "athletes"},
+            {"catalog": "sports", "limit": "ten"},
+            {"catalog": "sports", "limit": "0"},
+            {"catalog": "sports", "limit": "1001"},
+            {"catalog": "sports", "sort": "medals"}
+        ]
+
+        for query_params in test_cases:
+            with self.subTest(query_params=query_params):
+                # Act
+                response = self.get_response(query_params)
+
+                # Assert
+                self.assertEqual(response['statusCode'], 400)
+
+    def test_prefix_search(self):
+        """
+        Test that a prefix returns every value starting with it, ignoring case, with its row and medal counts.
+        """
+
+        # Arrange
+        dataset = get_dataset()
+        medal_rows = dataset.iloc[get_medal_facts().row_ids]
+
+        test_cases = [
+            ("sports", "Sport", "sw"),
+            ("events", "Event", "JUDO"),
+            ("teams", "Team", "united"),
+            ("cities", "City", ""),
+            ("sports", "Sport", "no sport starts with this")
+        ]
+
+        for catalog, column, prefix in test_cases:
+            with self.subTest(catalog=catalog, prefix=prefix):
+                values = dataset[column].astype(str)
+                expected = sorted(
+                    value for value in values.unique()
+                    if value.lower().startswith(prefix.lower())
+                )
+
+                # Act
+                response = self.get_response({"catalog": catalog, "prefix": prefix})
+                body = json.loads(response['body'])
+
+                # Assert
+                self.assertEqual(response['statusCode'], 200)
+                self.assertEqual(body['catalog'], catalog)
+                self.assertEqual(body['total_records_found'], len(expected))
+                self.assertEqual(sorted(item['value'] for item in body['items']), expected)
+
+                for item in body['items']:
+                    self.assertEqual(item['rows'], int((values == item['value']).sum()))
+                    self.assertEqual(item['medals'], int((medal_rows[column].astype(str) == item['value']).sum()))
+
+    def test_limit(self):
+        """
+        Test that limit keeps the first items in catalog order and the total counts all matches.
+        """
+
+        # Act
+        full = json.loads(self.get_response({"catalog": "teams"})['body'])
+        limited = json.loads(self.get_response({"catalog": "teams", "limit": "3"})['body'])
+
+        # Assert
+        self.assertEqual(limited['total_records_found'], full['total_records_found'])
+        self.assertEqual(limited['item_count'], 3)
+        self.assertEqual(limited['items'], full['items'][:3])
+
+    def test_etag_and_not_modified(self):
+        """
+        Test that a response carries a strong ETag and a matching If-None-Match returns 304 without a body.
+        """
+
+        # Arrange
+        query_params = {"catalog": "sports", "prefix": "b"}
+
+        # Act
+        response = self.get_response(query_params)
+        etag = response['headers']['ETag']
+
+        not_modified = self.get_response(query_params, {'if-none-match': etag})
+        stale = self.get_response(query_params, {'If-None-Match': '"stale"'})
+
+        # Assert
+        self.assertTrue(etag.startswith('"') and etag.endswith('"'))
+        self.assertEqual(response['headers']['Cache-Control'], "private, no-cache")
+
+        self.assertEqual(not_modified['statusCode'], 304)
+        self.assertEqual(not_modified['body'], "")
+        self.assertEqual(not_modified['headers']['ETag'], etag)
+
+        self.assertEqual(stale['statusCode'], 200)
+        self.assertEqual(stale['body'], response['body'])
+
+    def test_etag_follows_the_query(self):
+        """
+        Test that the ETag is stable for the same query and changes with the prefix or the limit.
+        """
+
+        # Act
+        etag = self.get_response({"catalog": "sports", "prefix": "b"})['headers']['ETag']
+        same = self.get_response({"catalog": "sports", "prefix": "B"})['headers']['ETag']
+        other_prefix = self.get_response({"catalog": "sports", "prefix": "ba"})['headers']['ETag']
+        other_limit = self.get_response({"catalog": "sports", "prefix": "b", "limit": "2"})['headers']['ETag']
+        other_catalog = self.get_response({"catalog": "teams", "prefix": "b"})['headers']['ETag']
+
+        # Assert
+        self.assertEqual(etag, same)
+        self.assertEqual(len({etag, other_prefix, other_limit, other_catalog}), 4)
+
+sys.path.remove(new_path)
@@ -0,0 +1,136 @@
+from base_test_setups import BaseTestSetup
+from moto import mock_aws
+
+import json
+import jwt
+
+import sys
+import os
+
+if 'validation_schema' in sys.modules:
+    del sys.modules['validation_schema']
+
+new_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'GetEventPodium'))
+sys.path.append(new_path)
+
+from GetEventPodium.lambda_handler import lambda_handler
+from common.dataset import get_dataset
+from common.podium_index import get_podium_index
+
+@mock_aws
+class TestGetEventPodiumLambda(BaseTestSetup):
+    def setUp(self):
+        super().setUp()
+
+    def get_response(self, query_params):
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        event = {
+            'headers': {
+                'Authorization': jwt_token
+            },
+            "queryStringParameters": query_params
+        }
+
+        response = lambda_handler(event, {})
+
+        return response, json.loads(response['body'])
+
+    def test_when_user_unauthorized(self):
+        """
+        Test response when user is unauthorized.
+        """
+
+        # Arrange
+        event = {
+            'headers': {}
+        }
+
+        # Act
+        response = lambda_handler(event, {})
+        body = json.loads(response['body'])
+
+        # Assert
+        self.assertEqual(response['statusCode'], 401)
+        self.assertEqual(body['message'], "Invalid token, please login again")
+
+    def test_validation_schema(self):
+        """
+        Test response when validation schema is not satisfied.
+        """
+
+        test_cases = [
+            {"year": "2016", "season": "Summer"},
+            {"event": "Judo Men's Extra-Lightweight", "year": "last", "season": "Summer"},
+            {"event": "", "year": "2016", "season": "Summer"},
+            {"event": "Judo Men's Extra-Lightweight", "year": "2016", "season": "Summer", "medal": "Gold"}
+        ]
+
+        for query_params in test_cases:
+            with self.subTest(query_params=query_params):
+                # Act
+                response, body = self.get_response(query_params)
+
+                # Assert
+                self.assertEqual(response['statusCode'], 400)
+
+    def test_event_not_held(self):
+        """
+        Test response when the event wasn't held in the given Games.
+        """
+
+        # Act
+        response, body = self.get_response({"event": "Judo Men's Extra-Lightweight", "year": "1801", "season": "Summer"})
+
+        # Assert
+        self.assertEqual(response['statusCode'], 404)
+        self.assertEqual(body['message'], "Podium not found.")
+
+    def test_success(self):
+        """
+        Test that the podium holds every medal row of the event grouped by medal and team, ignoring case of the names.
+        """
+
+        # Arrange
+        dataset = get_dataset()
+        medal_rows = dataset[dataset['Medal'] != 'No medal']
+        event_name, year, season = medal_rows[['Event', 'Year', 'Season']].iloc[len(medal_rows) // 2].tolist()
+        expected = medal_rows[
+            (medal_rows['Event'] == event_name) &
+            (medal_rows['Year'] == year) &
+            (medal_rows['Season'] == season)
+        ]
+
+        # Act
+        response, body = self.get_response({"event": event_name.upper(), "year": str(year), "season": season.lower()})
+        data = body['data']
+
+        # Assert
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(body['message'], "Podium returned successfully")
+        self.assertEqual((data['event'], data['year'], data['season']), (event_name, year, season))
+
+        medal_order = ['Gold', 'Silver', 'Bronze']
+        self.assertEqual([place['medal'] for place in data['podium']], sorted((place['medal'] for place in data['podium']), key=medal_order.index))
+        self.assertEqual(
+            sorted((place['medal'], place['team'], athlete['player_id']) for place in data['podium'] for athlete in place['athletes']),
+            sorted(zip(expected['Medal'].tolist(), expected['Team'].tolist(), expected['player_id'].tolist()))
+        )
+
+    def test_index_covers_every_event(self):
+        """
+        Test that the index has a range for every (Event, Year, Season) with medals and the ranges cover all the medal rows.
+        """
+
+        # Arrange
+        dataset = get_dataset()
+        medal_rows = dataset[dataset['Medal'] != 'No medal']
+
+        # Act
+        podium_index = get_podium_index()
+
+        # Assert
+        self.assertEqual(len(podium_index), len(medal_rows[['Event', 'Year', 'Season']].drop_duplicates()))
+        self.assertEqual(sum(end - start for start, end in podium_index.ranges.values()), len(medal_rows))
+
+sys.path.remove(new_path)
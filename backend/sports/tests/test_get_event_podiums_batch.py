@@ -0,0 +1,108 @@
+from base_test_setups import BaseTestSetup
+from moto import mock_aws
+
+import json
+import jwt
+
+import sys
+import os
+
+if 'validation_schema' in sys.modules:
+    del sys.modules['validation_schema']
+
+new_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'GetEventPodiumsBatch'))
+sys.path.append(new_path)
+
+from GetEventPodiumsBatch.lambda_handler import lambda_handler
+from common.dataset import get_dataset
+from common.podium_index import get_podium_index
+
+@mock_aws
+class TestGetEventPodiumsBatchLambda(BaseTestSetup):
+    def setUp(self):
+        super().setUp()
+
+    def get_response(self, body):
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        event = {
+            'headers': {
+                'Authorization': jwt_token
+            },
+            'body': body if isinstance(body, str) else json.dumps(body)
+        }
+
+        response = lambda_handler(event, {})
+
+        return response, json.loads(response['body'])
+
+    def test_when_user_unauthorized(self):
+        """
+        Test response when user is unauthorized.
+        """
+
+        # Arrange
+        event = {
+            'headers': {}
+        }
+
+        # Act
+        response = lambda_handler(event, {})
+        body = json.loads(response['body'])
+
+        # Assert
+        self.assertEqual(response['statusCode'], 401)
+        self.assertEqual(body['message'], "Invalid token, please login again")
+
+    def test_validation_schema(self):
+        """
+        Test response when the body is not valid JSON or doesn't satisfy the validation schema.
+        """
+
+        test_cases = [
+            "not json",
+            {},
+            {"events": []},
+            {"events": [{"event": "Judo Men's Extra-Lightweight", "year": "2016", "season": "Summer"}]},
+            {"events": [{"event": "Judo Men's Extra-Lightweight", "year": 2016}]},
+            {"events": [{"event": "Judo Men's Extra-Lightweight", "year": 2016, "season": "Summer"}] * 101}
+        ]
+
+        for body in test_cases:
+            with self.subTest(body=body):
+                # Act
+                response, response_body = self.get_response(body)
+
+                # Assert
+                self.assertEqual(response['statusCode'], 400)
+
+    def test_success(self):
+        """
+        Test that the podiums follow the order of the requested events and are null for events that weren't held.
+        """
+
+        # Arrange
+        dataset = get_dataset()
+        medal_rows = dataset[dataset['Medal'] != 'No medal']
+        events = medal_rows[['Event', 'Year', 'Season']].drop_duplicates().iloc[::50]
+        requested = [
+            {"event": event_name, "year": int(year), "season": season}
+            for event_name, year, season in events.itertuples(index=False)
+        ]
+        requested.insert(1, {"event": "Unknown event", "year": 2016, "season": "Summer"})
+
+        # Act
+        response, body = self.get_response({"events": requested})
+
+        # Assert
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(body['message'], "Podiums returned successfully")
+        self.assertEqual(len(body['data']), len(requested))
+        self.assertIsNone(body['data'][1])
+
+        podium_index = get_podium_index()
+        for item, podium in zip(requested, body['data']):
+            if item["event"] != "Unknown event":
+                self.assertEqual(podium, podium_index.podium(item["event"], item["year"], item["season"]))
+
+sys.path.remove(new_path)
@@ -0,0 +1,158 @@
+from base_test_setups import BaseTestSetup
+from moto import mock_aws
+
+import json
+import jwt
+
+import sys
+import os
+
+if 'validation_schema' in sys.modules:
+    del sys.modules['validation_schema']
+
+new_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'GetLeaderboardsBatch'))
+sys.path.append(new_path)
+
+from GetLeaderboardsBatch.lambda_handler import lambda_handler
+from common.dataset import get_dataset
+from common.result_cache import get_result_cache
+from common.leaderboards import (
+    get_medals_per_continent_data,
+    get_medals_per_sportsmen,
+    get_leaderboard_page
+)
+
+@mock_aws
+class TestGetLeaderboardsBatchLambda(BaseTestSetup):
+    def setUp(self):
+        super().setUp()
+
+        get_result_cache().clear()
+
+    def get_response(self, body):
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        event = {
+            'headers': {
+                'Authorization': jwt_token
+            },
+            'body': json.dumps(body)
+        }
+
+        response = lambda_handler(event, {})
+
+        return response, json.loads(response['body'])
+
+    def test_when_user_unauthorized(self):
+        """
+        Test response when user is unauthorized.
+        """
+
+        # Arrange
+        event = {
+            'headers': {}
+        }
+
+        # Act
+        response = lambda_handler(event, {})
+        body = json.loads(response['body'])
+
+        # Assert
+        self.assertEqual(response['statusCode'], 401)
+        self.assertEqual(body['message'], "Invalid token, please login again")
+
+    def test_validation_schema(self):
+        """
+        Test response when validation schema or the checks of a sub-query are not satisfied.
+        """
+
+        test_cases = [
+            {},
+            {"queries": []},
+            {"queries": [{"query": "medals_per_year"}] * 21},
+            {"queries": [{"query": "medals_per_country"}]},
+            {"queries": [{"query": "medals_per_year", "min_year": 2000}]},
+            {"queries": [{"query": "medals_per_continent", "min_year": "2000"}]},
+            {"queries": [{"query": "medals_per_sportsman", "limit": 101}]},
+            {"queries": [{"query": "countries_achievements", "limit": 10}]},
+            {"queries": [{"query": "countries_achievements", "page": 0, "limit": 10}]},
+            {"queries": [{"query": "medals_per_year"}, {"query": "medals_per_continent", "min_year": 2010, "max_year": 2000}]},
+            {"queries": [{"query": "countries_achievements", "page": 1, "limit": 10, "as_of_year": 2000, "min_year": 1990}]}
+        ]
+
+        for request_body in test_cases:
+            with self.subTest(request_body=request_body):
+                # Act
+                response, body = self.get_response(request_body)
+
+                # Assert
+                self.assertEqual(response['statusCode'], 400)
+
+    def test_success(self):
+        """
+        Test that every sub-query returns the data of its standalone query, in request order.
+        """
+
+        # Arrange
+        dataset = get_dataset()
+        medals = dataset[dataset['Medal'] != 'No medal'].groupby('Year', observed=True).size()
+
+        request_body = {
+            "queries": [
+                {"query": "countries_achievements", "page": 1, "limit": 5, "list_of_sports": ["Swimming", "Judo"]},
+                {"query": "medals_per_year"},
+                {"query": "medals_per_sportsman", "min_year": 1990, "max_year": 2010, "limit": 3},
+                {"query": "medals_per_continent", "min_year": 1990, "max_year": 2010, "counting": "events"},
+                {"query": "countries_achievements", "page": 2, "limit": 5, "as_of_year": 2000, "counting": "events"}
+            ]
+        }
+
+        # Act
+        response, body = self.get_response(request_body)
+        results = body['results']
+
+        # Assert
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(body['message'], "Leaderboards returned successfully")
+        self.assertEqual([result['query'] for result in results], [query['query'] for query in request_body['queries']])
+
+        self.assertEqual(results[0]['data'], get_leaderboard_page(1800, 9999, None, ["Swimming", "Judo"], 1, 5))
+        self.assertEqual({item['year']: item['total'] for item in results[1]['data'] if item['total'] > 0}, medals.to_dict())
+        self.assertEqual(results[2]['data'], get_medals_per_sportsmen(1990, 2010, [''], 3))
+        self.assertEqual(results[3]['data'], get_medals_per_continent_data(1990, 2010, "events"))
+        self.assertEqual(results[4]['data'], get_leaderboard_page(1800, 9999, 2000, [''], 2, 5, None, "events"))
+
+        for result in results:
+            self.assertFalse(result['cached'])
+            self.assertGreaterEqual(result['time_ms'], 0)
+
+        self.assertGreaterEqual(body['total_time_ms'], 0)
+
+    def test_shared_computations(self):
+        """
+        Test that sub-queries with the same filters share their counts and repeated sub-queries hit the result cache.
+        """
+
+        # Arrange
+        request_body = {
+            "queries": [
+                {"query": "countries_achievements", "page": 1, "limit": 3, "min_year": 1990},
+                {"query": "countries_achievements", "page": 2, "limit": 3, "min_year": 1990},
+                {"query": "medals_per_sportsman", "limit": 3},
+                {"query": "medals_per_sportsman", "limit": 3},
+                {"query": "countries_achievements", "page": 1, "limit": 6, "min_year": 1990}
+            ]
+        }
+
+        # Act
+        response, body = self.get_response(request_body)
+        results = body['results']
+
+        # Assert
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(body['shared_computations'], 2)
+        self.assertEqual([result['cached'] for result in results], [False, False, False, True, False])
+        self.assertEqual(results[0]['data']['items'] + results[1]['data']['items'], results[4]['data']['items'])
+        self.assertEqual(results[2]['data'], results[3]['data'])
+
+sys.path.remove(new_path)
@@ -0,0 +1,134 @@
+from base_test_setups import BaseTestSetup
+from moto import mock_aws
+
+import json
+import jwt
+
+import sys
+import os
+
+if 'validation_schema' in sys.modules:
+    del sys.modules['validation_schema']
+
+new_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'GetSportsmanProfile'))
+sys.path.append(new_path)
+
+from GetSportsmanProfile.lambda_handler import lambda_handler
+from common.athlete_careers import get_athlete_careers
+from common.dataset import get_dataset
+
+@mock_aws
+class TestGetSportsmanProfileLambda(BaseTestSetup):
+    def setUp(self):
+        super().setUp()
+
+    def get_response(self, query_params):
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        event = {
+            'headers': {
+                'Authorization': jwt_token
+            },
+            "queryStringParameters": query_params
+        }
+
+        response = lambda_handler(event, {})
+
+        return response, json.loads(response['body'])
+
+    def test_when_user_unauthorized(self):
+        """
+        Test response when user is unauthorized.
+        """
+
+        # Arrange
+        event = {
+            'headers': {}
+        }
+
+        # Act
+        response = lambda_handler(event, {})
+        body = json.loads(response['body'])
+
+        # Assert
+        self.assertEqual(response['statusCode'], 401)
+        self.assertEqual(body['message'], "Invalid token, please login again")
+
+    def test_validation_schema(self):
+        """
+        Test response when validation schema is not satisfied.
+        """
+
+        for query_params in [{}, {"player_id": "abc"}, {"player_id": "1", "name": "test"}]:
+            with self.subTest(query_params=query_params):
+                # Act
+                response, body = self.get_response(query_params)
+
+                # Assert
+                self.assertEqual(response['statusCode'], 400)
+
+    def test_unknown_player_id(self):
+        """
+        Test response when no sportsman has the player id.
+        """
+
+        # Act
+        response, body = self.get_response({"player_id": "999999999"})
+
+        # Assert
+        self.assertEqual(response['statusCode'], 404)
+        self.assertEqual(body['message'], "Sportsman not found.")
+
+    def test_success(self):
+        """
+        Test that the profile holds every row of the sportsman, grouped by Games in the order of the years.
+        """
+
+        # Arrange
+        dataset = get_dataset()
+        player_id = int(dataset['player_id'].value_counts().index[0])
+        career = dataset[dataset['player_id'] == player_id]
+
+        # Act
+        response, body = self.get_response({"player_id": str(player_id)})
+        data = body['data']
+
+        # Assert
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(body['message'], "Sportsman profile returned successfully")
+        self.assertEqual(data['player_id'], player_id)
+        self.assertEqual(data['name'], career['Name'].iloc[0])
+        self.assertEqual(data['appearances'], len(career))
+        self.assertEqual(data['gold'], int((career['Medal'] == 'Gold').sum()))
+        self.assertEqual(data['no_medal'], int((career['Medal'] == 'No medal').sum()))
+
+        games = [(games['year'], games['season']) for games in data['games']]
+        self.assertEqual(games, sorted(set(games)))
+        self.assertEqual(sum(len(games['events']) for games in data['games']), len(career))
+        self.assertEqual(
+            sorted((games['year'], event['event'], event['medal']) for games in data['games'] for event in games['events']),
+            sorted(zip(career['Year'].tolist(), career['Event'].tolist(), career['Medal'].tolist()))
+        )
+
+    def test_career_index(self):
+        """
+        Test that the career rows of every player id are exactly the rows of the dataset with that player id.
+        """
+
+        # Arrange
+        dataset = get_dataset()
+        athlete_careers = get_athlete_careers()
+        player_ids = dataset['player_id'].to_numpy()
+
+        # Act & Assert
+        self.assertEqual(len(athlete_careers), dataset['player_id'].nunique())
+        self.assertEqual(athlete_careers.offsets[-1], len(dataset))
+
+        for code in [0, len(athlete_careers) // 2, len(athlete_careers) - 1]:
+            rows = athlete_careers.career_rows(code)
+
+            self.assertTrue((player_ids[rows] == athlete_careers.player_ids[code]).all())
+            self.assertEqual(len(rows), int((player_ids == athlete_careers.player_ids[code]).sum()))
+            self.assertTrue((dataset['Year'].to_numpy()[rows][1:] >= dataset['Year'].to_numpy()[rows][:-1]).all())
+
+sys.path.remove(new_path)
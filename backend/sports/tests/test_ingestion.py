@@ -0,0 +1,137 @@
+import unittest
+import tempfile
+import shutil
+import json
+import os
+import numpy as np
+import pandas as pd
+
+from common.dataset import (
+    get_dataset,
+    load_dataset,
+    load_csv_dataset,
+    load_columnar_dataset,
+    read_artifact_manifest,
+    sort_dataset,
+    file_sha256,
+    write_columnar_dataset
+)
+from common.aggregates import DatasetAggregates
+from common.zone_maps import ZONE_MAP_COLUMNS
+from common.ingestion import (
+    DeltaValidationError,
+    ingest_delta
+)
+
+class TestIngestion(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.temp_dir, "dataset.csv")
+        self.delta_path = os.path.join(self.temp_dir, "delta.csv")
+        self.full_csv_path = os.path.join(self.temp_dir, "full.csv")
+        self.artifact_path = os.path.join(self.temp_dir, "dataset_columnar")
+
+        dataset = get_dataset()
+        delta = dataset.iloc[1000:1300].astype({'Name': str, 'Team': str, 'Medal': str})
+
+        # Values that are not in the base dictionaries and don't sort after the existing ones
+        delta.iloc[0, delta.columns.get_loc('Name')] = "Aaron New Athlete"
+        delta.iloc[0, delta.columns.get_loc('Team')] = "Aaa New Team"
+        delta.iloc[0, delta.columns.get_loc('Year')] = 2028
+        delta.iloc[0, delta.columns.get_loc('Medal')] = "Gold"
+
+        dataset.head(1000).to_csv(self.csv_path, index=False)
+        delta.to_csv(self.delta_path, index=False)
+        pd.concat([dataset.head(1000).astype(str), delta.astype(str)]).to_csv(self.full_csv_path, index=False)
+
+        write_columnar_dataset(load_csv_dataset(self.csv_path), self.artifact_path, file_sha256(self.csv_path))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_ingested_artifact_matches_full_csv(self):
+        """
+        Test that the artifact with an ingested delta holds the same data and aggregates as the CSV of all the rows.
+        """
+
+        # Arrange
+        full_dataset = load_csv_dataset(self.full_csv_path)
+        expected_aggregates = DatasetAggregates.from_dataset(full_dataset)
+
+        # Act
+        manifest = ingest_delta(self.delta_path, self.artifact_path)
+        dataset, source, version, aggregates, zone_maps = load_dataset(self.csv_path, self.artifact_path)
+
+        # Assert
+        self.assertEqual(source, "columnar")
+        self.assertEqual(version, 2)
+        self.assertEqual(len(manifest['segments']), 2)
+
+        # Ingested rows are appended after the existing segments, sorting them again gives the order of the full CSV
+        pd.testing.assert_frame_equal(sort_dataset(dataset), full_dataset)
+
+        np.testing.assert_array_equal(aggregates.years, expected_aggregates.years)
+        np.testing.assert_array_equal(aggregates.year_counts, expected_aggregates.year_counts)
+        np.testing.assert_array_equal(aggregates.team_counts, expected_aggregates.team_counts)
+        np.testing.assert_array_equal(aggregates.athlete_counts, expected_aggregates.athlete_counts)
+
+        # Zone maps of the appended segment are converted to the codes of the sorted dictionaries
+        for column in ZONE_MAP_COLUMNS:
+            codes = dataset[column].cat.codes.to_numpy() if hasattr(dataset[column], 'cat') else dataset[column].to_numpy()
+
+            for group, (start, end) in enumerate(zip(zone_maps.offsets[:-1], zone_maps.offsets[1:])):
+                self.assertEqual(codes[start:end].min(), zone_maps.minimums[column][group])
+                self.assertEqual(codes[start:end].max(), zone_maps.maximums[column][group])
+
+    def test_previous_version_is_unchanged(self):
+        """
+        Test that the manifest of the previous version still reads the rows it had before the ingestion.
+        """
+
+        # Arrange
+        ingest_delta(self.delta_path, self.artifact_path)
+
+        with open(os.path.join(self.artifact_path, "manifests", "v000001.json"), "r") as f:
+            previous_manifest = json.load(f)
+
+        # Act
+        dataset, aggregates, _ = load_columnar_dataset(self.artifact_path, previous_manifest)
+
+        # Assert
+        pd.testing.assert_frame_equal(dataset, load_csv_dataset(self.csv_path))
+        self.assertNotIn(2028, aggregates.years)
+
+    def test_invalid_delta(self):
+        """
+        Test that a delta not matching the schema is rejected with the failing lines and nothing is published.
+        """
+
+        # Arrange
+        delta = pd.read_csv(self.delta_path, dtype=str, keep_default_na=False)
+        delta.loc[0, 'Sex'] = "X"
+        delta.loc[2, 'Year'] = "twenty"
+        delta.to_csv(self.delta_path, index=False)
+
+        # Act
+        with self.assertRaises(DeltaValidationError) as context:
+            ingest_delta(self.delta_path, self.artifact_path)
+
+        # Assert
+        self.assertEqual(len(context.exception.errors), 2)
+        self.assertIn("line 2: Sex must be one of ['M', 'F']", context.exception.errors[0])
+        self.assertIn("line 4: Year must be a non negative integer", context.exception.errors[1])
+        self.assertEqual(read_artifact_manifest(self.artifact_path)['version'], 1)
+
+    def test_delta_is_ingested_once(self):
+        """
+        Test that the same delta can't be appended twice.
+        """
+
+        # Arrange
+        ingest_delta(self.delta_path, self.artifact_path)
+
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            ingest_delta(self.delta_path, self.artifact_path)
+
+        self.assertEqual(read_artifact_manifest(self.artifact_path)['rows'], 1300)
@@ -0,0 +1,67 @@
+import unittest
+import numpy as np
+
+from common.dataset import get_dataset
+from common.inverted_index import (
+    get_inverted_index,
+    intersect_sorted
+)
+
+class TestInvertedIndex(unittest.TestCase):
+    def test_filter_rows_matches_column_scan(self):
+        """
+        Test that intersecting posting lists returns the same rows as comparing whole columns.
+        """
+
+        # Arrange
+        dataset = get_dataset()
+        first_row = dataset.iloc[0]
+        filters = {
+            'Sport': first_row['Sport'].upper(),
+            'Sex': first_row['Sex'],
+            'Team': first_row['Team'].lower()
+        }
+        expected = np.flatnonzero(
+            (dataset['Sport'].str.lower() == first_row['Sport'].lower()) &
+            (dataset['Sex'] == first_row['Sex']) &
+            (dataset['Team'].str.lower() == first_row['Team'].lower())
+        )
+
+        # Act
+        rows = get_inverted_index().filter_rows(filters)
+
+        # Assert
+        np.testing.assert_array_equal(rows, expected)
+
+    def test_filter_rows_without_filters(self):
+        """
+        Test that no filters means no row selection.
+        """
+
+        # Act
+        rows = get_inverted_index().filter_rows({'Medal': None, 'Name': None})
+
+        # Assert
+        self.assertIsNone(rows)
+
+    def test_filter_rows_unknown_value(self):
+        """
+        Test that an unknown value matches no rows.
+        """
+
+        # Act
+        rows = get_inverted_index().filter_rows({'Team': 'Not existing team', 'Sex': 'M'})
+
+        # Assert
+        self.assertEqual(len(rows), 0)
+
+    def test_intersect_sorted(self):
+        """
+        Test intersection of sorted row id arrays.
+        """
+
+        # Act
+        result = intersect_sorted(np.array([1, 4, 7, 20]), np.array([0, 1, 2, 7, 8, 19]))
+
+        # Assert
+        np.testing.assert_array_equal(result, [1, 7])
@@ -0,0 +1,63 @@
+import unittest
+
+from common.dataset import get_dataset
+from common.medal_cube import (
+    get_medal_cube,
+    get_event_medal_cube,
+    sorted_leaderboard
+)
+from common.medal_facts import EVENT_MEDAL_COLUMNS
+
+class TestMedalCube(unittest.TestCase):
+    def test_leaderboard_matches_row_counts(self):
+        """
+        Test that the leaderboard from the cube equals counting the medal rows of the dataset.
+        """
+
+        # Arrange
+        dataset = get_dataset()
+        sports = dataset['Sport'].cat.categories[:3].tolist()
+        filtered = dataset[
+            (dataset['Year'] >= 1950) &
+            (dataset['Year'] <= 2010) &
+            (dataset['Sport'].isin(sports)) &
+            (dataset['Medal'] != 'No medal')
+        ]
+        expected = filtered.groupby('Team', observed=True)['Medal'].value_counts().unstack(fill_value=0)
+
+        # Act
+        medal_cube = get_medal_cube()
+        leaderboard = sorted_leaderboard(medal_cube.teams, medal_cube.team_medals(1950, 2010, medal_cube.sport_codes(sports)))
+
+        # Assert
+        self.assertEqual(len(leaderboard), len(expected))
+        for item in leaderboard:
+            self.assertEqual(item['gold'], expected.loc[item['country']].get('Gold', 0))
+            self.assertEqual(item['silver'], expected.loc[item['country']].get('Silver', 0))
+            self.assertEqual(item['bronze'], expected.loc[item['country']].get('Bronze', 0))
+
+        ranking = [(-item['gold'], -item['silver'], -item['bronze']) for item in leaderboard]
+        self.assertEqual(ranking, sorted(ranking))
+
+    def test_event_leaderboard_counts_team_medals_once(self):
+        """
+        Test that the event leaderboard equals counting the distinct (Year, Season, Event, Team, Medal) medals.
+        """
+
+        # Arrange
+        dataset = get_dataset()
+        medals = dataset[dataset['Medal'] != 'No medal'].drop_duplicates(EVENT_MEDAL_COLUMNS)
+        expected = medals.groupby('Team', observed=True)['Medal'].value_counts().unstack(fill_value=0)
+
+        # Act
+        medal_cube = get_event_medal_cube()
+        leaderboard = sorted_leaderboard(medal_cube.teams, medal_cube.team_medals(1800, 9999))
+
+        # Assert
+        self.assertEqual(len(leaderboard), len(expected))
+        for item in leaderboard:
+            self.assertEqual(item['gold'], expected.loc[item['country']].get('Gold', 0))
+            self.assertEqual(item['silver'], expected.loc[item['country']].get('Silver', 0))
+            self.assertEqual(item['bronze'], expected.loc[item['country']].get('Bronze', 0))
+
+        self.assertLess(sum(item['gold'] for item in leaderboard), int((dataset['Medal'] == 'Gold').sum()))
@@ -0,0 +1,83 @@
+import unittest
+import numpy as np
+
+from common.dataset import get_dataset
+from common.aggregates import (
+    MEDAL_COLUMNS,
+    count_medals
+)
+from common.medal_facts import get_medal_facts
+from common.athlete_careers import get_athlete_careers
+from common.athlete_rankings import (
+    get_athlete_medal_counts,
+    get_athlete_appearances
+)
+
+class TestMedalFacts(unittest.TestCase):
+    def setUp(self):
+        self.dataset = get_dataset()
+        self.medal_facts = get_medal_facts()
+
+    def test_facts_are_the_medal_rows(self):
+        """
+        Test that the facts hold every gold, silver and bronze row once, sorted by year.
+        """
+
+        # Arrange
+        medal_rows = np.flatnonzero(self.dataset['Medal'].isin(MEDAL_COLUMNS[:3]).to_numpy())
+
+        # Assert
+        self.assertEqual(len(self.medal_facts), len(medal_rows))
+        np.testing.assert_array_equal(np.sort(self.medal_facts.row_ids), medal_rows)
+        self.assertTrue((np.diff(self.medal_facts.years) >= 0).all())
+        np.testing.assert_array_equal(
+            get_athlete_careers().player_ids[self.medal_facts.player_codes],
+            self.dataset['player_id'].to_numpy()[self.medal_facts.row_ids]
+        )
+
+    def test_year_slice(self):
+        """
+        Test that the year slice holds exactly the facts of the inclusive year range.
+        """
+
+        # Act
+        year_slice = self.medal_facts.year_slice(1960, 1980)
+
+        # Assert
+        self.assertEqual(
+            year_slice.stop - year_slice.start,
+            int(((self.medal_facts.years >= 1960) & (self.medal_facts.years <= 1980)).sum())
+        )
+        self.assertTrue((self.medal_facts.years[year_slice] >= 1960).all())
+        self.assertTrue((self.medal_facts.years[year_slice] <= 1980).all())
+        self.assertEqual(self.medal_facts.year_slice(3000, 3010).stop - self.medal_facts.year_slice(3000, 3010).start, 0)
+
+    def test_athlete_counts_match_row_counts(self):
+        """
+        Test that medals from the facts and appearances from the participation counter give the counts of all the rows.
+        """
+
+        # Arrange
+        athlete_medal_counts = get_athlete_medal_counts()
+        years = self.dataset['Year'].to_numpy()
+        sports = self.dataset['Sport'].cat.codes.to_numpy()
+        players = get_athlete_careers().row_codes
+        medal_index = np.array([MEDAL_COLUMNS.index(medal) if medal in MEDAL_COLUMNS else 3 for medal in self.dataset['Medal'].cat.categories])[self.dataset['Medal'].cat.codes.to_numpy()]
+        sport_codes = athlete_medal_counts.sport_codes(['Judo', 'Swimming'])
+
+        for min_year, max_year, codes in [(2000, 2024, None), (1900, 1950, sport_codes)]:
+            with self.subTest(min_year=min_year, max_year=max_year):
+                mask = (years >= min_year) & (years <= max_year)
+
+                if codes is not None:
+                    mask &= np.isin(sports, codes)
+
+                expected_counts = count_medals(players[mask], medal_index[mask], len(athlete_medal_counts.player_ids))
+
+                # Act
+                counts = athlete_medal_counts.filtered_counts(min_year, max_year, codes)
+                appearances = get_athlete_appearances().appearances(min_year, max_year, codes)
+
+                # Assert
+                np.testing.assert_array_equal(counts, expected_counts)
+                np.testing.assert_array_equal(appearances, expected_counts.sum(axis=1))
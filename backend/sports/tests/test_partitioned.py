@@ -0,0 +1,77 @@
+import unittest
+import numpy as np
+
+from common.aggregates import (
+    MEDAL_COLUMNS,
+    count_medals
+)
+from common.partitioned import (
+    PartitionedCounter,
+    year_partitions
+)
+
+class TestPartitioned(unittest.TestCase):
+    def setUp(self):
+        random = np.random.default_rng(7)
+
+        self.years = random.choice(np.arange(1896, 2028, 4), size=20000)
+        self.columns = {
+            'team': random.integers(0, 50, size=20000).astype(np.int32),
+            'sport': random.integers(0, 10, size=20000).astype(np.int16),
+            'medal': random.integers(0, len(MEDAL_COLUMNS), size=20000).astype(np.int8)
+        }
+
+    def test_partitions_are_cut_between_years(self):
+        """
+        Test that partitions cover all the rows and that every year is in exactly one partition.
+        """
+
+        # Arrange
+        year_index = np.sort(np.unique(self.years, return_inverse=True)[1])
+
+        # Act
+        partitions = year_partitions(year_index, 8)
+
+        # Assert
+        self.assertEqual(partitions[0].start, 0)
+        self.assertEqual(partitions[-1].end, len(year_index))
+
+        for previous, partition in zip(partitions, partitions[1:]):
+            self.assertEqual(previous.end, partition.start)
+            self.assertEqual(previous.last_year_index + 1, partition.first_year_index)
+
+        for partition in partitions:
+            self.assertEqual(year_index[partition.start], partition.first_year_index)
+            self.assertEqual(year_index[partition.end - 1], partition.last_year_index)
+
+    def test_partitioned_counts_match_single_process_counts(self):
+        """
+        Test that merged partial counts of the workers equal counts of all the rows at once.
+        """
+
+        # Arrange
+        counter = PartitionedCounter(self.years, self.columns, workers=2)
+        self.addCleanup(counter.close)
+
+        test_cases = [
+            (None, None, None),
+            (1950, 1990, None),
+            (1950, 1990, np.array([1, 4])),
+            (None, 1900, np.array([], dtype=np.int64)),
+            (2030, 2040, None)
+        ]
+
+        for min_year, max_year, sport_codes in test_cases:
+            with self.subTest(min_year=min_year, max_year=max_year, sport_codes=sport_codes):
+                mask = (self.years >= (min_year or 0)) & (self.years <= (max_year or 9999))
+
+                if sport_codes is not None:
+                    mask &= np.isin(self.columns['sport'], sport_codes)
+
+                expected_counts = count_medals(self.columns['team'][mask], self.columns['medal'][mask], 50)
+
+                # Act
+                counts = counter.count('team', 50, min_year, max_year, sport_codes)
+
+                # Assert
+                np.testing.assert_array_equal(counts, expected_counts)
@@ -0,0 +1,186 @@
+from base_test_setups import BaseTestSetup
+from moto import mock_aws
+from unittest.mock import patch
+
+import importlib
+import json
+import jwt
+
+import sys
+import os
+
+from common.query_engine import (
+    QUERY_ENGINES,
+    QueryEngine,
+    get_query_engine
+)
+from common.medal_cube import (
+    get_medal_cube,
+    sorted_leaderboard
+)
+from common.result_cache import get_result_cache
+
+def import_lambda_handler(directory):
+    if 'validation_schema' in sys.modules:
+        del sys.modules['validation_schema']
+
+    new_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', directory))
+    sys.path.append(new_path)
+
+    try:
+        return importlib.import_module(f"{directory}.lambda_handler").lambda_handler
+    finally:
+        sys.path.remove(new_path)
+
+# Query params of the requests that every engine has to answer the same way
+PARITY_REQUESTS = {
+    'GetAllMedalsPerYear': [
+        {},
+        {"counting": "events"}
+    ],
+    'GetAllMedalsPerContinent': [
+        {"min_year": "1800", "max_year": "9999"},
+        {"min_year": "1950", "max_year": "1990"},
+        {"min_year": "1950", "max_year": "1990", "counting": "events"}
+    ],
+    'GetAllMedalsPerSportsman': [
+        {},
+        {"min_year": "1800", "max_year": "9999", "limit": "20"},
+        {"min_year": "1900", "max_year": "2000", "list_of_sports": "Judo,Boxing,Unknown sport", "limit": "10"}
+    ],
+    'GetAllCountriesAchievements': [
+        {"page": "1", "limit": "50"},
+        {"page": "2", "limit": "10", "min_year": "1950", "max_year": "1990", "list_of_sports": "Swimming,Athletics"},
+        {"page": "1", "limit": "10", "as_of_year": "1960"},
+        {"page": "1", "limit": "10", "list_of_sports": "Unknown sport"},
+        {"page": "1", "limit": "50", "counting": "events"},
+        {"page": "1", "limit": "10", "as_of_year": "1960", "list_of_sports": "Basketball,Judo", "counting": "events"}
+    ],
+    'GetAllSportsAchievements': [
+        {"page": "1", "limit": "20", "medal": "gold", "sex": "F"},
+        {"page": "3", "limit": "20", "country": "united states", "sport": "Swimming"},
+        {"page": "1", "limit": "20", "sportsman_name": "Unknown sportsman"}
+    ],
+    'ExportSportsAchievements': [
+        {"medal": "Silver", "sport": "Judo", "format": "csv"},
+        {"country": "Norway", "sex": "F"}
+    ]
+}
+
+@mock_aws
+class TestQueryEngineParity(BaseTestSetup):
+    def setUp(self):
+        super().setUp()
+
+        self.lambda_handlers = {directory: import_lambda_handler(directory) for directory in PARITY_REQUESTS}
+
+    def get_body(self, directory, query_params, engine):
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        event = {
+            'headers': {
+                'Authorization': jwt_token
+            },
+            "queryStringParameters": query_params
+        }
+
+        # Results are cached per query, not per engine
+        get_result_cache().clear()
+
+        with patch("common.query_engine.QUERY_ENGINE", engine):
+            response = self.lambda_handlers[directory](event, {})
+
+        self.assertEqual(response['statusCode'], 200, response['body'])
+
+        return json.loads(response['body'])
+
+    def test_handlers_return_same_results_on_every_engine(self):
+        """
+        Test that every handler returns identical responses on all the query engines.
+        """
+
+        for directory, requests in PARITY_REQUESTS.items():
+            for query_params in requests:
+                with self.subTest(handler=directory, query_params=query_params):
+                    # Act
+                    bodies = {engine: self.get_body(directory, query_params, engine) for engine in QUERY_ENGINES}
+
+                    # Assert
+                    for engine, body in bodies.items():
+                        self.assertEqual(body, bodies['numpy'], engine)
+
+    def test_cursor_walk_is_same_on_every_engine(self):
+        """
+        Test that following next_cursor visits the same pages on all the query engines.
+        """
+
+        for engine in QUERY_ENGINES:
+            with self.subTest(engine=engine):
+                # Arrange
+                query_params = {"limit": "40", "min_year": "1950", "max_year": "2000"}
+                countries = []
+
+                # Act
+                body = self.get_body('GetAllCountriesAchievements', {**query_params, "page": "1"}, engine)
+                countries.extend(body['items'])
+
+                while body['next_cursor'] is not None:
+                    body = self.get_body('GetAllCountriesAchievements', {**query_params, "cursor": body['next_cursor']}, engine)
+                    countries.extend(body['items'])
+
+                # Assert
+                self.assertEqual(len(countries), body['total_records_found'])
+                self.assertEqual(countries, self.get_body('GetAllCountriesAchievements', {**query_params, "page": "1", "limit": "1000"}, 'numpy')['items'])
+
+    def test_all_time_leaderboard_reads_stored_team_counts(self):
+        """
+        Test that the leaderboard of all sports and years is read from the stored team counts and matches the medal cube.
+        """
+
+        # Arrange
+        medal_cube = get_medal_cube()
+        expected = sorted_leaderboard(medal_cube.teams, medal_cube.team_medals(1800, 9999))
+
+        for engine in QUERY_ENGINES:
+            with self.subTest(engine=engine):
+                query_engine = get_query_engine(engine)
+
+                # Act
+                # Medal cube, partitioned counter and SQL query are the paths that count the rows again
+                with patch("common.query_engine.get_medal_cube") as get_cube, \
+                        patch.object(query_engine, "counter", create=True) as counter, \
+                        patch.object(query_engine, "query_team_medals", create=True) as query_team_medals:
+                    teams, team_medals = query_engine.team_medals(1800, 9999)
+                    as_of_teams, as_of_team_medals = query_engine.team_medals_as_of(9999)
+
+                # Assert
+                self.assertEqual(sorted_leaderboard(teams, team_medals), expected)
+                self.assertEqual(sorted_leaderboard(as_of_teams, as_of_team_medals), expected)
+                get_cube.assert_not_called()
+                counter.count.assert_not_called()
+                query_team_medals.assert_not_called()
+
+    def test_unknown_engine(self):
+        """
+        Test that an engine that doesn't exist is rejected.
+        """
+
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            get_query_engine("unknown")
+
+    def test_partial_engine_can_not_be_built(self):
+        """
+        Test that an engine missing a query fails when it is built, not at request time.
+        """
+
+        # Arrange
+        class PartialQueryEngine(QueryEngine):
+            name = "partial"
+
+            def medals_per_year(self, counting="athletes"):
+                return [], []
+
+        # Act & Assert
+        with self.assertRaises(TypeError):
+            PartialQueryEngine()
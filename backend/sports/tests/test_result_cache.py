@@ -0,0 +1,112 @@
+import unittest
+
+from common.result_cache import (
+    ResultCache,
+    canonical_query_key,
+    query_etag
+)
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestResultCache(unittest.TestCase):
+    def test_least_recently_used_entry_is_evicted(self):
+        """
+        Test that the least recently used entry is evicted when the cache is full.
+        """
+
+        # Arrange
+        result_cache = ResultCache(max_entries=2, max_bytes=1024, ttl_seconds=60)
+        result_cache.put("a", [1])
+        result_cache.put("b", [2])
+
+        # Act
+        result_cache.get("a")
+        result_cache.put("c", [3])
+
+        # Assert
+        self.assertEqual(result_cache.get("a"), (True, [1]))
+        self.assertEqual(result_cache.get("b"), (False, None))
+        self.assertEqual(result_cache.get("c"), (True, [3]))
+        self.assertEqual(result_cache.get_stats()["evictions"], 1)
+
+    def test_expired_entry_is_recomputed(self):
+        """
+        Test that an entry older than the TTL is computed again.
+        """
+
+        # Arrange
+        clock = FakeClock()
+        result_cache = ResultCache(max_entries=10, max_bytes=1024, ttl_seconds=60, clock=clock)
+        computed = []
+
+        def compute():
+            computed.append(clock.now)
+            return {"total": len(computed)}
+
+        # Act
+        first = result_cache.get_or_compute("key", compute)
+        clock.now = 30
+        cached = result_cache.get_or_compute("key", compute)
+        clock.now = 61
+        recomputed = result_cache.get_or_compute("key", compute)
+
+        # Assert
+        self.assertEqual(first, {"total": 1})
+        self.assertEqual(cached, {"total": 1})
+        self.assertEqual(recomputed, {"total": 2})
+        self.assertEqual(result_cache.get_stats()["expirations"], 1)
+        self.assertEqual(result_cache.get_stats()["hit_ratio"], round(1 / 3, 4))
+
+    def test_bytes_held_stay_under_limit(self):
+        """
+        Test that entries are evicted to keep the bytes held under the limit and oversized results are not cached.
+        """
+
+        # Arrange
+        result_cache = ResultCache(max_entries=10, max_bytes=20, ttl_seconds=60)
+
+        # Act
+        result_cache.put("a", "x" * 9)
+        result_cache.put("b", "y" * 9)
+        result_cache.put("too_big", "z" * 30)
+
+        # Assert
+        self.assertEqual(result_cache.get_stats()["bytes_held"], 11)
+        self.assertEqual(result_cache.get("a"), (False, None))
+        self.assertEqual(result_cache.get("too_big"), (False, None))
+
+    def test_canonical_query_key(self):
+        """
+        Test that the order of sports doesn't change the cache key.
+        """
+
+        # Act
+        first_key = canonical_query_key("endpoint", {'min_year': 2000, 'list_of_sports': ['Judo', 'Boxing']})
+        second_key = canonical_query_key("endpoint", {'list_of_sports': ['Boxing', 'Judo'], 'min_year': 2000})
+        other_key = canonical_query_key("endpoint", {'list_of_sports': ['Boxing'], 'min_year': 2000})
+
+        # Assert
+        self.assertEqual(first_key, second_key)
+        self.assertNotEqual(first_key, other_key)
+
+    def test_query_etag(self):
+        """
+        Test that the ETag is a quoted strong validator that only changes with the query.
+        """
+
+        # Act
+        etag = query_etag("endpoint", {'min_year': 2000, 'list_of_sports': ['Judo', 'Boxing']})
+        same_etag = query_etag("endpoint", {'list_of_sports': ['Boxing', 'Judo'], 'min_year': 2000})
+        other_params_etag = query_etag("endpoint", {'list_of_sports': ['Boxing'], 'min_year': 2000})
+        other_endpoint_etag = query_etag("other_endpoint", {'min_year': 2000, 'list_of_sports': ['Judo', 'Boxing']})
+
+        # Assert
+        self.assertRegex(etag, r'^"[0-9a-f]{32}"$')
+        self.assertEqual(etag, same_etag)
+        self.assertNotEqual(etag, other_params_etag)
+        self.assertNotEqual(etag, other_endpoint_etag)
@@ -0,0 +1,177 @@
+from base_test_setups import BaseTestSetup
+from moto import mock_aws
+
+import json
+import jwt
+
+import sys
+import os
+
+if 'validation_schema' in sys.modules:
+    del sys.modules['validation_schema']
+
+new_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'SearchSportsmen'))
+sys.path.append(new_path)
+
+from SearchSportsmen.lambda_handler import lambda_handler
+from common.dataset import get_dataset
+from common.name_search import (
+    normalize_name,
+    name_trigrams
+)
+
+@mock_aws
+class TestSearchSportsmenLambda(BaseTestSetup):
+    def setUp(self):
+        super().setUp()
+
+    def test_when_user_unauthorized(self):
+        """
+        Test response when user is unauthorized.
+        """
+        
+        # Arrange
+        event = {
+            'headers': {}
+        }
+
+        # Act
+        response = lambda_handler(event, {})
+        body = json.loads(response['body'])
+        
+        # Assert
+        self.assertEqual(response['statusCode'], 401)
+        self.assertEqual(body['message'], "Invalid token, please login again")
+
+    def test_validation_schema(self):
+        """
+        Test response when validation schema is not satisfied.
+        """
+
+        test_cases = [
+            {
+                "request_query": {
+                    "limit": "1"
+                },
+                "expected_validation_message": "data must contain ['query'] properties"
+            },
+            {
+                "request_query": {
+                    "query": ""
+                },
+                "expected_validation_message": "data.query must be longer than or equal to 1 characters"
+            },
+            {
+                "request_query": {
+                    "query": "ana",
+                    "limit": "test"
+                },
+                "expected_validation_message": "data.limit must match pattern"
+            },
+            {
+                "request_query": {
+                    "query": "ana",
+                    "limit": "100"
+                },
+                "expected_validation_message": "limit should be between 1 and 50."
+            }
+        ]
+
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+        
+        for case in test_cases:
+            with self.subTest(request_query=case["request_query"], expected_validation_message=case["expected_validation_message"]):
+                # Arrange
+                event = {
+                    'headers': {
+                        'Authorization': jwt_token
+                    },
+                    "queryStringParameters": case["request_query"]
+                }
+
+                # Act
+                response = lambda_handler(event, {})
+                body = json.loads(response['body'])
+                
+                self.assertEqual(response['statusCode'], 400)
+                self.assertIn(case["expected_validation_message"], body['message'])
+
+    def test_normalize_name(self):
+        """
+        Test that names are searched without case, accents and repeated whitespace.
+        """
+
+        # Assert
+        self.assertEqual(normalize_name("  Nikola   KARABATIĆ "), "nikola karabatic")
+        self.assertEqual(name_trigrams("ivo"), {"  i", " iv", "ivo", "vo "})
+
+    def test_success_typo(self):
+        """
+        Test that a name with a typo finds the original name and its player ids.
+        """
+
+        # Arrange
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        dataset = get_dataset()
+        name = dataset['Name'].iloc[0]
+        typo = name[:-1] if len(name) > 4 else name
+
+        event = {
+            'headers': {
+                'Authorization': jwt_token
+            },
+            "queryStringParameters": {
+                "query": typo.upper(),
+                "limit": "50"
+            }
+        }
+
+        # Act
+        response = lambda_handler(event, {})
+        body = json.loads(response['body'])
+        
+        # Assert
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(body['message'], "List of matching sportsmen returned successfully")
+
+        matches = {item['name']: item for item in body['data']}
+        self.assertIn(name, matches)
+        self.assertEqual(
+            matches[name]['player_ids'],
+            sorted(dataset.loc[dataset['Name'] == name, 'player_id'].unique().tolist())
+        )
+
+    def test_success_prefix(self):
+        """
+        Test that names starting with the query are returned before the fuzzy matches.
+        """
+
+        # Arrange
+        jwt_token = jwt.encode({"email": "test@mail.com", "role": 1}, "value", algorithm="HS256")
+
+        prefix = normalize_name(get_dataset()['Name'].iloc[0])[:3]
+
+        event = {
+            'headers': {
+                'Authorization': jwt_token
+            },
+            "queryStringParameters": {
+                "query": prefix
+            }
+        }
+
+        # Act
+        response = lambda_handler(event, {})
+        body = json.loads(response['body'])
+        
+        # Assert
+        self.assertEqual(response['statusCode'], 200)
+        self.assertGreater(len(body['data']), 0)
+        self.assertLessEqual(len(body['data']), 10)
+        self.assertTrue(normalize_name(body['data'][0]['name']).startswith(prefix))
+
+        scores = [item['score'] for item in body['data']]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+sys.path.remove(new_path)
@@ -0,0 +1,98 @@
+import unittest
+import tempfile
+import shutil
+import os
+import numpy as np
+
+from common.dataset import (
+    get_dataset,
+    load_dataset,
+    load_csv_dataset,
+    file_sha256,
+    write_columnar_dataset
+)
+from common.zone_maps import (
+    ZONE_MAP_COLUMNS,
+    ZoneMaps
+)
+
+def column_values(dataset, column):
+    return dataset[column].cat.codes.to_numpy() if hasattr(dataset[column], 'cat') else dataset[column].to_numpy()
+
+class TestZoneMaps(unittest.TestCase):
+    def setUp(self):
+        self.dataset = get_dataset()
+        self.zone_maps = ZoneMaps.from_dataset(self.dataset)
+
+    def test_zone_maps_hold_values_of_their_rows(self):
+        """
+        Test that every row is inside the min/max of its row group.
+        """
+
+        for column in ZONE_MAP_COLUMNS:
+            values = column_values(self.dataset, column)
+
+            for group, (start, end) in enumerate(zip(self.zone_maps.offsets[:-1], self.zone_maps.offsets[1:])):
+                # Assert
+                self.assertEqual(values[start:end].min(), self.zone_maps.minimums[column][group])
+                self.assertEqual(values[start:end].max(), self.zone_maps.maximums[column][group])
+
+    def test_row_ranges_skip_row_groups(self):
+        """
+        Test that row ranges hold all the matching rows and that a narrow year range reads only a part of the rows.
+        """
+
+        # Arrange
+        years = self.dataset['Year'].to_numpy()
+        sport_codes = self.dataset['Sport'].cat.categories.get_indexer(['Judo', 'Swimming'])
+        sports = self.dataset['Sport'].cat.codes.to_numpy()
+
+        test_cases = [
+            (2000, 2024, None),
+            (1900, 1950, sport_codes),
+            (3000, 3010, None)
+        ]
+
+        for min_year, max_year, codes in test_cases:
+            with self.subTest(min_year=min_year, max_year=max_year):
+                matching = (years >= min_year) & (years <= max_year)
+
+                if codes is not None:
+                    matching &= np.isin(sports, codes)
+
+                # Act
+                row_ranges = self.zone_maps.row_ranges(min_year, max_year, codes)
+
+                # Assert
+                read_rows = np.zeros(len(years), dtype=bool)
+                for start, end in row_ranges:
+                    read_rows[start:end] = True
+
+                self.assertFalse((matching & ~read_rows).any())
+                self.assertLess(read_rows.sum(), len(years))
+
+    def test_artifact_zone_maps_match_dataset(self):
+        """
+        Test that zone maps stored in the columnar artifact are the ones of the loaded dataset.
+        """
+
+        # Arrange
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+
+        csv_path = os.path.join(temp_dir, "dataset.csv")
+        artifact_path = os.path.join(temp_dir, "dataset_columnar")
+
+        self.dataset.sample(30000, random_state=3).to_csv(csv_path, index=False)
+        write_columnar_dataset(load_csv_dataset(csv_path), artifact_path, file_sha256(csv_path))
+
+        # Act
+        dataset, _, _, _, zone_maps = load_dataset(csv_path, artifact_path)
+        expected_zone_maps = ZoneMaps.from_dataset(dataset)
+
+        # Assert
+        np.testing.assert_array_equal(zone_maps.offsets, expected_zone_maps.offsets)
+
+        for column in ZONE_MAP_COLUMNS:
+            np.testing.assert_array_equal(zone_maps.minimums[column], expected_zone_maps.minimums[column])
+            np.testing.assert_array_equal(zone_maps.maximums[column], expected_zone_maps.maximums[column])